@@ -8,10 +8,14 @@ Descripción: Modelo de usuario con roles, validaciones y manejo de errores
 """
 
 import re
+import sys
 import logging
+import threading
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Tuple, Dict, List
+from typing import Optional, Tuple, Dict, List, Iterable
+
+from administrador.contrasenas import hash_password, verificar_hash, necesita_rehash
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +35,104 @@ class RolUsuario(Enum):
     INVITADO = "invitado"
 
 
+# ==================== REGISTRO DE PERMISOS ====================
+# Cada permiso ocupa un bit y cada rol se guarda como la máscara de sus
+# permisos, calculada una sola vez al registrarlo. Cada usuario combina la
+# máscara de su rol con la de sus permisos personalizados cuando alguno de
+# los dos cambia, así que tiene_permiso() se reduce a un AND de enteros.
+
+# Máscara del rol administrador: todos los bits, incluidos los de permisos
+# que se registren después
+TODOS_LOS_PERMISOS = -1
+
+_bits_permisos: Dict[str, int] = {}
+_mascaras_roles: Dict[str, int] = {}
+# Cambia cada vez que se registra un rol, para que los usuarios recalculen
+# su máscara en la siguiente verificación
+_version_roles = 0
+_lock_permisos = threading.Lock()
+
+
+def registrar_permiso(permiso: str) -> int:
+    """
+    Registra un permiso y retorna su bit (el mismo si ya existía)
+    
+    Args:
+        permiso (str): Nombre del permiso, p. ej. 'ver_reportes'
+        
+    Returns:
+        int: Máscara con el único bit del permiso
+    """
+    bit = _bits_permisos.get(permiso)
+    if bit is not None:
+        return bit
+    with _lock_permisos:
+        bit = _bits_permisos.get(permiso)
+        if bit is None:
+            bit = 1 << len(_bits_permisos)
+            _bits_permisos[sys.intern(permiso)] = bit
+        return bit
+
+
+def mascara_permisos(permisos: Iterable[str]) -> int:
+    """Combina varios permisos en una máscara, registrándolos si hace falta"""
+    mascara = 0
+    for permiso in permisos:
+        mascara |= registrar_permiso(permiso)
+    return mascara
+
+
+def permisos_de_mascara(mascara: int) -> List[str]:
+    """Nombres de los permisos registrados incluidos en una máscara"""
+    return [permiso for permiso, bit in _bits_permisos.items() if mascara & bit]
+
+
+def registrar_rol(rol: str, permisos: Iterable[str] = (), hereda: Optional[str] = None) -> int:
+    """
+    Registra (o redefine) un rol con sus permisos
+    
+    Args:
+        rol (str): Nombre del rol
+        permisos (iterable): Permisos propios del rol
+        hereda (str, optional): Rol ya registrado cuyos permisos se copian
+            (redefinir ese rol después no cambia este)
+        
+    Returns:
+        int: Máscara de permisos del rol
+        
+    Raises:
+        AdministradorException: Si el rol heredado no está registrado
+    """
+    global _version_roles
+    mascara = mascara_permisos(permisos)
+    if hereda is not None:
+        if hereda.lower() not in _mascaras_roles:
+            raise AdministradorException(f"El rol heredado '{hereda}' no está registrado")
+        mascara |= _mascaras_roles[hereda.lower()]
+    
+    with _lock_permisos:
+        _mascaras_roles[sys.intern(rol.lower())] = mascara
+        _version_roles += 1
+    return mascara
+
+
+def mascara_rol(rol: str) -> int:
+    """Máscara de permisos de un rol (0 si no está registrado)"""
+    return _mascaras_roles.get(rol.lower(), 0) if rol else 0
+
+
+def roles_registrados() -> List[str]:
+    """Nombres de los roles registrados"""
+    return list(_mascaras_roles)
+
+
+registrar_rol(RolUsuario.INVITADO.value)
+registrar_rol(RolUsuario.VENDEDOR.value, ['ver_productos', 'ver_clientes', 'crear_pedidos'])
+registrar_rol(RolUsuario.SUPERVISOR.value, ['ver_reportes', 'gestionar_productos'],
+              hereda=RolUsuario.VENDEDOR.value)
+_mascaras_roles[RolUsuario.ADMINISTRADOR.value] = TODOS_LOS_PERMISOS
+
+
 class Administrador:
     """
     Clase Administrador - Representa un usuario del sistema con permisos
@@ -39,12 +141,17 @@ class Administrador:
         id_admin (int): Identificador único
         nombre (str): Nombre completo del usuario
         usuario (str): Nombre de usuario único para login
-        password (str): Contraseña del usuario
-        rol (str): Rol del usuario en el sistema
+        password (str): Solo escritura: guarda el hash de la contraseña y el
+            resultado de validarla; leerlo lanza AttributeError (el texto
+            plano no se conserva)
+        password_hash (str): Hash con sal de la contraseña (ver contrasenas.py)
+        rol (str): Rol del usuario en el sistema (al cambiarlo se recalcula
+            la máscara de permisos)
         activo (bool): Estado del usuario
         fecha_creacion (datetime): Fecha de creación de la cuenta
         ultimo_acceso (datetime): Último inicio de sesión
         intentos_fallidos (int): Contador de intentos de login fallidos
+        permisos_personalizados (list): Permisos extra además de los del rol
     """
     
     # Configuración de seguridad
@@ -70,18 +177,51 @@ class Administrador:
             self.id_admin = id_admin
             self.nombre = nombre.strip() if nombre else ""
             self.usuario = usuario.strip().lower() if usuario else ""
-            self.password = password if password else ""
-            self.rol = rol.lower() if rol else "vendedor"
+            self.password = password
+            self._mascara_personal = 0
+            self.rol = rol if rol else "vendedor"
             self.activo = True
             self.fecha_creacion = datetime.now()
             self.ultimo_acceso = None
             self.intentos_fallidos = 0
-            self.permisos_personalizados = []
             
         except Exception as e:
             logger.error(f"Error al crear Administrador: {e}")
             raise AdministradorException(f"No se pudo crear el administrador: {str(e)}")
     
+    # ==================== ROL Y PERMISOS ====================
+    
+    @property
+    def rol(self) -> str:
+        return self._rol
+    
+    @rol.setter
+    def rol(self, valor: str):
+        self._rol = valor.lower() if valor else ""
+        self._actualizar_mascara()
+    
+    @property
+    def password(self) -> str:
+        """La contraseña en texto plano no se conserva; usar verificar_password()"""
+        raise AttributeError("password es de solo escritura; usar password_hash o verificar_password()")
+    
+    @password.setter
+    def password(self, valor: str):
+        """Valida la nueva contraseña y guarda su hash con sal"""
+        valor = valor if valor else ""
+        self._error_password_actual = self._error_password(valor) if valor else None
+        self.password_hash = hash_password(valor) if valor else ""
+    
+    @property
+    def permisos_personalizados(self) -> List[str]:
+        """Permisos personalizados (solo lectura; ver agregar_permiso)"""
+        return permisos_de_mascara(self._mascara_personal)
+    
+    def _actualizar_mascara(self):
+        """Combina la máscara del rol con la de los permisos personalizados"""
+        self._mascara = mascara_rol(self._rol) | self._mascara_personal
+        self._version_mascara = _version_roles
+    
     # ==================== MÉTODOS MÁGICOS ====================
     
     def __str__(self):
@@ -128,6 +268,72 @@ class Administrador:
             logger.error(f"Error en comparación menor que: {e}")
             return NotImplemented
     
+    # ==================== SERIALIZACIÓN ====================
+    
+    FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+    
+    def to_dict(self) -> Dict:
+        """
+        Convierte el administrador a diccionario (incluye el hash de la
+        contraseña, nunca la contraseña, para guardarlo en AlmacenUsuarios)
+        
+        Returns:
+            dict: Diccionario con todos los atributos del usuario
+        """
+        try:
+            return {
+                'id_admin': self.id_admin,
+                'nombre': self.nombre,
+                'usuario': self.usuario,
+                'password_hash': self.password_hash,
+                'rol': self.rol,
+                'activo': self.activo,
+                'fecha_creacion': self.fecha_creacion.strftime(self.FORMATO_FECHA) if self.fecha_creacion else None,
+                'ultimo_acceso': self.ultimo_acceso.strftime(self.FORMATO_FECHA) if self.ultimo_acceso else None,
+                'intentos_fallidos': self.intentos_fallidos,
+                'permisos_personalizados': self.permisos_personalizados
+            }
+        except Exception as e:
+            logger.error(f"Error al convertir a diccionario: {e}")
+            return {}
+    
+    @classmethod
+    def desde_dict(cls, datos: Dict) -> Optional['Administrador']:
+        """
+        Crea un administrador desde un diccionario generado por to_dict()
+        
+        Si trae 'password' en texto plano (formato anterior) en lugar de
+        'password_hash', la contraseña se hashea al cargarla.
+        
+        Args:
+            datos (dict): Diccionario con los datos del usuario
+            
+        Returns:
+            Administrador: Nueva instancia o None si hay error
+        """
+        try:
+            admin = cls(
+                id_admin=datos.get('id_admin'),
+                nombre=datos.get('nombre', ''),
+                usuario=datos.get('usuario', ''),
+                password=datos.get('password', ''),
+                rol=datos.get('rol', 'vendedor')
+            )
+            if datos.get('password_hash'):
+                admin.password_hash = datos['password_hash']
+            admin.activo = bool(datos.get('activo', True))
+            admin.intentos_fallidos = int(datos.get('intentos_fallidos', 0))
+            if datos.get('fecha_creacion'):
+                admin.fecha_creacion = datetime.strptime(datos['fecha_creacion'], cls.FORMATO_FECHA)
+            if datos.get('ultimo_acceso'):
+                admin.ultimo_acceso = datetime.strptime(datos['ultimo_acceso'], cls.FORMATO_FECHA)
+            for permiso in datos.get('permisos_personalizados') or []:
+                admin.agregar_permiso(permiso)
+            return admin
+        except Exception as e:
+            logger.error(f"Error al crear desde diccionario: {e}")
+            return None
+    
     # ==================== VALIDACIONES ====================
     
     def validar_nombre(self) -> Tuple[bool, str]:
@@ -187,35 +393,42 @@ class Administrador:
             logger.error(f"Error al validar usuario: {e}")
             return False, f"Error en validación: {str(e)}"
     
+    @classmethod
+    def _error_password(cls, password: str) -> Optional[str]:
+        """Mensaje de error de una contraseña en texto plano, o None si es válida"""
+        if not password:
+            return "La contraseña no puede estar vacía"
+        
+        if len(password) < cls.MIN_LONGITUD_PASSWORD:
+            return f"La contraseña debe tener al menos {cls.MIN_LONGITUD_PASSWORD} caracteres"
+        
+        if len(password) > cls.MAX_LONGITUD_PASSWORD:
+            return f"La contraseña no puede exceder {cls.MAX_LONGITUD_PASSWORD} caracteres"
+        
+        # Verificar complejidad básica
+        tiene_numero = any(c.isdigit() for c in password)
+        tiene_letra = any(c.isalpha() for c in password)
+        
+        if not (tiene_numero and tiene_letra):
+            return "La contraseña debe contener al menos una letra y un número"
+        
+        return None
+    
     def validar_password(self) -> Tuple[bool, str]:
         """
         Valida la contraseña
         
+        Usa el resultado guardado al asignarla. Un usuario cargado de un
+        almacén solo trae el hash: su contraseña se validó cuando se creó.
+        
         Returns:
             tuple: (bool, str) - (es_valido, mensaje)
         """
-        try:
-            if not self.password:
-                return False, "La contraseña no puede estar vacía"
-            
-            if len(self.password) < self.MIN_LONGITUD_PASSWORD:
-                return False, f"La contraseña debe tener al menos {self.MIN_LONGITUD_PASSWORD} caracteres"
-            
-            if len(self.password) > self.MAX_LONGITUD_PASSWORD:
-                return False, f"La contraseña no puede exceder {self.MAX_LONGITUD_PASSWORD} caracteres"
-            
-            # Verificar complejidad básica
-            tiene_numero = any(c.isdigit() for c in self.password)
-            tiene_letra = any(c.isalpha() for c in self.password)
-            
-            if not (tiene_numero and tiene_letra):
-                return False, "La contraseña debe contener al menos una letra y un número"
-            
-            return True, "Contraseña válida"
-            
-        except Exception as e:
-            logger.error(f"Error al validar contraseña: {e}")
-            return False, f"Error en validación: {str(e)}"
+        if self._error_password_actual:
+            return False, self._error_password_actual
+        if not self.password_hash:
+            return False, "La contraseña no puede estar vacía"
+        return True, "Contraseña válida"
     
     def validar_rol(self) -> Tuple[bool, str]:
         """
@@ -225,7 +438,7 @@ class Administrador:
             tuple: (bool, str) - (es_valido, mensaje)
         """
         try:
-            roles_validos = [r.value for r in RolUsuario]
+            roles_validos = roles_registrados()
             
             if self.rol.lower() not in roles_validos:
                 return False, f"Rol inválido. Roles válidos: {', '.join(roles_validos)}"
@@ -275,13 +488,19 @@ class Administrador:
     
     # ==================== AUTENTICACIÓN ====================
     
-    def validar_credenciales(self, usuario: str, password: str) -> Tuple[bool, str]:
+    def validar_credenciales(self, usuario: str, password: str, limitador=None,
+                             origen: Optional[str] = None) -> Tuple[bool, str]:
         """
         Valida las credenciales de inicio de sesión
         
         Args:
             usuario (str): Nombre de usuario
             password (str): Contraseña
+            limitador (LimitadorIntentos, optional): Contadores de fallos
+                compartidos entre procesos (ver limitador_intentos.py); además
+                del contador propio del objeto, bloquean temporalmente al
+                usuario y al origen
+            origen (str, optional): Origen del intento (IP, terminal)
             
         Returns:
             tuple: (bool, str) - (autenticado, mensaje)
@@ -295,25 +514,46 @@ class Administrador:
             if self.intentos_fallidos >= self.MAX_INTENTOS_LOGIN:
                 return False, f"Cuenta bloqueada por {self.MAX_INTENTOS_LOGIN} intentos fallidos."
             
-            # Validar usuario
-            if self.usuario != usuario.strip().lower():
-                self.incrementar_intentos_fallidos()
-                return False, "Usuario o contraseña incorrectos"
+            if limitador is not None:
+                permitido, espera = limitador.permitir(usuario, origen)
+                if not permitido:
+                    return False, f"Demasiados intentos fallidos. Intente de nuevo en {int(espera) + 1} segundos."
             
-            # Validar contraseña
-            if self.password != password:
+            # Validar usuario y contraseña
+            if self.usuario != usuario.strip().lower() or not self.verificar_password(password):
                 self.incrementar_intentos_fallidos()
+                if limitador is not None:
+                    limitador.registrar_fallo(usuario, origen)
                 return False, "Usuario o contraseña incorrectos"
             
             # Autenticación exitosa
             self.resetear_intentos_fallidos()
             self.registrar_acceso()
+            if limitador is not None:
+                limitador.registrar_exito(usuario, origen)
             return True, "Autenticación exitosa"
             
         except Exception as e:
             logger.error(f"Error en autenticación: {e}")
             return False, f"Error en autenticación: {str(e)}"
     
+    def verificar_password(self, password: str) -> bool:
+        """
+        Compara una contraseña con el hash guardado
+        
+        Si coincide y el hash es del formato anterior o de un costo menor al
+        actual (contrasenas.ITERACIONES), se reemplaza por uno nuevo; quien
+        persiste el usuario debe guardarlo de nuevo.
+        
+        Returns:
+            bool: True si la contraseña es correcta
+        """
+        if not verificar_hash(password, self.password_hash):
+            return False
+        if necesita_rehash(self.password_hash):
+            self.password_hash = hash_password(password)
+        return True
+    
     def incrementar_intentos_fallidos(self):
         """Incrementa el contador de intentos fallidos"""
         try:
@@ -354,7 +594,7 @@ class Administrador:
         """
         try:
             # Verificar contraseña actual
-            if self.password != password_actual:
+            if not self.verificar_password(password_actual):
                 return False, "La contraseña actual es incorrecta"
             
             # Verificar que las nuevas contraseñas coincidan
@@ -365,15 +605,12 @@ class Administrador:
             if password_nueva == password_actual:
                 return False, "La nueva contraseña debe ser diferente a la actual"
             
-            # Validar nueva contraseña
-            password_temp = self.password
-            self.password = password_nueva
-            valido, mensaje = self.validar_password()
-            
-            if not valido:
-                self.password = password_temp
-                return False, mensaje
+            # Validar nueva contraseña antes de calcular su hash
+            error = self._error_password(password_nueva)
+            if error:
+                return False, error
             
+            self.password = password_nueva
             return True, "Contraseña cambiada exitosamente"
             
         except Exception as e:
@@ -461,24 +698,15 @@ class Administrador:
             bool: True si tiene el permiso
         """
         try:
-            # Administrador tiene todos los permisos
-            if self.es_administrador():
-                return True
-            
-            # Verificar permisos personalizados
-            if permiso in self.permisos_personalizados:
-                return True
+            if self._version_mascara != _version_roles:
+                self._actualizar_mascara()
             
-            # Permisos por rol
-            permisos_vendedor = ['ver_productos', 'ver_clientes', 'crear_pedidos']
-            permisos_supervisor = permisos_vendedor + ['ver_reportes', 'gestionar_productos']
+            bit = _bits_permisos.get(permiso)
+            if bit is None:
+                # Permiso nunca registrado: solo el administrador lo tiene
+                return self._mascara == TODOS_LOS_PERMISOS
             
-            if self.es_supervisor():
-                return permiso in permisos_supervisor
-            elif self.es_vendedor():
-                return permiso in permisos_vendedor
-            
-            return False
+            return self._mascara & bit != 0
             
         except Exception as e:
             logger.error(f"Error al verificar permiso: {e}")
@@ -487,10 +715,12 @@ class Administrador:
     def agregar_permiso(self, permiso: str) -> bool:
         """Agrega un permiso personalizado al usuario"""
         try:
-            if permiso not in self.permisos_personalizados:
-                self.permisos_personalizados.append(permiso)
-                return True
-            return False
+            bit = registrar_permiso(permiso)
+            if self._mascara_personal & bit:
+                return False
+            self._mascara_personal |= bit
+            self._actualizar_mascara()
+            return True
         except Exception as e:
             logger.error(f"Error al agregar permiso: {e}")
             return False
@@ -498,10 +728,12 @@ class Administrador:
     def remover_permiso(self, permiso: str) -> bool:
         """Remueve un permiso personalizado del usuario"""
         try:
-            if permiso in self.permisos_personalizados:
-                self.permisos_personalizados.remove(permiso)
-                return True
-            return False
+            bit = _bits_permisos.get(permiso, 0)
+            if not self._mascara_personal & bit:
+                return False
+            self._mascara_personal &= ~bit
+            self._actualizar_mascara()
+            return True
         except Exception as e:
             logger.error(f"Error al remover permiso: {e}")
             return False
\ No newline at end of file
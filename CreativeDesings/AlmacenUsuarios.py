@@ -0,0 +1,207 @@
+"""
+ALMACÉN DE USUARIOS - Creative Designs
+Persistencia de los usuarios del sistema en un diario de solo agregado
+
+Descripción: Cada alta, cambio o baja de RegistroUsuario agrega una línea
+JSON al final del archivo, de modo que una escritura cuesta lo mismo con
+diez usuarios que con miles. Al iniciar se lee el archivo completo una sola
+vez y se conserva el último estado de cada usuario. Cuando las líneas
+obsoletas superan a las vigentes, el archivo se reescribe (compactación)
+con una línea por usuario, en un archivo temporal que reemplaza al original
+de forma atómica.
+
+Formato de cada línea:
+    {"op": "guardar", "datos": {...Administrador.to_dict()...}}
+    {"op": "eliminar", "usuario": "nombre_de_usuario"}
+    {"op": "secuencia", "ultimo_id": 42}   (primera línea tras compactar)
+
+Ejemplo:
+    registro = RegistroUsuario(AlmacenUsuarios('usuarios.jsonl'))
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class AlmacenUsuariosException(Exception):
+    """Excepción para errores al leer o escribir el almacén de usuarios"""
+    pass
+
+
+class AlmacenUsuarios:
+    """
+    Diario de usuarios en un archivo JSON Lines
+
+    Atributos:
+        ruta (str): Archivo del diario
+        sincronizar (bool): Forzar cada escritura a disco con fsync
+        ultimo_id (int): Mayor id_admin guardado alguna vez, incluidos los
+            usuarios eliminados, para no reutilizar ids
+    """
+
+    # Líneas obsoletas toleradas antes de compactar, además de una por usuario vigente
+    MIN_OBSOLETAS_COMPACTAR = 100
+
+    def __init__(self, ruta: str, sincronizar: bool = False):
+        self.ruta = ruta
+        self.sincronizar = sincronizar
+        # Último estado de cada usuario vigente: usuario -> datos
+        self._vigentes: Dict[str, dict] = {}
+        self.ultimo_id = 0
+        self._lineas = 0
+        self._cargado = False
+        # Una caída puede dejar la última línea sin salto; la próxima
+        # escritura debe empezar en una línea nueva
+        self._falta_salto = False
+        self._lock = threading.Lock()
+
+    # ==================== LECTURA ====================
+
+    def cargar(self) -> List[dict]:
+        """
+        Lee el diario y retorna el estado vigente de cada usuario
+
+        Solo lee el archivo la primera vez; compacta si hay demasiadas
+        líneas obsoletas.
+
+        Returns:
+            List[dict]: Datos de cada usuario, en orden de primera alta
+
+        Raises:
+            AlmacenUsuariosException: Si el archivo no se puede leer
+        """
+        with self._lock:
+            if not self._cargado:
+                self._leer()
+                self._cargado = True
+                self._compactar_si_conviene()
+            return list(self._vigentes.values())
+
+    def _leer(self):
+        if not os.path.exists(self.ruta):
+            return
+
+        try:
+            with open(self.ruta, 'r', encoding='utf-8') as f:
+                for numero, linea in enumerate(f, 1):
+                    self._falta_salto = not linea.endswith("\n")
+                    linea = linea.strip()
+                    if not linea:
+                        continue
+                    self._lineas += 1
+                    try:
+                        self._aplicar(json.loads(linea))
+                    except (ValueError, KeyError, TypeError) as e:
+                        # Normalmente una última línea cortada por una caída
+                        logger.warning(f"Línea {numero} inválida en {self.ruta}, se omite: {e}")
+        except OSError as e:
+            raise AlmacenUsuariosException(f"No se pudo leer {self.ruta}: {e}")
+
+        logger.info(f"Se cargaron {len(self._vigentes)} usuarios de {self.ruta}")
+
+    def _aplicar(self, registro: dict):
+        """Aplica una línea del diario al estado en memoria"""
+        if registro['op'] == 'guardar':
+            datos = registro['datos']
+            self._vigentes[datos['usuario']] = datos
+            self.ultimo_id = max(self.ultimo_id, datos.get('id_admin') or 0)
+        elif registro['op'] == 'eliminar':
+            self._vigentes.pop(registro['usuario'], None)
+        elif registro['op'] == 'secuencia':
+            self.ultimo_id = max(self.ultimo_id, registro['ultimo_id'])
+        else:
+            raise ValueError(f"operación desconocida {registro['op']!r}")
+
+    # ==================== ESCRITURA ====================
+
+    def guardar(self, datos: dict):
+        """
+        Agrega o reemplaza un usuario (datos de Administrador.to_dict())
+
+        Raises:
+            AlmacenUsuariosException: Si no se pudo escribir
+        """
+        self._escribir({'op': 'guardar', 'datos': datos})
+
+    def eliminar(self, usuario: str):
+        """
+        Elimina un usuario; sin efecto si no existe
+
+        Raises:
+            AlmacenUsuariosException: Si no se pudo escribir
+        """
+        with self._lock:
+            if self._cargado and usuario not in self._vigentes:
+                return
+        self._escribir({'op': 'eliminar', 'usuario': usuario})
+
+    def _escribir(self, registro: dict):
+        linea = json.dumps(registro, ensure_ascii=False) + "\n"
+        with self._lock:
+            if not self._cargado:
+                self._leer()
+                self._cargado = True
+            if self._falta_salto:
+                linea = "\n" + linea
+            try:
+                with open(self.ruta, 'a', encoding='utf-8') as f:
+                    f.write(linea)
+                    f.flush()
+                    if self.sincronizar:
+                        os.fsync(f.fileno())
+            except OSError as e:
+                raise AlmacenUsuariosException(f"No se pudo escribir en {self.ruta}: {e}")
+            self._falta_salto = False
+            self._aplicar(registro)
+            self._lineas += 1
+            self._compactar_si_conviene()
+
+    # ==================== COMPACTACIÓN ====================
+
+    def _compactar_si_conviene(self):
+        obsoletas = self._lineas - len(self._vigentes)
+        if obsoletas > max(self.MIN_OBSOLETAS_COMPACTAR, len(self._vigentes)):
+            try:
+                self._compactar()
+            except AlmacenUsuariosException as e:
+                # El diario sigue siendo válido; se reintenta en la próxima escritura
+                logger.warning(str(e))
+
+    def compactar(self):
+        """
+        Reescribe el diario con una sola línea por usuario vigente
+
+        Raises:
+            AlmacenUsuariosException: Si no se pudo reescribir el archivo
+        """
+        with self._lock:
+            if not self._cargado:
+                self._leer()
+                self._cargado = True
+            self._compactar()
+
+    def _compactar(self):
+        temporal = self.ruta + ".tmp"
+        try:
+            with open(temporal, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'op': 'secuencia', 'ultimo_id': self.ultimo_id}) + "\n")
+                for datos in self._vigentes.values():
+                    f.write(json.dumps({'op': 'guardar', 'datos': datos}, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, self.ruta)
+        except OSError as e:
+            raise AlmacenUsuariosException(f"No se pudo compactar {self.ruta}: {e}")
+
+        logger.info(f"Diario {self.ruta} compactado: {self._lineas} líneas -> {len(self._vigentes)} usuarios")
+        self._lineas = len(self._vigentes) + 1
+        self._falta_salto = False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._vigentes)
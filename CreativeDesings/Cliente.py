@@ -16,6 +16,64 @@ from typing import Optional, Tuple, Dict, List
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patrones de validación compilados una sola vez
+_PATRON_NOMBRE = re.compile(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$")
+_SEPARADORES_TELEFONO = re.compile(r'[\s\-\(\)]')
+_PATRON_TELEFONO = re.compile(r'^[0-9]{8}$')
+_PATRON_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_DIGITOS_ASCII = frozenset("0123456789")
+
+
+# ==================== VALIDADORES ====================
+# Cada validador retorna None si el valor es válido o el mensaje de error.
+# No crean objetos en el caso válido, para validar lotes grandes rápidamente.
+
+def _error_nombre(valor: str, campo: str = "nombre") -> Optional[str]:
+    """Valida un nombre o apellido (campo: 'nombre' o 'apellido')"""
+    if not valor or valor.isspace():
+        return f"El {campo} no puede estar vacío"
+    if len(valor) < 2:
+        return f"El {campo} debe tener al menos 2 caracteres"
+    if len(valor) > 100:
+        return f"El {campo} no puede exceder 100 caracteres"
+    if not _PATRON_NOMBRE.match(valor):
+        return f"El {campo} solo puede contener letras y espacios"
+    return None
+
+
+def _error_telefono(telefono: str) -> Optional[str]:
+    """Valida un teléfono de Guatemala (8 dígitos)"""
+    if not telefono or telefono.isspace():
+        return "El teléfono no puede estar vacío"
+    # Camino rápido: teléfonos ya guardados como 8 dígitos no pasan por re.sub
+    if len(telefono) == 8 and _DIGITOS_ASCII.issuperset(telefono):
+        return None
+    if not _PATRON_TELEFONO.match(_SEPARADORES_TELEFONO.sub('', telefono)):
+        return "El teléfono debe tener 8 dígitos (formato Guatemala)"
+    return None
+
+
+def _error_email(email: str) -> Optional[str]:
+    """Valida el formato y largo de un email"""
+    if not email or email.isspace():
+        return "El email no puede estar vacío"
+    if not _PATRON_EMAIL.match(email):
+        return "El formato del email no es válido"
+    if len(email) > 100:
+        return "El email no puede exceder 100 caracteres"
+    return None
+
+
+def _error_direccion(direccion: str) -> Optional[str]:
+    """Valida el largo de una dirección"""
+    if not direccion or direccion.isspace():
+        return "La dirección no puede estar vacía"
+    if len(direccion) < 10:
+        return "La dirección debe tener al menos 10 caracteres"
+    if len(direccion) > 255:
+        return "La dirección no puede exceder 255 caracteres"
+    return None
+
 
 class ClienteException(Exception):
     """Excepción personalizada para errores relacionados con Cliente"""
@@ -34,8 +92,20 @@ class Cliente:
         email (str): Correo electrónico
         direccion (str): Dirección física
         fecha_registro (datetime): Fecha de registro en el sistema
+    
+    Usa __slots__ para que cada instancia ocupe poca memoria (la caché del
+    CRM mantiene cientos de miles). Los valores derivados (nombre completo,
+    clave de orden, iniciales y dominio del email) se calculan la primera
+    vez que se piden y se descartan cuando cambia nombre, apellido o email.
+    Si el cliente pertenece a un RegistroClientes, cambiar id, nombre,
+    apellido, teléfono o email actualiza los índices del registro.
     """
     
+    __slots__ = (
+        '_id_cliente', '_nombre', '_apellido', '_telefono', '_email', 'direccion', 'fecha_registro',
+        '_nombre_completo', '_clave_orden', '_iniciales', '_dominio_email', '_registro'
+    )
+    
     def __init__(self, id_cliente=None, nombre="", apellido="", telefono="", email="", direccion=""):
         """
         Constructor de la clase Cliente
@@ -52,17 +122,80 @@ class Cliente:
             ClienteException: Si hay error al crear el cliente
         """
         try:
-            self.id_cliente = id_cliente
-            self.nombre = nombre.strip() if nombre else ""
-            self.apellido = apellido.strip() if apellido else ""
-            self.telefono = telefono.strip() if telefono else ""
-            self.email = email.strip().lower() if email else ""
+            # Los campos se asignan directo: un cliente nuevo no está en ningún registro
+            self._registro = None
+            self._nombre_completo = self._clave_orden = self._iniciales = self._dominio_email = None
+            self._id_cliente = id_cliente
+            self._nombre = nombre.strip() if nombre else ""
+            self._apellido = apellido.strip() if apellido else ""
+            self._telefono = telefono.strip() if telefono else ""
+            self._email = email.strip().lower() if email else ""
             self.direccion = direccion.strip() if direccion else ""
             self.fecha_registro = datetime.now()
         except Exception as e:
             logger.error(f"Error al crear Cliente: {e}")
             raise ClienteException(f"No se pudo crear el cliente: {str(e)}")
     
+    # ==================== PROPIEDADES ====================
+    
+    def _asignar(self, atributo: str, valor, *derivados: str):
+        """
+        Asigna un campo, descarta los valores derivados y reindexa en el registro
+        
+        Raises:
+            ValueError: Si el nuevo id o email ya pertenece a otro cliente del
+                registro; en ese caso el cliente y los índices no cambian
+        """
+        registro = self._registro
+        if registro is not None:
+            registro._verificar_cambio(self, atributo, valor)
+            registro._desindexar(self)
+        setattr(self, atributo, valor)
+        for derivado in derivados:
+            setattr(self, derivado, None)
+        if registro is not None:
+            registro._indexar(self)
+    
+    @property
+    def id_cliente(self):
+        return self._id_cliente
+    
+    @id_cliente.setter
+    def id_cliente(self, valor):
+        self._asignar('_id_cliente', valor)
+    
+    @property
+    def nombre(self) -> str:
+        return self._nombre
+    
+    @nombre.setter
+    def nombre(self, valor: str):
+        self._asignar('_nombre', valor, '_nombre_completo', '_clave_orden', '_iniciales')
+    
+    @property
+    def apellido(self) -> str:
+        return self._apellido
+    
+    @apellido.setter
+    def apellido(self, valor: str):
+        self._asignar('_apellido', valor, '_nombre_completo', '_clave_orden', '_iniciales')
+    
+    @property
+    def telefono(self) -> str:
+        return self._telefono
+    
+    @telefono.setter
+    def telefono(self, valor: str):
+        self._asignar('_telefono', valor)
+    
+    @property
+    def email(self) -> str:
+        return self._email
+    
+    @email.setter
+    def email(self, valor: str):
+        self._asignar('_email', valor, '_dominio_email')
+    
     # ==================== MÉTODOS MÁGICOS ====================
     
     def __str__(self):
@@ -95,7 +228,7 @@ class Cliente:
         try:
             if not isinstance(otro, Cliente):
                 return NotImplemented
-            return self.nombre_completo().lower() < otro.nombre_completo().lower()
+            return self.clave_orden() < otro.clave_orden()
         except Exception as e:
             logger.error(f"Error en comparación menor que: {e}")
             return NotImplemented
@@ -108,6 +241,16 @@ class Cliente:
             logger.error(f"Error en hash: {e}")
             return 0
     
+    def __getstate__(self):
+        """Estado para copy/pickle; la copia no pertenece al registro del original"""
+        estado = {nombre: getattr(self, nombre) for nombre in self.__slots__}
+        estado['_registro'] = None
+        return estado
+    
+    def __setstate__(self, estado):
+        for nombre, valor in estado.items():
+            object.__setattr__(self, nombre, valor)
+    
     # ==================== MÉTODOS DE ACCESO ====================
     
     def nombre_completo(self) -> str:
@@ -118,11 +261,24 @@ class Cliente:
             str: Nombre y apellido concatenados
         """
         try:
-            return f"{self.nombre} {self.apellido}".strip()
+            if self._nombre_completo is None:
+                self._nombre_completo = f"{self._nombre} {self._apellido}".strip()
+            return self._nombre_completo
         except Exception as e:
             logger.error(f"Error al obtener nombre completo: {e}")
             return ""
     
+    def clave_orden(self) -> str:
+        """
+        Retorna el nombre completo en minúsculas, para ordenar y buscar
+        
+        Returns:
+            str: Nombre completo en minúsculas
+        """
+        if self._clave_orden is None:
+            self._clave_orden = self.nombre_completo().lower()
+        return self._clave_orden
+    
     def iniciales(self) -> str:
         """
         Retorna las iniciales del cliente
@@ -131,9 +287,11 @@ class Cliente:
             str: Iniciales en mayúsculas
         """
         try:
-            inicial_nombre = self.nombre[0].upper() if self.nombre else ""
-            inicial_apellido = self.apellido[0].upper() if self.apellido else ""
-            return f"{inicial_nombre}{inicial_apellido}"
+            if self._iniciales is None:
+                inicial_nombre = self._nombre[0].upper() if self._nombre else ""
+                inicial_apellido = self._apellido[0].upper() if self._apellido else ""
+                self._iniciales = f"{inicial_nombre}{inicial_apellido}"
+            return self._iniciales
         except Exception as e:
             logger.error(f"Error al obtener iniciales: {e}")
             return ""
@@ -162,18 +320,9 @@ class Cliente:
             tuple: (bool, str) - (es_valido, mensaje_error)
         """
         try:
-            if not self.nombre or self.nombre.strip() == "":
-                return False, "El nombre no puede estar vacío"
-            
-            if len(self.nombre) < 2:
-                return False, "El nombre debe tener al menos 2 caracteres"
-            
-            if len(self.nombre) > 100:
-                return False, "El nombre no puede exceder 100 caracteres"
-            
-            if not re.match(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$", self.nombre):
-                return False, "El nombre solo puede contener letras y espacios"
-            
+            error = _error_nombre(self.nombre, "nombre")
+            if error:
+                return False, error
             return True, "Nombre válido"
             
         except Exception as e:
@@ -188,18 +337,9 @@ class Cliente:
             tuple: (bool, str) - (es_valido, mensaje_error)
         """
         try:
-            if not self.apellido or self.apellido.strip() == "":
-                return False, "El apellido no puede estar vacío"
-            
-            if len(self.apellido) < 2:
-                return False, "El apellido debe tener al menos 2 caracteres"
-            
-            if len(self.apellido) > 100:
-                return False, "El apellido no puede exceder 100 caracteres"
-            
-            if not re.match(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$", self.apellido):
-                return False, "El apellido solo puede contener letras y espacios"
-            
+            error = _error_nombre(self.apellido, "apellido")
+            if error:
+                return False, error
             return True, "Apellido válido"
             
         except Exception as e:
@@ -214,16 +354,9 @@ class Cliente:
             tuple: (bool, str) - (es_valido, mensaje_error)
         """
         try:
-            if not self.telefono or self.telefono.strip() == "":
-                return False, "El teléfono no puede estar vacío"
-            
-            # Limpiar teléfono (quitar espacios, guiones, paréntesis)
-            telefono_limpio = re.sub(r'[\s\-\(\)]', '', self.telefono)
-            
-            # Validar formato Guatemala: 8 dígitos
-            if not re.match(r'^[0-9]{8}$', telefono_limpio):
-                return False, "El teléfono debe tener 8 dígitos (formato Guatemala)"
-            
+            error = _error_telefono(self.telefono)
+            if error:
+                return False, error
             return True, "Teléfono válido"
             
         except Exception as e:
@@ -238,18 +371,9 @@ class Cliente:
             tuple: (bool, str) - (es_valido, mensaje_error)
         """
         try:
-            if not self.email or self.email.strip() == "":
-                return False, "El email no puede estar vacío"
-            
-            # Patrón regex para email
-            patron_email = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            
-            if not re.match(patron_email, self.email):
-                return False, "El formato del email no es válido"
-            
-            if len(self.email) > 100:
-                return False, "El email no puede exceder 100 caracteres"
-            
+            error = _error_email(self.email)
+            if error:
+                return False, error
             return True, "Email válido"
             
         except Exception as e:
@@ -264,15 +388,9 @@ class Cliente:
             tuple: (bool, str) - (es_valido, mensaje_error)
         """
         try:
-            if not self.direccion or self.direccion.strip() == "":
-                return False, "La dirección no puede estar vacía"
-            
-            if len(self.direccion) < 10:
-                return False, "La dirección debe tener al menos 10 caracteres"
-            
-            if len(self.direccion) > 255:
-                return False, "La dirección no puede exceder 255 caracteres"
-            
+            error = _error_direccion(self.direccion)
+            if error:
+                return False, error
             return True, "Dirección válida"
             
         except Exception as e:
@@ -289,30 +407,15 @@ class Cliente:
         errores = []
         
         try:
-            # Validar nombre
-            valido, mensaje = self.validar_nombre()
-            if not valido:
-                errores.append(f"Nombre: {mensaje}")
-            
-            # Validar apellido
-            valido, mensaje = self.validar_apellido()
-            if not valido:
-                errores.append(f"Apellido: {mensaje}")
-            
-            # Validar teléfono
-            valido, mensaje = self.validar_telefono()
-            if not valido:
-                errores.append(f"Teléfono: {mensaje}")
-            
-            # Validar email
-            valido, mensaje = self.validar_email()
-            if not valido:
-                errores.append(f"Email: {mensaje}")
-            
-            # Validar dirección
-            valido, mensaje = self.validar_direccion()
-            if not valido:
-                errores.append(f"Dirección: {mensaje}")
+            for etiqueta, error in (
+                ("Nombre", _error_nombre(self.nombre, "nombre")),
+                ("Apellido", _error_nombre(self.apellido, "apellido")),
+                ("Teléfono", _error_telefono(self.telefono)),
+                ("Email", _error_email(self.email)),
+                ("Dirección", _error_direccion(self.direccion)),
+            ):
+                if error:
+                    errores.append(f"{etiqueta}: {error}")
             
             return len(errores) == 0, errores
             
@@ -377,7 +480,7 @@ class Cliente:
             str: Teléfono formateado
         """
         try:
-            telefono_limpio = re.sub(r'[\s\-\(\)]', '', self.telefono)
+            telefono_limpio = _SEPARADORES_TELEFONO.sub('', self.telefono)
             if len(telefono_limpio) == 8:
                 return f"{telefono_limpio[:4]}-{telefono_limpio[4:]}"
             return self.telefono
@@ -393,9 +496,9 @@ class Cliente:
             str: Dominio del email
         """
         try:
-            if '@' in self.email:
-                return self.email.split('@')[1]
-            return ""
+            if self._dominio_email is None:
+                self._dominio_email = self._email.split('@')[1] if '@' in self._email else ""
+            return self._dominio_email
         except Exception as e:
             logger.error(f"Error al extraer dominio: {e}")
             return ""
@@ -469,8 +572,7 @@ Días registrado: {self.edad_registro()}
         try:
             if not telefono:
                 return False
-            telefono_limpio = re.sub(r'[\s\-\(\)]', '', telefono)
-            return bool(re.match(r'^[0-9]{8}$', telefono_limpio))
+            return _error_telefono(telefono) is None
         except Exception as e:
             logger.error(f"Error al validar formato de teléfono: {e}")
             return False
@@ -489,8 +591,7 @@ Días registrado: {self.edad_registro()}
         try:
             if not email:
                 return False
-            patron_email = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(patron_email, email))
+            return bool(_PATRON_EMAIL.match(email))
         except Exception as e:
             logger.error(f"Error al validar formato de email: {e}")
             return False
@@ -522,8 +623,8 @@ Días registrado: {self.edad_registro()}
                 valor1 = cliente1.telefono
                 valor2 = cliente2.telefono
             else:
-                valor1 = cliente1.nombre_completo().lower()
-                valor2 = cliente2.nombre_completo().lower()
+                valor1 = cliente1.clave_orden()
+                valor2 = cliente2.clave_orden()
             
             if valor1 < valor2:
                 return -1
@@ -585,18 +686,71 @@ Días registrado: {self.edad_registro()}
 
 # ==================== FUNCIONES AUXILIARES ====================
 
+def validar_lote(clientes: List[Cliente]) -> Dict[int, Dict[str, str]]:
+    """
+    Valida muchos clientes en una sola llamada
+    
+    Usa los mismos validadores que validar_completo() sin construir tuplas
+    ni mensajes para los registros válidos, de modo que en una importación
+    masiva el costo es proporcional a los errores encontrados.
+    
+    Args:
+        clientes (list): Lista de objetos Cliente
+        
+    Returns:
+        dict: Posición en la lista -> {campo: mensaje} solo para los clientes
+            inválidos; vacío si todos son válidos. Los campos son 'nombre',
+            'apellido', 'telefono', 'email' y 'direccion' ('cliente' si el
+            elemento no es un Cliente)
+    """
+    errores = {}
+    
+    for posicion, cliente in enumerate(clientes):
+        if not isinstance(cliente, Cliente):
+            errores[posicion] = {'cliente': "El objeto no es una instancia válida de Cliente"}
+            continue
+        
+        error = _error_nombre(cliente.nombre, "nombre")
+        if error:
+            errores.setdefault(posicion, {})['nombre'] = error
+        error = _error_nombre(cliente.apellido, "apellido")
+        if error:
+            errores.setdefault(posicion, {})['apellido'] = error
+        error = _error_telefono(cliente.telefono)
+        if error:
+            errores.setdefault(posicion, {})['telefono'] = error
+        error = _error_email(cliente.email)
+        if error:
+            errores.setdefault(posicion, {})['email'] = error
+        error = _error_direccion(cliente.direccion)
+        if error:
+            errores.setdefault(posicion, {})['direccion'] = error
+    
+    return errores
+
+
+def _es_registro(clientes) -> bool:
+    """Indica si se recibió un RegistroClientes en lugar de una lista"""
+    # Importación diferida: RegistroClientes importa este módulo
+    from CreativeDesings.RegistroClientes import RegistroClientes
+    return isinstance(clientes, RegistroClientes)
+
+
 def ordenar_clientes_por_nombre(clientes: List[Cliente]) -> List[Cliente]:
     """
     Ordena una lista de clientes alfabéticamente por nombre completo
     
     Args:
-        clientes (list): Lista de objetos Cliente
+        clientes (list | RegistroClientes): Lista de objetos Cliente o un
+            registro, que ya los mantiene ordenados
         
     Returns:
         list: Lista ordenada de clientes
     """
     try:
-        return sorted(clientes, key=lambda c: c.nombre_completo().lower())
+        if _es_registro(clientes):
+            return clientes.ordenados('nombre')
+        return sorted(clientes, key=Cliente.clave_orden)
     except Exception as e:
         logger.error(f"Error al ordenar clientes: {e}")
         return clientes
@@ -607,12 +761,15 @@ def ordenar_clientes_por_apellido(clientes: List[Cliente]) -> List[Cliente]:
     Ordena una lista de clientes alfabéticamente por apellido
     
     Args:
-        clientes (list): Lista de objetos Cliente
+        clientes (list | RegistroClientes): Lista de objetos Cliente o un
+            registro, que ya los mantiene ordenados
         
     Returns:
         list: Lista ordenada de clientes
     """
     try:
+        if _es_registro(clientes):
+            return clientes.ordenados('apellido')
         return sorted(clientes, key=lambda c: c.apellido.lower())
     except Exception as e:
         logger.error(f"Error al ordenar por apellido: {e}")
@@ -623,8 +780,11 @@ def buscar_cliente_por_nombre(clientes: List[Cliente], nombre_buscar: str) -> Li
     """
     Busca clientes cuyo nombre contenga el texto buscado
     
+    Para buscar por inicio de palabra con el índice de un RegistroClientes
+    use RegistroClientes.buscar_por_nombre().
+    
     Args:
-        clientes (list): Lista de clientes
+        clientes (list | RegistroClientes): Lista de clientes o registro
         nombre_buscar (str): Texto a buscar
         
     Returns:
@@ -635,7 +795,7 @@ def buscar_cliente_por_nombre(clientes: List[Cliente], nombre_buscar: str) -> Li
         nombre_buscar = nombre_buscar.lower()
         
         for cliente in clientes:
-            if nombre_buscar in cliente.nombre_completo().lower():
+            if nombre_buscar in cliente.clave_orden():
                 resultados.append(cliente)
         
         return resultados
@@ -648,8 +808,11 @@ def filtrar_por_dominio_email(clientes: List[Cliente], dominio: str) -> List[Cli
     """
     Filtra clientes por dominio de email
     
+    Para el dominio exacto con el índice de un RegistroClientes use
+    RegistroClientes.por_dominio().
+    
     Args:
-        clientes (list): Lista de clientes
+        clientes (list | RegistroClientes): Lista de clientes o registro
         dominio (str): Dominio a buscar
         
     Returns:
@@ -662,40 +825,154 @@ def filtrar_por_dominio_email(clientes: List[Cliente], dominio: str) -> List[Cli
         return []
 
 
+def ciudad_de(direccion: str) -> str:
+    """
+    Extrae la ciudad de una dirección: el último tramo separado por comas
+    ('Zona 10, Ciudad de Guatemala' -> 'Ciudad de Guatemala')
+    """
+    if not direccion:
+        return ""
+    return " ".join(direccion.rsplit(",", 1)[-1].split())
+
+
+def _sumar_conteo(conteos: Dict[str, int], clave: str, delta: int):
+    """Suma a un conteo por clave y elimina las claves que llegan a cero
+    
+    Los conteos pueden quedar negativos (un acumulador con solo bajas que
+    luego se fusiona con otro), así que solo se descarta el cero exacto.
+    """
+    valor = conteos.get(clave, 0) + delta
+    if valor:
+        conteos[clave] = valor
+    else:
+        conteos.pop(clave, None)
+
+
+class AcumuladorEstadisticas:
+    """
+    Estadísticas de clientes calculadas en una sola pasada
+    
+    Solo guarda conteos y sumas, así que admite altas y bajas incrementales
+    y se puede fusionar con el acumulador de otro proceso (se serializa con
+    pickle). Los conteos internos pueden ser negativos mientras un
+    acumulador solo tenga bajas; resultado() muestra los positivos. Las
+    fechas de registro se cuentan por valor (una entrada por fecha distinta)
+    y resultado() calcula los días completos de cada una con una sola
+    lectura del reloj.
+    
+    Ejemplo:
+        acumulador = AcumuladorEstadisticas(ClienteDAO().iterar())
+        acumulador.agregar(nuevo_cliente)
+        acumulador.fusionar(acumulador_de_otro_proceso)
+        acumulador.resultado()
+    """
+    
+    def __init__(self, clientes=None):
+        """
+        Args:
+            clientes (iterable, optional): Clientes para agregar de entrada;
+                puede ser un generador, se recorre una sola vez
+        """
+        self.total = 0
+        self.dominios: Dict[str, int] = {}
+        self.ciudades: Dict[str, int] = {}
+        # Conteo de clientes por fecha de registro
+        self._fechas: Dict[datetime, int] = {}
+        
+        for cliente in clientes or ():
+            self.agregar(cliente)
+    
+    def _aplicar(self, cliente: Cliente, signo: int, fecha_registro: Optional[datetime]) -> bool:
+        if not isinstance(cliente, Cliente):
+            logger.warning(f"Se omite un objeto que no es Cliente en las estadísticas: {cliente!r}")
+            return False
+        
+        self.total += signo
+        _sumar_conteo(self.dominios, cliente.dominio_email(), signo)
+        _sumar_conteo(self.ciudades, ciudad_de(cliente.direccion), signo)
+        fecha = fecha_registro or cliente.fecha_registro
+        if isinstance(fecha, datetime):
+            _sumar_conteo(self._fechas, fecha, signo)
+        return True
+    
+    def agregar(self, cliente: Cliente, fecha_registro: Optional[datetime] = None) -> bool:
+        """
+        Suma un cliente; False si el objeto no es un Cliente
+        
+        Args:
+            fecha_registro (datetime, optional): Fecha a contar en lugar de
+                cliente.fecha_registro
+        """
+        return self._aplicar(cliente, 1, fecha_registro)
+    
+    def quitar(self, cliente: Cliente, fecha_registro: Optional[datetime] = None) -> bool:
+        """
+        Resta un cliente agregado antes (con los mismos datos con que se
+        agregó); False si el objeto no es un Cliente
+        
+        Args:
+            fecha_registro (datetime, optional): Fecha con que se agregó, si
+                difiere de cliente.fecha_registro
+        """
+        return self._aplicar(cliente, -1, fecha_registro)
+    
+    def fusionar(self, otro: 'AcumuladorEstadisticas') -> 'AcumuladorEstadisticas':
+        """
+        Suma las estadísticas de otro acumulador (p. ej. de otro proceso)
+        
+        Returns:
+            AcumuladorEstadisticas: Este mismo acumulador
+        """
+        self.total += otro.total
+        for dominio, cantidad in otro.dominios.items():
+            _sumar_conteo(self.dominios, dominio, cantidad)
+        for ciudad, cantidad in otro.ciudades.items():
+            _sumar_conteo(self.ciudades, ciudad, cantidad)
+        for fecha, cantidad in otro._fechas.items():
+            _sumar_conteo(self._fechas, fecha, cantidad)
+        return self
+    
+    def resultado(self, ahora: Optional[datetime] = None) -> Dict:
+        """
+        Args:
+            ahora (datetime, optional): Momento de referencia; por defecto
+                datetime.now(), leído una sola vez
+        
+        Returns:
+            dict: 'total', 'dominios_email', 'ciudades' y
+                'promedio_dias_registro' (promedio de Cliente.edad_registro()
+                sobre el total; los clientes sin fecha cuentan 0 días)
+        """
+        promedio = 0
+        if self.total > 0:
+            ahora = ahora or datetime.now()
+            total_dias = sum(cantidad * (ahora - fecha).days for fecha, cantidad in self._fechas.items())
+            promedio = total_dias / self.total
+        
+        return {
+            'total': self.total,
+            'dominios_email': {d: n for d, n in self.dominios.items() if n > 0},
+            'ciudades': {c: n for c, n in self.ciudades.items() if n > 0},
+            'promedio_dias_registro': promedio
+        }
+    
+    def __repr__(self):
+        return f"AcumuladorEstadisticas(total={self.total})"
+
+
 def estadisticas_clientes(clientes: List[Cliente]) -> Dict:
     """
     Genera estadísticas sobre una lista de clientes
     
     Args:
-        clientes (list): Lista de clientes
+        clientes (iterable): Lista de clientes, RegistroClientes o un
+            generador como ClienteDAO().iterar()
         
     Returns:
-        dict: Diccionario con estadísticas
+        dict: Diccionario con estadísticas (ver AcumuladorEstadisticas.resultado)
     """
     try:
-        if not clientes:
-            return {
-                'total': 0,
-                'dominios_email': {},
-                'promedio_dias_registro': 0
-            }
-        
-        dominios = {}
-        total_dias = 0
-        
-        for cliente in clientes:
-            try:
-                dominio = cliente.dominio_email()
-                dominios[dominio] = dominios.get(dominio, 0) + 1
-                total_dias += cliente.edad_registro()
-            except:
-                continue
-        
-        return {
-            'total': len(clientes),
-            'dominios_email': dominios,
-            'promedio_dias_registro': total_dias / len(clientes) if clientes else 0
-        }
+        return AcumuladorEstadisticas(clientes).resultado()
     except Exception as e:
         logger.error(f"Error al generar estadísticas: {e}")
-        return {'total': 0, 'dominios_email': {}, 'promedio_dias_registro': 0}
\ No newline at end of file
+        return {'total': 0, 'dominios_email': {}, 'ciudades': {}, 'promedio_dias_registro': 0}
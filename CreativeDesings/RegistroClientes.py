@@ -0,0 +1,331 @@
+"""
+REGISTRO DE CLIENTES - Creative Designs
+Colección de clientes en memoria con índices
+
+Descripción: Mantiene índices por id, email, dominio del email, dígitos del
+teléfono y palabras del nombre, además de vistas ordenadas por nombre y por
+apellido, para que las búsquedas de la caché del CRM no recorran ni
+reordenen la lista completa en cada llamada. Los clientes avisan al
+registro cuando cambian sus campos, así que los índices se mantienen
+consistentes sin reconstruirse.
+"""
+
+import re
+import bisect
+import logging
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from CreativeDesings.Cliente import Cliente
+
+logger = logging.getLogger(__name__)
+
+_NO_DIGITOS = re.compile(r"\D")
+_PALABRAS = re.compile(r"\w+", re.UNICODE)
+
+
+def _normalizar(texto: str) -> str:
+    """Minúsculas y sin acentos"""
+    descompuesto = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def _clave_email(email: str) -> str:
+    """Clave del índice de emails: sin espacios y en minúsculas, como en el
+    constructor de Cliente (el setter de email guarda el valor tal cual)"""
+    return (email or "").strip().lower()
+
+
+def _palabras(texto: str) -> List[str]:
+    """Palabras normalizadas de un texto"""
+    return _PALABRAS.findall(_normalizar(texto or ""))
+
+
+class _VistaOrdenada:
+    """Lista de clientes ordenada por una clave, mantenida con bisect"""
+
+    def __init__(self, clave):
+        self._clave = clave
+        # (clave, id(cliente)): id() desempata y hace única cada entrada
+        self._entradas = []
+        self._clientes = {}
+
+    def agregar(self, cliente: Cliente):
+        bisect.insort(self._entradas, (self._clave(cliente), id(cliente)))
+        self._clientes[id(cliente)] = cliente
+
+    def agregar_varios(self, clientes: List[Cliente]):
+        """Carga masiva: un solo ordenamiento en lugar de una inserción por cliente"""
+        self._entradas.extend((self._clave(c), id(c)) for c in clientes)
+        self._entradas.sort()
+        self._clientes.update((id(c), c) for c in clientes)
+
+    def quitar(self, cliente: Cliente):
+        entrada = (self._clave(cliente), id(cliente))
+        posicion = bisect.bisect_left(self._entradas, entrada)
+        if posicion < len(self._entradas) and self._entradas[posicion] == entrada:
+            del self._entradas[posicion]
+        self._clientes.pop(id(cliente), None)
+
+    def valores(self) -> List[Cliente]:
+        return [self._clientes[ident] for _, ident in self._entradas]
+
+    def con_prefijo(self, prefijo: str) -> List[Cliente]:
+        """Clientes cuya clave empieza con el prefijo, en orden"""
+        inicio = bisect.bisect_left(self._entradas, (prefijo,))
+        resultado = []
+        for clave, ident in self._entradas[inicio:]:
+            if not clave.startswith(prefijo):
+                break
+            resultado.append(self._clientes[ident])
+        return resultado
+
+
+class RegistroClientes:
+    """
+    Clientes en memoria indexados para búsquedas rápidas
+
+    Cada cliente puede pertenecer a un solo registro a la vez.
+
+    Ejemplo:
+        registro = RegistroClientes(ClienteDAO().listar())
+        registro.por_email('juan.perez@example.com')
+        registro.buscar_por_nombre('jua pe')
+        registro.ordenados()
+    """
+
+    def __init__(self, clientes: Optional[Iterable[Cliente]] = None):
+        self._por_id: Dict[int, Cliente] = {}
+        self._por_email: Dict[str, Cliente] = {}
+        # Índices de varios clientes por clave: clave -> {id(cliente): cliente}
+        self._por_dominio: Dict[str, Dict[int, Cliente]] = {}
+        self._por_telefono: Dict[str, Dict[int, Cliente]] = {}
+        self._por_palabra: Dict[str, Dict[int, Cliente]] = {}
+        # Palabras distintas ordenadas, para buscar por prefijo con bisect
+        self._palabras_ordenadas: List[str] = []
+        self._por_nombre = _VistaOrdenada(Cliente.clave_orden)
+        self._por_apellido = _VistaOrdenada(lambda c: (c.apellido.lower(), c.clave_orden()))
+        self._total = 0
+
+        if clientes:
+            self.agregar_varios(clientes)
+
+    # ==================== ALTAS Y BAJAS ====================
+
+    def agregar(self, cliente: Cliente):
+        """
+        Agrega un cliente al registro
+
+        Raises:
+            ValueError: Si el cliente ya pertenece a un registro o si su id o
+                su email ya están registrados
+        """
+        self._verificar_nuevo(cliente)
+        self._indexar(cliente)
+        cliente._registro = self
+        self._total += 1
+
+    def agregar_varios(self, clientes: Iterable[Cliente]):
+        """
+        Agrega muchos clientes ordenando las vistas una sola vez al final
+
+        Raises:
+            ValueError: En las mismas condiciones que agregar(); los clientes
+                anteriores al inválido quedan agregados
+        """
+        agregados = []
+        try:
+            for cliente in clientes:
+                self._verificar_nuevo(cliente)
+                self._indexar(cliente, ordenar=False)
+                cliente._registro = self
+                agregados.append(cliente)
+        finally:
+            self._total += len(agregados)
+            self._palabras_ordenadas = sorted(self._por_palabra)
+            self._por_nombre.agregar_varios(agregados)
+            self._por_apellido.agregar_varios(agregados)
+
+    def _verificar_nuevo(self, cliente: Cliente):
+        if not isinstance(cliente, Cliente):
+            raise ValueError("El objeto no es una instancia válida de Cliente")
+        if cliente._registro is not None:
+            raise ValueError(f"{cliente!r} ya pertenece a un registro")
+        if cliente.id_cliente is not None and cliente.id_cliente in self._por_id:
+            raise ValueError(f"Ya existe un cliente con ID {cliente.id_cliente}")
+        if cliente.email and _clave_email(cliente.email) in self._por_email:
+            raise ValueError(f"El email {cliente.email} ya está registrado")
+
+    def _verificar_cambio(self, cliente: Cliente, atributo: str, valor):
+        """Llamado por Cliente antes de cambiar un campo: el nuevo id o email
+        no puede pertenecer a otro cliente del registro"""
+        if atributo == '_id_cliente' and valor is not None:
+            if self._por_id.get(valor, cliente) is not cliente:
+                raise ValueError(f"Ya existe un cliente con ID {valor}")
+        elif atributo == '_email' and _clave_email(valor):
+            if self._por_email.get(_clave_email(valor), cliente) is not cliente:
+                raise ValueError(f"El email {valor} ya está registrado")
+
+    def quitar(self, cliente: Cliente):
+        """Quita un cliente del registro (sin efecto si no pertenece a él)"""
+        if cliente._registro is not self:
+            return
+        self._desindexar(cliente)
+        cliente._registro = None
+        self._total -= 1
+
+    def __len__(self):
+        return self._total
+
+    def __iter__(self) -> Iterator[Cliente]:
+        return iter(self._por_nombre.valores())
+
+    def __contains__(self, cliente) -> bool:
+        return isinstance(cliente, Cliente) and cliente._registro is self
+
+    # ==================== ÍNDICES ====================
+
+    @staticmethod
+    def _agregar_a(indice: Dict[str, Dict[int, Cliente]], clave: str, cliente: Cliente) -> bool:
+        """Agrega a un índice de varios valores; True si la clave es nueva"""
+        grupo = indice.get(clave)
+        if grupo is None:
+            indice[clave] = {id(cliente): cliente}
+            return True
+        grupo[id(cliente)] = cliente
+        return False
+
+    @staticmethod
+    def _quitar_de(indice: Dict[str, Dict[int, Cliente]], clave: str, cliente: Cliente) -> bool:
+        """Quita de un índice de varios valores; True si la clave quedó vacía"""
+        grupo = indice.get(clave)
+        if grupo is None:
+            return False
+        grupo.pop(id(cliente), None)
+        if not grupo:
+            del indice[clave]
+            return True
+        return False
+
+    def _indexar(self, cliente: Cliente, ordenar: bool = True):
+        """
+        Agrega el cliente a todos los índices (llamado también por Cliente)
+
+        Quien llama ya verificó que el id y el email no pertenecen a otro
+        cliente (ver _verificar_nuevo y _verificar_cambio).
+
+        Con ordenar=False no se tocan las estructuras ordenadas; quien llama
+        debe reconstruirlas (ver agregar_varios).
+        """
+        if cliente.id_cliente is not None:
+            self._por_id[cliente.id_cliente] = cliente
+        if cliente.email:
+            self._por_email[_clave_email(cliente.email)] = cliente
+            dominio = cliente.dominio_email()
+            if dominio:
+                self._agregar_a(self._por_dominio, dominio.lower(), cliente)
+        digitos = _NO_DIGITOS.sub("", cliente.telefono or "")
+        if digitos:
+            self._agregar_a(self._por_telefono, digitos, cliente)
+        for palabra in set(_palabras(cliente.nombre_completo())):
+            if self._agregar_a(self._por_palabra, palabra, cliente) and ordenar:
+                bisect.insort(self._palabras_ordenadas, palabra)
+        if ordenar:
+            self._por_nombre.agregar(cliente)
+            self._por_apellido.agregar(cliente)
+
+    def _desindexar(self, cliente: Cliente):
+        """Quita el cliente de todos los índices con sus valores actuales"""
+        if self._por_id.get(cliente.id_cliente) is cliente:
+            del self._por_id[cliente.id_cliente]
+        clave_email = _clave_email(cliente.email)
+        if self._por_email.get(clave_email) is cliente:
+            del self._por_email[clave_email]
+        dominio = cliente.dominio_email()
+        if dominio:
+            self._quitar_de(self._por_dominio, dominio.lower(), cliente)
+        digitos = _NO_DIGITOS.sub("", cliente.telefono or "")
+        if digitos:
+            self._quitar_de(self._por_telefono, digitos, cliente)
+        for palabra in set(_palabras(cliente.nombre_completo())):
+            if self._quitar_de(self._por_palabra, palabra, cliente):
+                posicion = bisect.bisect_left(self._palabras_ordenadas, palabra)
+                del self._palabras_ordenadas[posicion]
+        self._por_nombre.quitar(cliente)
+        self._por_apellido.quitar(cliente)
+
+    # ==================== CONSULTAS ====================
+
+    def obtener(self, id_cliente: int) -> Optional[Cliente]:
+        """Cliente por ID, O(1)"""
+        return self._por_id.get(id_cliente)
+
+    def por_email(self, email: str) -> Optional[Cliente]:
+        """Cliente por email exacto (sin distinguir mayúsculas), O(1)"""
+        return self._por_email.get(_clave_email(email))
+
+    def por_dominio(self, dominio: str) -> List[Cliente]:
+        """Clientes cuyo email es del dominio exacto ('example.com'), O(k)"""
+        dominio = (dominio or "").strip().lower().lstrip("@")
+        return list(self._por_dominio.get(dominio, {}).values())
+
+    def por_telefono(self, telefono: str) -> List[Cliente]:
+        """Clientes con los mismos dígitos de teléfono ('1234-5678' = '12345678'), O(k)"""
+        digitos = _NO_DIGITOS.sub("", telefono or "")
+        return list(self._por_telefono.get(digitos, {}).values())
+
+    def _con_palabra_prefijo(self, prefijo: str) -> Dict[int, Cliente]:
+        """Clientes con alguna palabra del nombre que empieza con el prefijo"""
+        resultado = {}
+        inicio = bisect.bisect_left(self._palabras_ordenadas, prefijo)
+        for palabra in self._palabras_ordenadas[inicio:]:
+            if not palabra.startswith(prefijo):
+                break
+            resultado.update(self._por_palabra[palabra])
+        return resultado
+
+    def buscar_por_nombre(self, texto: str) -> List[Cliente]:
+        """
+        Clientes cuyo nombre completo tiene, para cada palabra buscada, una
+        palabra que empieza con ella ('jua pe' encuentra 'Juan Pérez')
+
+        No distingue mayúsculas ni acentos. El costo es O(log n + k) por
+        palabra buscada, con k el número de coincidencias.
+
+        Returns:
+            List[Cliente]: Coincidencias ordenadas por nombre completo
+        """
+        palabras = _palabras(texto)
+        if not palabras:
+            return []
+
+        # Empezar por la palabra más larga, que suele ser la más selectiva
+        palabras.sort(key=len, reverse=True)
+        encontrados = self._con_palabra_prefijo(palabras[0])
+        for palabra in palabras[1:]:
+            if not encontrados:
+                break
+            siguientes = self._con_palabra_prefijo(palabra)
+            encontrados = {ident: c for ident, c in encontrados.items() if ident in siguientes}
+
+        return sorted(encontrados.values(), key=Cliente.clave_orden)
+
+    def con_prefijo_nombre(self, prefijo: str) -> List[Cliente]:
+        """Clientes cuyo nombre completo empieza con el prefijo, en orden, O(log n + k)"""
+        return self._por_nombre.con_prefijo((prefijo or "").lower())
+
+    def ordenados(self, por: str = 'nombre') -> List[Cliente]:
+        """
+        Clientes en orden, sin volver a ordenar
+
+        Args:
+            por (str): 'nombre' (nombre completo) o 'apellido'
+
+        Raises:
+            ValueError: Si el criterio no es válido
+        """
+        if por == 'nombre':
+            return self._por_nombre.valores()
+        if por == 'apellido':
+            return self._por_apellido.valores()
+        raise ValueError(f"Criterio de orden inválido: {por}")
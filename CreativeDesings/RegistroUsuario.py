@@ -1,55 +1,119 @@
 from Administrador import Administrador
 
 class RegistroUsuario:
-    def __init__(self):
-        # Listas para almacenar usuarios
-        self.usuarios_admin = []
+    def __init__(self, almacen=None):
+        """
+        Args:
+            almacen (AlmacenUsuarios, optional): Persistencia de los usuarios;
+                sin almacén el registro solo vive en memoria
+        """
+        self.almacen = almacen
+        # Usuarios en orden de registro: posición -> administrador
+        self._usuarios = {}
+        # Índice por nombre de usuario normalizado -> posición en _usuarios
+        self._por_usuario = {}
+        self._siguiente_posicion = 0
+        # Los IDs nunca se reutilizan, aunque se elimine el último usuario
+        self._siguiente_id = 1
         
-        # Administrador por defecto
-        admin_default = Administrador(1, "Administrador Principal", "admin", "admin123", "administrador")
-        self.usuarios_admin.append(admin_default)
+        if almacen is not None:
+            # Carga en bloque de los usuarios guardados
+            for datos in almacen.cargar():
+                admin = Administrador.desde_dict(datos)
+                if admin is not None:
+                    self._agregar(admin)
+                    if 'password_hash' not in datos:
+                        # Registro del formato anterior con contraseña en texto plano
+                        self._persistir(admin)
+            self._siguiente_id = max(self._siguiente_id, almacen.ultimo_id + 1)
+        
+        if not self._usuarios:
+            # Administrador por defecto
+            admin_default = Administrador(1, "Administrador Principal", "admin", "admin123", "administrador")
+            self._agregar(admin_default)
+            self._persistir(admin_default)
+    
+    @staticmethod
+    def _normalizar(usuario):
+        """Forma del nombre de usuario usada como clave (igual que en Administrador)"""
+        return usuario.strip().lower() if usuario else ""
+    
+    def _agregar(self, administrador):
+        """Agrega un administrador al final del registro"""
+        posicion = self._siguiente_posicion
+        self._siguiente_posicion += 1
+        self._usuarios[posicion] = administrador
+        self._por_usuario[self._normalizar(administrador.usuario)] = posicion
+        if administrador.id_admin and administrador.id_admin >= self._siguiente_id:
+            self._siguiente_id = administrador.id_admin + 1
+    
+    def _persistir(self, administrador):
+        """Escribe solo el usuario modificado en el almacén, si hay uno"""
+        if self.almacen is not None:
+            self.almacen.guardar(administrador.to_dict())
+    
+    def guardar_cambios(self, administrador):
+        """Persiste cambios hechos directamente en un usuario (p. ej. tras un login)"""
+        if self.buscar_por_usuario(administrador.usuario) is not administrador:
+            return False
+        self._persistir(administrador)
+        return True
+    
+    @property
+    def usuarios_admin(self):
+        """Lista de usuarios en orden de registro (copia de solo lectura)"""
+        return list(self._usuarios.values())
     
-    def validar_datos_registro(self, usuario, password):
-        """Valida los datos antes de registrar"""
+    def validar_datos_registro(self, usuario, password=None):
+        """
+        Valida los datos antes de registrar
+        
+        Args:
+            usuario (str): Nombre de usuario
+            password (str, optional): Contraseña en texto plano; registrar()
+                no la pasa porque el administrador solo guarda el hash
+        """
         # Verificar si el usuario ya existe
-        for admin in self.usuarios_admin:
-            if admin.usuario == usuario:
-                return False, "El usuario ya existe"
+        if self._normalizar(usuario) in self._por_usuario:
+            return False, "El usuario ya existe"
         
         # Validar longitud de contraseña
-        if len(password) < 5:
-            return False, "La contraseña debe tener al menos 5 caracteres"
+        if password is not None and len(password) < Administrador.MIN_LONGITUD_PASSWORD:
+            return False, f"La contraseña debe tener al menos {Administrador.MIN_LONGITUD_PASSWORD} caracteres"
         
         return True, "Datos válidos"
     
     def registrar(self, administrador):
         """Registra un nuevo administrador/usuario"""
-        es_valido, mensaje = self.validar_datos_registro(
-            administrador.usuario, 
-            administrador.password
-        )
+        es_valido, mensaje = self.validar_datos_registro(administrador.usuario)
+        if es_valido:
+            # Resultado de validar la contraseña cuando se asignó
+            es_valido, mensaje = administrador.validar_password()
         
         if not es_valido:
             print(f"Error: {mensaje}")
             return False
         
         # Asignar ID automático
-        if len(self.usuarios_admin) > 0:
-            ultimo_id = max(admin.id_admin for admin in self.usuarios_admin if admin.id_admin)
-            administrador.id_admin = ultimo_id + 1
-        else:
-            administrador.id_admin = 1
+        administrador.id_admin = self._siguiente_id
         
-        # Agregar a la lista
-        self.usuarios_admin.append(administrador)
+        # Agregar al registro
+        self._persistir(administrador)
+        self._agregar(administrador)
         return True
     
     def validar_login(self, usuario, password):
         """Valida las credenciales de inicio de sesión"""
-        for admin in self.usuarios_admin:
-            if admin.usuario == usuario and admin.password == password:
-                return admin
-        return None
+        admin = self.buscar_por_usuario(usuario)
+        if admin is None:
+            return None
+        hash_anterior = admin.password_hash
+        if not admin.verificar_password(password):
+            return None
+        if admin.password_hash != hash_anterior:
+            # Se actualizó el hash al costo actual
+            self._persistir(admin)
+        return admin
     
     def listar_usuarios(self):
         """Lista todos los usuarios registrados"""
@@ -57,23 +121,38 @@ class RegistroUsuario:
     
     def buscar_por_usuario(self, usuario):
         """Busca un usuario por nombre de usuario"""
-        for admin in self.usuarios_admin:
-            if admin.usuario == usuario:
-                return admin
-        return None
+        posicion = self._por_usuario.get(self._normalizar(usuario))
+        if posicion is None:
+            return None
+        return self._usuarios[posicion]
     
     def actualizar_usuario(self, usuario_antiguo, usuario_nuevo):
-        """Actualiza los datos de un usuario"""
-        for i, admin in enumerate(self.usuarios_admin):
-            if admin.usuario == usuario_antiguo:
-                self.usuarios_admin[i] = usuario_nuevo
-                return True
-        return False
+        """Actualiza los datos de un usuario, conservando su lugar en la lista"""
+        clave_antigua = self._normalizar(usuario_antiguo)
+        clave_nueva = self._normalizar(usuario_nuevo.usuario)
+        posicion = self._por_usuario.get(clave_antigua)
+        if posicion is None:
+            return False
+        
+        # El nuevo nombre de usuario no puede pertenecer a otro usuario
+        if clave_nueva != clave_antigua and clave_nueva in self._por_usuario:
+            return False
+        
+        if self.almacen is not None and clave_nueva != clave_antigua:
+            self.almacen.eliminar(clave_antigua)
+        self._persistir(usuario_nuevo)
+        
+        del self._por_usuario[clave_antigua]
+        self._por_usuario[clave_nueva] = posicion
+        self._usuarios[posicion] = usuario_nuevo
+        return True
     
     def eliminar_usuario(self, usuario):
         """Elimina un usuario del sistema"""
-        for i, admin in enumerate(self.usuarios_admin):
-            if admin.usuario == usuario:
-                del self.usuarios_admin[i]
-                return True
-        return False
\ No newline at end of file
+        posicion = self._por_usuario.pop(self._normalizar(usuario), None)
+        if posicion is None:
+            return False
+        del self._usuarios[posicion]
+        if self.almacen is not None:
+            self.almacen.eliminar(self._normalizar(usuario))
+        return True
\ No newline at end of file
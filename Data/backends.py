@@ -0,0 +1,359 @@
+"""
+BACKENDS DE ALMACENAMIENTO - Creative Designs
+Motores de base de datos intercambiables para la capa de datos
+
+Descripción: Conexion delega la apertura de conexiones en un backend. El
+backend MySQL es el de producción; el backend SQLite (archivo o :memory:)
+carga el esquema de basedeDatos.sql y permite ejecutar ProductoDAO y
+ClienteDAO sin un servidor MySQL, para pruebas de carga y benchmarks.
+"""
+
+import os
+import re
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional, Type
+
+from Data.configuracion import obtener_configuracion
+
+logger = logging.getLogger(__name__)
+
+# Esquema por defecto: basedeDatos.sql en la raíz del proyecto
+RUTA_ESQUEMA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "basedeDatos.sql")
+
+
+class Backend:
+    """
+    Interfaz de un backend de base de datos
+
+    Las conexiones retornadas por conectar() deben ofrecer la interfaz que
+    usan los DAO: cursor(), commit(), rollback(), close(), is_connected()
+    y get_server_info(); sus cursores aceptan marcadores %s.
+    """
+
+    nombre = "base"
+
+    @property
+    def Error(self):
+        """Clase base de las excepciones de la base de datos"""
+        return Exception
+
+    def conectar(self, conexion):
+        """
+        Abre una conexión
+
+        Args:
+            conexion (Conexion): Configuración de conexión (host, usuario, etc.)
+        """
+        raise NotImplementedError
+
+    def es_transitorio(self, error: Exception) -> bool:
+        """Indica si vale la pena reintentar tras este error"""
+        return False
+
+    def descripcion(self, conexion) -> str:
+        """Texto para mensajes de diagnóstico"""
+        return self.nombre
+
+    def cerrar(self):
+        """Libera los recursos del backend"""
+        pass
+
+
+class BackendMySQL(Backend):
+    """Backend MySQL mediante mysql.connector (importado al primer uso)"""
+
+    nombre = "mysql"
+
+    # Errores que suelen desaparecer al reintentar: servidor inaccesible o
+    # reiniciándose, conexión perdida, demasiadas conexiones, bloqueos
+    ERRORES_TRANSITORIOS = {1040, 1053, 1205, 1213, 2002, 2003, 2006, 2013, 2055}
+
+    def __init__(self):
+        self._modulo = None
+
+    def _connector(self):
+        if self._modulo is None:
+            import mysql.connector
+            self._modulo = mysql.connector
+        return self._modulo
+
+    @property
+    def Error(self):
+        return self._connector().Error
+
+    def conectar(self, conexion):
+        return self._connector().connect(
+            host=conexion.host,
+            database=conexion.database,
+            user=conexion.user,
+            password=conexion.password,
+            port=conexion.port,
+            charset=conexion.charset,
+            connection_timeout=conexion.timeout_conexion
+        )
+
+    def es_transitorio(self, error: Exception) -> bool:
+        return getattr(error, "errno", None) in self.ERRORES_TRANSITORIOS
+
+    def descripcion(self, conexion) -> str:
+        return f"host={conexion.host}, user={conexion.user}, db={conexion.database}"
+
+
+class _CursorSQLite:
+    """Cursor de sqlite3 que acepta los marcadores %s de MySQL"""
+
+    # Traducciones de SQL ya realizadas (compartidas entre cursores)
+    _traducciones = {}
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    @classmethod
+    def traducir(cls, sql):
+        traducido = cls._traducciones.get(sql)
+        if traducido is None:
+            traducido = sql.replace("%s", "?")
+            if len(cls._traducciones) < 2048:
+                cls._traducciones[sql] = traducido
+        return traducido
+
+    def execute(self, sql, params=None):
+        self._cursor.execute(self.traducir(sql), params or ())
+        return self
+
+    def executemany(self, sql, lista_params):
+        self._cursor.executemany(self.traducir(sql), lista_params)
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, tamano=None):
+        return self._cursor.fetchmany(tamano or self._cursor.arraysize)
+
+    def close(self):
+        self._cursor.close()
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+
+class _ConexionSQLite:
+    """
+    Conexión SQLite con la interfaz de mysql.connector usada por los DAO
+
+    Cada Conexion recibe su propia conexión sqlite3, así que las
+    transacciones de una no se mezclan con las de otra.
+    """
+
+    def __init__(self, backend, conn):
+        self._backend = backend
+        self._conn = conn
+
+    def is_connected(self):
+        return self._conn is not None and self._backend.abierta
+
+    def get_server_info(self):
+        return f"SQLite {sqlite3.sqlite_version}"
+
+    def cursor(self, *args, **kwargs):
+        # prepared=True se ignora: sqlite3 ya cachea las sentencias compiladas
+        return _CursorSQLite(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class BackendSQLite(Backend):
+    """
+    Backend SQLite en archivo o en memoria
+
+    Cada conectar() abre una conexión sqlite3 independiente. Una base en
+    memoria se comparte entre las conexiones del backend con una URI
+    'file:...?mode=memory&cache=shared'; el backend mantiene abierta una
+    conexión propia para que la base no desaparezca cuando los DAO se
+    desconectan, hasta que se llame a cerrar().
+
+    Atributos:
+        ruta (str): Archivo de la base de datos o ':memory:'
+        ruta_esquema (str): Script SQL a cargar si la base está vacía
+    """
+
+    nombre = "sqlite"
+
+    def __init__(self, ruta: str = ":memory:", ruta_esquema: Optional[str] = RUTA_ESQUEMA):
+        self.ruta = ruta
+        self.ruta_esquema = ruta_esquema
+        self._en_memoria = ruta == ":memory:"
+        # Nombre único: cada backend en memoria es una base distinta
+        self._uri = f"file:creative_designs_{id(self):x}?mode=memory&cache=shared" if self._en_memoria else None
+        # Conexión que crea el esquema y, en memoria, mantiene viva la base
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def Error(self):
+        return sqlite3.Error
+
+    @property
+    def abierta(self):
+        return self._conn is not None
+
+    def _abrir(self):
+        if self._en_memoria:
+            conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.ruta, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def conectar(self, conexion=None):
+        with self._lock:
+            if self._conn is None:
+                conn = self._abrir()
+                if not self._en_memoria:
+                    conn.execute("PRAGMA journal_mode = WAL")
+                self._conn = conn
+                if self.ruta_esquema and not self._tiene_tablas():
+                    self.cargar_esquema(self.ruta_esquema)
+        return _ConexionSQLite(self, self._abrir())
+
+    def _tiene_tablas(self):
+        fila = self._conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'clientes'"
+        ).fetchone()
+        return fila[0] > 0
+
+    @staticmethod
+    def traducir_esquema(sql: str) -> str:
+        """
+        Convierte un script de esquema MySQL al dialecto de SQLite
+
+        Args:
+            sql (str): Script MySQL (como basedeDatos.sql)
+
+        Returns:
+            str: Script ejecutable por sqlite3.executescript
+        """
+        sql = re.sub(r"(?im)^\s*(CREATE\s+DATABASE|USE)\b[^;]*;", "", sql)
+        sql = re.sub(r"(?i)\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b",
+                     "INTEGER PRIMARY KEY AUTOINCREMENT", sql)
+        sql = re.sub(r"(?i)\bUNIQUE\s+KEY\s+(\w+)\s*\(", r"CONSTRAINT \1 UNIQUE (", sql)
+        sql = re.sub(r"(?i)\)\s*ENGINE\s*=\s*\w+[^;]*;", ");", sql)
+        return sql
+
+    def cargar_esquema(self, ruta: str):
+        """
+        Crea las tablas y datos iniciales a partir de un script MySQL
+
+        Args:
+            ruta (str): Ruta del script SQL
+        """
+        with open(ruta, "r", encoding="utf-8") as f:
+            script = self.traducir_esquema(f.read())
+        self._conn.executescript(script)
+        self._conn.commit()
+        logger.info(f"Esquema cargado en SQLite desde {ruta}")
+
+    def es_transitorio(self, error: Exception) -> bool:
+        mensaje = str(error).lower()
+        return isinstance(error, sqlite3.OperationalError) and ("locked" in mensaje or "busy" in mensaje)
+
+    def descripcion(self, conexion=None) -> str:
+        return f"sqlite={self.ruta}"
+
+    def cerrar(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ==================== REGISTRO DE BACKENDS ====================
+
+_BACKENDS: Dict[str, Type[Backend]] = {
+    BackendMySQL.nombre: BackendMySQL,
+    BackendSQLite.nombre: BackendSQLite,
+}
+
+_backend_actual: Optional[Backend] = None
+
+
+def registrar_backend(nombre: str, clase: Type[Backend]):
+    """
+    Registra un tipo de backend para crearlo por nombre
+
+    Args:
+        nombre (str): Nombre del backend
+        clase (type): Subclase de Backend
+    """
+    _BACKENDS[nombre.lower()] = clase
+
+
+def crear_backend(nombre: str, **opciones) -> Backend:
+    """
+    Crea un backend registrado
+
+    Args:
+        nombre (str): 'mysql', 'sqlite' u otro registrado
+        opciones: Argumentos del constructor del backend
+
+    Raises:
+        ValueError: Si el backend no está registrado
+    """
+    clase = _BACKENDS.get(nombre.lower())
+    if clase is None:
+        raise ValueError(f"Backend desconocido: {nombre}. Disponibles: {', '.join(_BACKENDS)}")
+    return clase(**opciones)
+
+
+def configurar_backend(backend: Backend):
+    """
+    Define el backend que usarán las conexiones creadas a partir de ahora
+
+    Ejemplo:
+        configurar_backend(BackendSQLite(':memory:'))
+        dao = ClienteDAO()
+    """
+    global _backend_actual
+    _backend_actual = backend
+
+
+def obtener_backend() -> Backend:
+    """
+    Retorna el backend configurado
+
+    Si no se llamó a configurar_backend(), se crea según CD_DB_BACKEND
+    (ver Data/configuracion.py); por defecto MySQL.
+    """
+    global _backend_actual
+    if _backend_actual is None:
+        config = obtener_configuracion()
+        if config.backend.lower() == BackendSQLite.nombre:
+            _backend_actual = crear_backend(config.backend, ruta=config.ruta_sqlite)
+        else:
+            _backend_actual = crear_backend(config.backend)
+    return _backend_actual
@@ -0,0 +1,367 @@
+"""
+CACHÉ DE LECTURA - Creative Designs
+Estructuras de caché en memoria usadas por la capa de datos
+
+Descripción: Caché LRU con expiración (TTL), límite de tamaño, métricas de
+aciertos y un contador de versión compartible entre procesos para detectar
+datos obsoletos; filtro de Bloom y conteo de filas mantenido en memoria.
+"""
+
+import os
+import math
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Marcador para distinguir "no está en caché" de un valor None almacenado
+_AUSENTE = object()
+
+
+class ContadorVersion:
+    """
+    Contador de versión de los datos cacheados
+
+    Cada escritura incrementa la versión. Si se indica una ruta de archivo,
+    la versión se comparte entre procesos: cada proceso compara la versión
+    con la que llenó su caché y la descarta si otro proceso escribió.
+
+    Atributos:
+        ruta (str): Archivo donde se guarda la versión (None = solo en proceso)
+    """
+
+    def __init__(self, ruta: Optional[str] = None):
+        self.ruta = ruta
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def actual(self) -> int:
+        """
+        Retorna la versión vigente
+
+        Con archivo se lee siempre el número guardado en él: la fecha de
+        modificación no basta para detectar dos escrituras seguidas, porque
+        su resolución puede ser más gruesa que el intervalo entre ellas.
+
+        Returns:
+            int: Número de versión
+        """
+        if not self.ruta:
+            return self._version
+
+        try:
+            with open(self.ruta, "r", encoding="utf-8") as f:
+                contenido = f.read().strip()
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.warning(f"No se pudo leer la versión de caché: {e}")
+            return self._version
+
+        # Vacío solo mientras otro proceso reescribe el archivo
+        if contenido:
+            try:
+                self._version = int(contenido)
+            except ValueError as e:
+                logger.warning(f"Versión de caché ilegible: {e}")
+        return self._version
+
+    def incrementar(self) -> int:
+        """
+        Incrementa la versión y la publica para los demás procesos
+
+        Returns:
+            int: Nueva versión
+        """
+        with self._lock:
+            if not self.ruta:
+                self._version += 1
+                return self._version
+
+            try:
+                directorio = os.path.dirname(self.ruta)
+                if directorio:
+                    os.makedirs(directorio, exist_ok=True)
+                with open(self.ruta, "a+", encoding="utf-8") as f:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_EX)
+                    f.seek(0)
+                    contenido = f.read().strip()
+                    self._version = (int(contenido) if contenido else 0) + 1
+                    f.seek(0)
+                    f.truncate()
+                    f.write(str(self._version))
+                    f.flush()
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+            except (OSError, ValueError) as e:
+                logger.error(f"No se pudo publicar la versión de caché: {e}")
+                self._version += 1
+            return self._version
+
+
+class CacheLRU:
+    """
+    Caché LRU con expiración por tiempo y límite de entradas
+
+    Atributos:
+        max_entradas (int): Número máximo de entradas antes de desalojar
+        ttl (float): Segundos de vida de cada entrada (None = sin expiración)
+        version (ContadorVersion): Contador para invalidar entre procesos
+    """
+
+    def __init__(self, max_entradas: int = 256, ttl: Optional[float] = 300.0,
+                 version: Optional[ContadorVersion] = None):
+        if max_entradas <= 0:
+            raise ValueError("max_entradas debe ser mayor que cero")
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self.version = version or ContadorVersion()
+        self._datos = OrderedDict()
+        self._lock = threading.RLock()
+        self._version_local = self.version.actual()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.expiraciones = 0
+        self.invalidaciones = 0
+
+    def __len__(self):
+        return len(self._datos)
+
+    def __contains__(self, clave):
+        return self.obtener(clave, _AUSENTE, contar=False) is not _AUSENTE
+
+    def _sincronizar_version(self):
+        """Vacía la caché si otro proceso publicó una versión nueva"""
+        version = self.version.actual()
+        if version != self._version_local:
+            if self._datos:
+                logger.info(f"Caché obsoleta (versión {self._version_local} -> {version}), se vacía")
+            self._datos.clear()
+            self._version_local = version
+
+    def obtener(self, clave: Hashable, defecto: Any = None, contar: bool = True) -> Any:
+        """
+        Busca una entrada en la caché
+
+        Args:
+            clave: Clave de la entrada
+            defecto: Valor a retornar si no existe o expiró
+            contar (bool): Si la consulta cuenta para las métricas
+
+        Returns:
+            Valor almacenado o el valor por defecto
+        """
+        with self._lock:
+            self._sincronizar_version()
+            entrada = self._datos.get(clave, _AUSENTE)
+
+            if entrada is not _AUSENTE:
+                valor, expira = entrada
+                if expira is not None and expira <= time.monotonic():
+                    del self._datos[clave]
+                    self.expiraciones += 1
+                else:
+                    self._datos.move_to_end(clave)
+                    if contar:
+                        self.aciertos += 1
+                    return valor
+
+            if contar:
+                self.fallos += 1
+            return defecto
+
+    def guardar(self, clave: Hashable, valor: Any):
+        """
+        Guarda una entrada desalojando la menos usada si se excede el límite
+
+        Args:
+            clave: Clave de la entrada
+            valor: Valor a almacenar
+        """
+        with self._lock:
+            self._sincronizar_version()
+            expira = time.monotonic() + self.ttl if self.ttl else None
+            self._datos[clave] = (valor, expira)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+                self.desalojos += 1
+
+    def obtener_o_cargar(self, clave: Hashable, cargar: Callable[[], Any],
+                         cachear: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Lectura a través de la caché: si no hay entrada se llama a cargar()
+
+        Args:
+            clave: Clave de la entrada
+            cargar (callable): Función que obtiene el valor desde la fuente
+            cachear (callable, optional): Recibe el valor cargado e indica si
+                debe guardarse (p. ej. False tras un error de lectura)
+
+        Returns:
+            Valor cacheado o recién cargado
+        """
+        valor = self.obtener(clave, _AUSENTE)
+        if valor is _AUSENTE:
+            version = self._version_local
+            valor = cargar()
+            if cachear is not None and not cachear(valor):
+                return valor
+            # No guardar si hubo una escritura (de este u otro proceso)
+            # mientras se cargaba
+            with self._lock:
+                self._sincronizar_version()
+                if version == self._version_local:
+                    self.guardar(clave, valor)
+        return valor
+
+    def invalidar(self, *claves: Hashable):
+        """
+        Elimina entradas específicas de esta caché
+
+        Args:
+            claves: Claves a eliminar
+        """
+        with self._lock:
+            for clave in claves:
+                if self._datos.pop(clave, _AUSENTE) is not _AUSENTE:
+                    self.invalidaciones += 1
+
+    def invalidar_si(self, condicion: Callable[[Hashable], bool]):
+        """
+        Elimina las entradas cuya clave cumpla la condición
+
+        Args:
+            condicion (callable): Función que recibe la clave
+        """
+        with self._lock:
+            for clave in [c for c in self._datos if condicion(c)]:
+                del self._datos[clave]
+                self.invalidaciones += 1
+
+    def publicar_cambio(self):
+        """
+        Publica una nueva versión para que otros procesos descarten su caché
+
+        La caché local conserva sus entradas (ya invalidadas con precisión).
+        """
+        with self._lock:
+            self._version_local = self.version.incrementar()
+
+    def limpiar(self):
+        """Vacía la caché por completo"""
+        with self._lock:
+            self.invalidaciones += len(self._datos)
+            self._datos.clear()
+
+    def estadisticas(self) -> Dict:
+        """
+        Retorna métricas de uso de la caché
+
+        Returns:
+            dict: Aciertos, fallos, tasa de aciertos, tamaño y desalojos
+        """
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                'entradas': len(self._datos),
+                'max_entradas': self.max_entradas,
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+                'desalojos': self.desalojos,
+                'expiraciones': self.expiraciones,
+                'invalidaciones': self.invalidaciones,
+                'version': self._version_local
+            }
+
+
+class FiltroBloom:
+    """
+    Filtro de Bloom para descartar rápidamente claves inexistentes
+
+    Un resultado negativo es definitivo; uno positivo debe confirmarse en la
+    fuente de datos. No admite eliminaciones.
+
+    Atributos:
+        bits (int): Tamaño del arreglo de bits
+        funciones (int): Número de funciones hash
+    """
+
+    def __init__(self, capacidad: int = 10000, tasa_error: float = 0.01):
+        capacidad = max(capacidad, 1)
+        self.bits = max(8, int(-capacidad * math.log(tasa_error) / (math.log(2) ** 2)))
+        self.funciones = max(1, round(self.bits / capacidad * math.log(2)))
+        self._arreglo = bytearray((self.bits + 7) // 8)
+        self.elementos = 0
+
+    def _posiciones(self, clave: str):
+        """Genera las posiciones de bits con doble hashing sobre blake2b"""
+        digest = hashlib.blake2b(clave.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.funciones):
+            yield (h1 + i * h2) % self.bits
+
+    def agregar(self, clave: str):
+        """Agrega una clave al filtro"""
+        for posicion in self._posiciones(clave):
+            self._arreglo[posicion >> 3] |= 1 << (posicion & 7)
+        self.elementos += 1
+
+    def __contains__(self, clave: str) -> bool:
+        return all(self._arreglo[p >> 3] & (1 << (p & 7)) for p in self._posiciones(clave))
+
+
+class ContadorMantenido:
+    """
+    Total de filas mantenido en memoria
+
+    Se ajusta con cada alta o baja hecha desde el proceso y caduca tras
+    'reconciliar' segundos, momento en que debe volver a contarse en la base
+    de datos para absorber los cambios hechos por otros procesos.
+
+    Atributos:
+        reconciliar (float): Segundos de validez de un conteo
+    """
+
+    def __init__(self, reconciliar: float = 300.0):
+        self.reconciliar = reconciliar
+        self._valor = None
+        self._contado_en = 0.0
+        self._lock = threading.Lock()
+
+    def obtener(self) -> Optional[int]:
+        """Retorna el total, o None si no se conoce o debe reconciliarse"""
+        with self._lock:
+            if self._valor is None or time.monotonic() - self._contado_en >= self.reconciliar:
+                return None
+            return self._valor
+
+    def fijar(self, valor: int):
+        """Guarda un conteo recién hecho en la base de datos"""
+        with self._lock:
+            self._valor = valor
+            self._contado_en = time.monotonic()
+
+    def ajustar(self, delta: int):
+        """Suma (o resta) filas tras una escritura; sin efecto si no hay conteo"""
+        with self._lock:
+            if self._valor is not None:
+                self._valor = max(0, self._valor + delta)
+
+    def invalidar(self):
+        """Obliga a contar de nuevo en la próxima lectura"""
+        with self._lock:
+            self._valor = None
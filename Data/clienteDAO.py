@@ -1,35 +1,31 @@
-import sys
-import os
+import re
+import time
 import logging
-from typing import List, Optional, Tuple, Dict
+import threading
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple, Dict
 
-# Agregar directorio raíz al path
-current_dir = os.path.dirname(os.path.abspath(_file_))
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+from Data.conexion import Conexion, MODO_LECTURA
+from Data.cache import CacheLRU, ContadorMantenido, FiltroBloom
+from Data.trigramas import IndiceTrigramas, solo_digitos
+from CreativeDesings.Cliente import AcumuladorEstadisticas, Cliente, validar_lote
 
-try:
-    from Data.conexion import Conexion
-except ImportError:
-    try:
-        from conexion import Conexion
-    except ImportError as e:
-        print(f"Error: No se pudo importar Conexion: {e}")
-        sys.exit(1)
+logger = logging.getLogger(__name__)
 
-try:
-    from Cliente import Cliente
-except ImportError as e:
-    print(f"Error: No se pudo importar Cliente: {e}")
-    print("Asegúrese de que Cliente.py esté en el directorio raíz")
-    sys.exit(1)
+# Palabras de una búsqueda por texto (descarta los operadores de MATCH ... AGAINST)
+_PALABRAS = re.compile(r"\w+", re.UNICODE)
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(_name_)
+# Consultas de lectura (Data/migraciones.py verifica su plan con EXPLAIN)
+_COLUMNAS = "id_cliente, nombre, apellido, telefono, email, direccion"
+SQL_LISTAR = f"SELECT {_COLUMNAS} FROM clientes ORDER BY nombre, apellido"
+SQL_ITERAR = f"SELECT {_COLUMNAS} FROM clientes WHERE id_cliente > %s ORDER BY id_cliente LIMIT %s"
+SQL_BUSCAR_POR_ID = f"SELECT {_COLUMNAS} FROM clientes WHERE id_cliente = %s"
+SQL_BUSCAR_POR_NOMBRE = (f"SELECT {_COLUMNAS} FROM clientes "
+                         f"WHERE nombre LIKE %s OR apellido LIKE %s ORDER BY nombre, apellido")
+SQL_BUSCAR_POR_EMAIL = f"SELECT {_COLUMNAS} FROM clientes WHERE email = %s"
+SQL_BUSCAR_POR_TELEFONO = f"SELECT {_COLUMNAS} FROM clientes WHERE telefono LIKE %s"
+SQL_EXISTE_EMAIL = "SELECT id_cliente FROM clientes WHERE email = %s LIMIT 1"
+SQL_LISTAR_PAGINADO = f"SELECT {_COLUMNAS} FROM clientes ORDER BY nombre, apellido LIMIT %s OFFSET %s"
 
 
 class ClienteDAOException(Exception):
@@ -44,6 +40,7 @@ class ClienteDAO:
     
     Métodos principales:
         - listar(): Obtiene todos los clientes
+        - iterar(): Recorre todos los clientes por lotes
         - buscar_por_id(): Busca un cliente por ID
         - buscar_por_nombre(): Busca clientes por nombre
         - buscar_por_email(): Busca cliente por email
@@ -51,13 +48,50 @@ class ClienteDAO:
         - insertar(): Inserta un nuevo cliente
         - actualizar(): Actualiza un cliente existente
         - eliminar(): Elimina un cliente
+        - sincronizar_lote(): Inserta o actualiza clientes en bloque por email
         - existe_email(): Verifica si un email ya existe
+        - cargar_filtro_emails(): Precarga el filtro de Bloom de emails
+        - puede_existir_email(): Consulta orientativa al filtro de Bloom
+        - cargar_indice_texto(): Precarga el índice de trigramas (SQLite)
         - contar(): Cuenta el total de clientes
+        - estadisticas(): Estadísticas de dominios, ciudades y antigüedad
         - buscar_avanzada(): Búsqueda con múltiples criterios
         - listar_paginado(): Lista con paginación
+    
+    Los emails consultados se guardan en una caché email -> id compartida por
+    todas las instancias del proceso, que se mantiene sincronizada en
+    insertar/actualizar/eliminar. Solo se cachean emails existentes: otro
+    proceso puede registrar un email en cualquier momento, así que un email
+    ausente se confirma siempre en la base de datos. Por la misma razón el
+    filtro de Bloom es solo orientativo y nunca evita esa consulta.
     """
     
-    def _init_(self):
+    # Caché de emails compartida en el proceso
+    _cache_emails = CacheLRU(max_entradas=10000, ttl=600.0)
+    # Filtro de Bloom opcional; orientativo, no sustituye a la consulta
+    _filtro_emails = None
+    # Índices de trigramas de buscar_avanzada(modo='texto') con backend SQLite
+    _indice_texto = None
+    _indice_telefonos = None
+    # Máximo de ids por consulta WHERE id_cliente IN (...)
+    TAMANO_LOTE_IDS = 500
+    # Total de clientes, ajustado en insertar/eliminar y recontado cada 5 minutos
+    _total_clientes = ContadorMantenido(reconciliar=300.0)
+    # Estadísticas de todos los clientes, ajustadas en insertar/actualizar/eliminar
+    # y recalculadas tras RECONCILIAR_ESTADISTICAS segundos
+    _estadisticas: Optional[AcumuladorEstadisticas] = None
+    # Fecha con que se contó cada cliente en _estadisticas: la tabla no guarda
+    # fecha_registro, así que un cliente leído de nuevo trae otra fecha
+    _fechas_estadisticas: Dict[int, datetime] = {}
+    _estadisticas_en = 0.0
+    _lock_estadisticas = threading.Lock()
+    RECONCILIAR_ESTADISTICAS = 300.0
+    # Resultados máximos por defecto de buscar_avanzada(modo='texto')
+    LIMITE_BUSQUEDA = 50
+    # Largo mínimo de palabra del índice FULLTEXT de InnoDB (innodb_ft_min_token_size)
+    MIN_PALABRA_FULLTEXT = 3
+    
+    def __init__(self):
         """Inicializa el DAO con la conexión a la base de datos"""
         try:
             self.conexion = Conexion()
@@ -66,6 +100,19 @@ class ClienteDAO:
             logger.error(f"Error al inicializar ClienteDAO: {e}")
             raise ClienteDAOException(f"No se pudo inicializar ClienteDAO: {e}")
     
+    def _consultar(self, sql: str, params: Optional[tuple] = None) -> list:
+        """
+        Ejecuta una lectura con Conexion.ejecutar_query, que reutiliza la
+        sentencia preparada de cada SQL mientras la conexión sigue abierta
+        
+        Raises:
+            ClienteDAOException: Si la consulta falla
+        """
+        exito, resultado = self.conexion.ejecutar_query(sql, params, MODO_LECTURA)
+        if not exito:
+            raise ClienteDAOException(resultado)
+        return resultado
+    
     # ==================== MÉTODOS DE LECTURA ====================
     
     def listar(self) -> List[Cliente]:
@@ -78,59 +125,48 @@ class ClienteDAO:
         Raises:
             ClienteDAOException: Si ocurre un error en la consulta
         """
-        clientes = []
-        conn = None
-        cursor = None
-        
         try:
-            conn = self.conexion.conectar()
-            if not conn:
-                raise ClienteDAOException("No se pudo establecer conexión con la base de datos")
-            
-            cursor = conn.cursor()
-            sql = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes 
-                ORDER BY nombre, apellido
-            """
-            
-            cursor.execute(sql)
-            resultados = cursor.fetchall()
+            resultados = self._consultar(SQL_LISTAR)
             
             logger.info(f"Se obtuvieron {len(resultados)} clientes de la base de datos")
-            
-            for row in resultados:
-                try:
-                    cliente = Cliente(
-                        id_cliente=row[0],
-                        nombre=row[1],
-                        apellido=row[2],
-                        telefono=row[3],
-                        email=row[4],
-                        direccion=row[5]
-                    )
-                    clientes.append(cliente)
-                except Exception as e:
-                    logger.warning(f"Error al crear objeto Cliente desde fila {row[0]}: {e}")
-                    continue
-            
-            return clientes
+            return self._crear_clientes(resultados)
             
         except Exception as e:
             logger.error(f"Error al listar clientes: {e}")
             raise ClienteDAOException(f"Error al obtener lista de clientes: {e}")
+    
+    def iterar(self, tamano_lote: int = 1000) -> Iterator[Cliente]:
+        """
+        Recorre todos los clientes sin cargarlos a la vez en memoria
+        
+        Lee lotes ordenados por id con WHERE id_cliente > último id leído, de
+        modo que cada lote usa la llave primaria en lugar de un OFFSET
+        creciente; todos los lotes reutilizan la misma sentencia preparada.
+        
+        Args:
+            tamano_lote (int): Clientes por consulta
             
-        finally:
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    pass
-            if conn:
-                try:
-                    self.conexion.desconectar()
-                except:
-                    pass
+        Yields:
+            Cliente: Clientes en orden de id
+            
+        Raises:
+            ClienteDAOException: Si ocurre un error en una consulta
+        """
+        ultimo_id = 0
+        
+        while True:
+            try:
+                filas = self._consultar(SQL_ITERAR, (ultimo_id, tamano_lote))
+            except ClienteDAOException as e:
+                logger.error(f"Error al recorrer clientes: {e}")
+                raise ClienteDAOException(f"Error al recorrer clientes: {e}")
+            
+            if not filas:
+                return
+            yield from self._crear_clientes(filas)
+            if len(filas) < tamano_lote:
+                return
+            ultimo_id = filas[-1][0]
     
     def buscar_por_id(self, id_cliente: int) -> Optional[Cliente]:
         """
@@ -149,26 +185,12 @@ class ClienteDAO:
         if not id_cliente or not isinstance(id_cliente, int) or id_cliente <= 0:
             raise ValueError("El ID del cliente debe ser un entero positivo")
         
-        conn = None
-        cursor = None
-        
         try:
-            conn = self.conexion.conectar()
-            if not conn:
-                raise ClienteDAOException("No se pudo establecer conexión con la base de datos")
-            
-            cursor = conn.cursor()
-            sql = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes 
-                WHERE id_cliente = %s
-            """
-            
-            cursor.execute(sql, (id_cliente,))
-            row = cursor.fetchone()
+            filas = self._consultar(SQL_BUSCAR_POR_ID, (id_cliente,))
             
-            if row:
+            if filas:
                 logger.info(f"Cliente con ID {id_cliente} encontrado")
+                row = filas[0]
                 return Cliente(
                     id_cliente=row[0],
                     nombre=row[1],
@@ -181,23 +203,9 @@ class ClienteDAO:
                 logger.info(f"No se encontró cliente con ID {id_cliente}")
                 return None
                 
-        except ValueError as e:
-            raise e
         except Exception as e:
             logger.error(f"Error al buscar cliente por ID {id_cliente}: {e}")
             raise ClienteDAOException(f"Error al buscar cliente: {e}")
-            
-        finally:
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    pass
-            if conn:
-                try:
-                    self.conexion.desconectar()
-                except:
-                    pass
     
     def buscar_por_nombre(self, nombre: str) -> List[Cliente]:
         """
@@ -215,61 +223,16 @@ class ClienteDAO:
         if not nombre or not isinstance(nombre, str):
             return []
         
-        clientes = []
-        conn = None
-        cursor = None
-        
         try:
-            conn = self.conexion.conectar()
-            if not conn:
-                raise ClienteDAOException("No se pudo establecer conexión con la base de datos")
-            
-            cursor = conn.cursor()
-            sql = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes 
-                WHERE nombre LIKE %s OR apellido LIKE %s
-                ORDER BY nombre, apellido
-            """
-            
             patron = f"%{nombre.strip()}%"
-            cursor.execute(sql, (patron, patron))
-            resultados = cursor.fetchall()
+            resultados = self._consultar(SQL_BUSCAR_POR_NOMBRE, (patron, patron))
             
             logger.info(f"Búsqueda de '{nombre}': {len(resultados)} resultados")
-            
-            for row in resultados:
-                try:
-                    cliente = Cliente(
-                        id_cliente=row[0],
-                        nombre=row[1],
-                        apellido=row[2],
-                        telefono=row[3],
-                        email=row[4],
-                        direccion=row[5]
-                    )
-                    clientes.append(cliente)
-                except Exception as e:
-                    logger.warning(f"Error al crear cliente desde búsqueda: {e}")
-                    continue
-            
-            return clientes
+            return self._crear_clientes(resultados)
             
         except Exception as e:
             logger.error(f"Error al buscar clientes por nombre '{nombre}': {e}")
             raise ClienteDAOException(f"Error en búsqueda por nombre: {e}")
-            
-        finally:
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    pass
-            if conn:
-                try:
-                    self.conexion.desconectar()
-                except:
-                    pass
     
     def buscar_por_email(self, email: str) -> Optional[Cliente]:
         """
@@ -284,25 +247,13 @@ class ClienteDAO:
         if not email or not isinstance(email, str):
             return None
         
-        conn = None
-        cursor = None
-        
+        email = email.strip().lower()
         try:
-            conn = self.conexion.conectar()
-            if not conn:
-                raise ClienteDAOException("No se pudo establecer conexión")
-            
-            cursor = conn.cursor()
-            sql = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes 
-                WHERE email = %s
-            """
-            
-            cursor.execute(sql, (email.strip().lower(),))
-            row = cursor.fetchone()
+            filas = self._consultar(SQL_BUSCAR_POR_EMAIL, (email,))
             
-            if row:
+            if filas:
+                row = filas[0]
+                self._registrar_email(email, row[0])
                 return Cliente(
                     id_cliente=row[0],
                     nombre=row[1],
@@ -316,18 +267,6 @@ class ClienteDAO:
         except Exception as e:
             logger.error(f"Error al buscar por email: {e}")
             return None
-            
-        finally:
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    pass
-            if conn:
-                try:
-                    self.conexion.desconectar()
-                except:
-                    pass
     
     def buscar_por_telefono(self, telefono: str) -> List[Cliente]:
         """
@@ -342,57 +281,13 @@ class ClienteDAO:
         if not telefono:
             return []
         
-        clientes = []
-        conn = None
-        cursor = None
-        
         try:
-            conn = self.conexion.conectar()
-            if not conn:
-                return []
-            
-            cursor = conn.cursor()
-            sql = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes 
-                WHERE telefono LIKE %s
-            """
-            
             patron = f"%{telefono}%"
-            cursor.execute(sql, (patron,))
-            resultados = cursor.fetchall()
-            
-            for row in resultados:
-                try:
-                    cliente = Cliente(
-                        id_cliente=row[0],
-                        nombre=row[1],
-                        apellido=row[2],
-                        telefono=row[3],
-                        email=row[4],
-                        direccion=row[5]
-                    )
-                    clientes.append(cliente)
-                except:
-                    continue
-            
-            return clientes
+            return self._crear_clientes(self._consultar(SQL_BUSCAR_POR_TELEFONO, (patron,)))
             
         except Exception as e:
             logger.error(f"Error al buscar por teléfono: {e}")
             return []
-            
-        finally:
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    pass
-            if conn:
-                try:
-                    self.conexion.desconectar()
-                except:
-                    pass
     
     # ==================== MÉTODOS DE ESCRITURA ====================
     
@@ -421,6 +316,9 @@ class ClienteDAO:
         cursor = None
         
         try:
+            # Las verificaciones previas se leen de la primaria
+            self.conexion.marcar_escritura()
+            
             # Verificar si el email ya existe
             if self.existe_email(cliente.email):
                 return False, f"El email {cliente.email} ya está registrado"
@@ -448,6 +346,10 @@ class ClienteDAO:
             
             # Obtener el ID generado
             cliente.id_cliente = cursor.lastrowid
+            self._registrar_email(cliente.email.lower(), cliente.id_cliente)
+            self._indexar_texto(cliente)
+            self._total_clientes.ajustar(1)
+            self._ajustar_estadisticas(agregar=cliente)
             
             logger.info(f"Cliente insertado exitosamente con ID {cliente.id_cliente}")
             return True, f"Cliente registrado con ID {cliente.id_cliente}"
@@ -498,14 +400,17 @@ class ClienteDAO:
         cursor = None
         
         try:
+            # Las verificaciones previas se leen de la primaria
+            self.conexion.marcar_escritura()
+            
             # Verificar si el cliente existe
             cliente_existente = self.buscar_por_id(cliente.id_cliente)
             if not cliente_existente:
                 return False, f"No existe cliente con ID {cliente.id_cliente}"
             
             # Verificar email único (excluyendo el mismo cliente)
-            cliente_email = self.buscar_por_email(cliente.email)
-            if cliente_email and cliente_email.id_cliente != cliente.id_cliente:
+            id_email = self._id_por_email(cliente.email)
+            if id_email and id_email != cliente.id_cliente:
                 return False, f"El email {cliente.email} ya está en uso por otro cliente"
             
             conn = self.conexion.conectar()
@@ -532,6 +437,11 @@ class ClienteDAO:
             conn.commit()
             
             if cursor.rowcount > 0:
+                if cliente_existente.email != cliente.email.lower():
+                    self._registrar_email(cliente_existente.email, 0)
+                self._registrar_email(cliente.email.lower(), cliente.id_cliente)
+                self._indexar_texto(cliente)
+                self._ajustar_estadisticas(agregar=cliente, quitar=cliente_existente)
                 logger.info(f"Cliente {cliente.id_cliente} actualizado exitosamente")
                 return True, "Cliente actualizado exitosamente"
             else:
@@ -575,6 +485,9 @@ class ClienteDAO:
         cursor = None
         
         try:
+            # Las verificaciones previas se leen de la primaria
+            self.conexion.marcar_escritura()
+            
             # Verificar que existe
             cliente = self.buscar_por_id(id_cliente)
             if not cliente:
@@ -591,6 +504,10 @@ class ClienteDAO:
             conn.commit()
             
             if cursor.rowcount > 0:
+                self._registrar_email(cliente.email, 0)
+                self._desindexar_texto(id_cliente)
+                self._total_clientes.ajustar(-1)
+                self._ajustar_estadisticas(quitar=cliente)
                 logger.info(f"Cliente {id_cliente} eliminado exitosamente")
                 return True, "Cliente eliminado exitosamente"
             else:
@@ -617,6 +534,130 @@ class ClienteDAO:
                 except:
                     pass
     
+    def sincronizar_lote(self, clientes: List[Cliente], tamano_lote: int = 500) -> Dict[str, int]:
+        """
+        Inserta o actualiza clientes en bloque usando el email como clave
+        
+        Pensado para la sincronización nocturna con la tienda en línea: cada
+        lote se procesa con una sola conexión y una transacción. Primero se
+        leen los clientes existentes del lote con un solo SELECT ... IN para
+        clasificar las filas, y luego nuevas y modificadas se escriben con un
+        único INSERT ... ON DUPLICATE KEY UPDATE (ON CONFLICT(email) DO UPDATE
+        en SQLite). Si un lote falla se revierte y se continúa con el
+        siguiente.
+        
+        Args:
+            clientes (List[Cliente]): Clientes a sincronizar (el id se ignora)
+            tamano_lote (int): Clientes por transacción
+            
+        Returns:
+            Dict[str, int]: 'insertados', 'actualizados', 'sin_cambios',
+                'invalidos' (no pasan validar_completo) y 'errores' (filas de
+                lotes revertidos)
+        """
+        resumen = {'insertados': 0, 'actualizados': 0, 'sin_cambios': 0, 'invalidos': 0, 'errores': 0}
+        
+        # Validar y normalizar; si un email se repite gana la última aparición
+        invalidos = validar_lote(clientes)
+        resumen['invalidos'] = len(invalidos)
+        por_email = {}
+        for posicion, cliente in enumerate(clientes):
+            if posicion in invalidos:
+                continue
+            email = cliente.email.strip().lower()
+            por_email[email] = (cliente.nombre, cliente.apellido, cliente.telefono, email, cliente.direccion)
+        
+        filas = list(por_email.values())
+        if not filas:
+            return resumen
+        
+        if self.conexion.backend.nombre == 'sqlite':
+            actualizacion = "ON CONFLICT(email) DO UPDATE SET " + ", ".join(
+                f"{c} = excluded.{c}" for c in ('nombre', 'apellido', 'telefono', 'direccion'))
+        else:
+            actualizacion = "ON DUPLICATE KEY UPDATE " + ", ".join(
+                f"{c} = VALUES({c})" for c in ('nombre', 'apellido', 'telefono', 'direccion'))
+        
+        conn = None
+        cursor = None
+        escritos = []
+        
+        try:
+            self.conexion.marcar_escritura()
+            conn = self.conexion.conectar()
+            if not conn:
+                raise ClienteDAOException("No se pudo establecer conexión")
+            cursor = conn.cursor()
+            
+            for inicio in range(0, len(filas), tamano_lote):
+                lote = filas[inicio:inicio + tamano_lote]
+                try:
+                    marcadores = ", ".join(["%s"] * len(lote))
+                    cursor.execute(f"""
+                        SELECT nombre, apellido, telefono, email, direccion 
+                        FROM clientes WHERE email IN ({marcadores})
+                    """, tuple(fila[3] for fila in lote))
+                    existentes = {}
+                    for nombre, apellido, telefono, email, direccion in cursor.fetchall():
+                        existentes[email.lower()] = (nombre, apellido, telefono, email.lower(), direccion)
+                    
+                    nuevos = [f for f in lote if f[3] not in existentes]
+                    modificados = [f for f in lote if f[3] in existentes and f != existentes[f[3]]]
+                    a_escribir = nuevos + modificados
+                    
+                    if a_escribir:
+                        valores = ", ".join(["(%s, %s, %s, %s, %s)"] * len(a_escribir))
+                        cursor.execute(f"""
+                            INSERT INTO clientes (nombre, apellido, telefono, email, direccion) 
+                            VALUES {valores} 
+                            {actualizacion}
+                        """, tuple(v for fila in a_escribir for v in fila))
+                    conn.commit()
+                    
+                    resumen['insertados'] += len(nuevos)
+                    resumen['actualizados'] += len(modificados)
+                    resumen['sin_cambios'] += len(lote) - len(a_escribir)
+                    escritos.extend(f[3] for f in a_escribir)
+                    self._total_clientes.ajustar(len(nuevos))
+                    
+                except Exception as e:
+                    try:
+                        conn.rollback()
+                    except:
+                        pass
+                    resumen['errores'] += len(lote)
+                    logger.error(f"Error al sincronizar lote de {len(lote)} clientes: {e}")
+            
+            logger.info(f"Sincronización de clientes: {resumen}")
+            return resumen
+            
+        except Exception as e:
+            logger.error(f"Error al sincronizar clientes: {e}")
+            # Las filas que no llegaron a procesarse también cuentan como errores
+            resumen['errores'] = len(filas) - resumen['insertados'] - resumen['actualizados'] - resumen['sin_cambios']
+            return resumen
+            
+        finally:
+            if escritos:
+                # Los ids de las filas insertadas no se conocen: se descartan
+                # las entradas en caché en lugar de actualizarlas
+                self._cache_emails.invalidar(*escritos)
+                if self._filtro_emails is not None:
+                    for email in escritos:
+                        self._filtro_emails.agregar(email)
+                ClienteDAO._indice_texto = ClienteDAO._indice_telefonos = None
+                ClienteDAO._estadisticas = None
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    self.conexion.desconectar()
+                except:
+                    pass
+    
     # ==================== MÉTODOS AUXILIARES ====================
     
     def existe_email(self, email: str) -> bool:
@@ -630,33 +671,244 @@ class ClienteDAO:
             bool: True si existe, False si no
         """
         try:
-            cliente = self.buscar_por_email(email)
-            return cliente is not None
+            return bool(self._id_por_email(email))
         except Exception as e:
             logger.error(f"Error al verificar email: {e}")
             return False
     
-    def contar(self) -> int:
+    def _id_por_email(self, email: str) -> Optional[int]:
+        """
+        Obtiene el ID del cliente con un email usando la caché y, si no está,
+        una consulta de existencia sobre el índice único de email
+        
+        Args:
+            email (str): Email a buscar
+            
+        Returns:
+            Optional[int]: ID del cliente o None si el email no existe
+            
+        Raises:
+            ClienteDAOException: Si ocurre un error en la consulta
+        """
+        if not email or not isinstance(email, str):
+            return None
+        
+        email = email.strip().lower()
+        id_cliente = self._cache_emails.obtener(email)
+        if id_cliente is not None:
+            return id_cliente
+        
+        try:
+            filas = self._consultar(SQL_EXISTE_EMAIL, (email,))
+            
+            if not filas:
+                return None
+            self._cache_emails.guardar(email, filas[0][0])
+            return filas[0][0]
+            
+        except Exception as e:
+            logger.error(f"Error al consultar email: {e}")
+            raise ClienteDAOException(f"Error al consultar email: {e}")
+    
+    def _registrar_email(self, email: str, id_cliente: int):
+        """
+        Actualiza la caché de emails tras una lectura o escritura
+        
+        Args:
+            email (str): Email normalizado
+            id_cliente (int): ID del cliente o 0 si el email ya no existe
+        """
+        if not email:
+            return
+        if not id_cliente:
+            self._cache_emails.invalidar(email)
+            return
+        self._cache_emails.guardar(email, id_cliente)
+        if self._filtro_emails is not None:
+            self._filtro_emails.agregar(email)
+    
+    def cargar_filtro_emails(self, tasa_error: float = 0.01) -> bool:
+        """
+        Carga todos los emails en un filtro de Bloom para puede_existir_email()
+        
+        Solo refleja las altas hechas desde este proceso; otros procesos (o
+        inserciones directas en la base de datos) no lo actualizan, así que
+        buscar_por_email() y existe_email() no lo consultan.
+        
+        Args:
+            tasa_error (float): Tasa de falsos positivos aceptada
+            
+        Returns:
+            bool: True si el filtro se cargó correctamente
+        """
+        conn = None
+        cursor = None
+        
+        try:
+            conn = self.conexion.conectar(lectura=True)
+            if not conn:
+                return False
+            
+            cursor = conn.cursor()
+            cursor.execute("SELECT email FROM clientes WHERE email IS NOT NULL")
+            emails = [row[0].lower() for row in cursor.fetchall() if row[0]]
+            
+            filtro = FiltroBloom(capacidad=max(len(emails) * 2, 1000), tasa_error=tasa_error)
+            for email in emails:
+                filtro.agregar(email)
+            ClienteDAO._filtro_emails = filtro
+            
+            logger.info(f"Filtro de emails cargado con {len(emails)} registros")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error al cargar filtro de emails: {e}")
+            return False
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    self.conexion.desconectar()
+                except:
+                    pass
+    
+    def puede_existir_email(self, email: str) -> bool:
+        """
+        Consulta orientativa al filtro de Bloom, sin acceder a la base de datos
+        
+        Sirve para priorizar trabajo (p. ej. en importaciones), no para decidir
+        unicidad: un False solo indica que el email no existía al cargar el
+        filtro ni se registró desde este proceso. Para una respuesta definitiva
+        se usa existe_email().
+        
+        Args:
+            email (str): Email a verificar
+            
+        Returns:
+            bool: False si el filtro no lo conoce; True si puede existir o si
+            el filtro no está cargado
+        """
+        if not email or not isinstance(email, str):
+            return False
+        filtro = self._filtro_emails
+        return filtro is None or email.strip().lower() in filtro
+    
+    def _indexar_texto(self, cliente: Cliente):
+        """Actualiza los índices de trigramas tras una escritura, si están cargados"""
+        indice, telefonos = self._indice_texto, self._indice_telefonos
+        if indice is None or not cliente.id_cliente:
+            return
+        indice.agregar(cliente.id_cliente, cliente.nombre, cliente.apellido, cliente.email)
+        telefonos.agregar(cliente.id_cliente, cliente.telefono)
+    
+    def _desindexar_texto(self, id_cliente: int):
+        """Quita un cliente eliminado de los índices de trigramas"""
+        if self._indice_texto is not None:
+            self._indice_texto.quitar(id_cliente)
+            self._indice_telefonos.quitar(id_cliente)
+    
+    def cargar_indice_texto(self) -> bool:
+        """
+        Construye en memoria los índices de trigramas de nombre/apellido/email
+        y de dígitos de teléfono que usa buscar_avanzada(modo='texto') con el
+        backend SQLite
+        
+        Como el filtro de emails, solo refleja las escrituras hechas desde
+        este proceso; si otros procesos modifican clientes debe recargarse.
+        
+        Returns:
+            bool: True si los índices se cargaron correctamente
+        """
+        conn = None
+        cursor = None
+        
+        try:
+            conn = self.conexion.conectar(lectura=True)
+            if not conn:
+                return False
+            
+            cursor = conn.cursor()
+            cursor.execute("SELECT id_cliente, nombre, apellido, email, telefono FROM clientes")
+            
+            indice = IndiceTrigramas()
+            telefonos = IndiceTrigramas(normalizar=solo_digitos)
+            total = 0
+            for id_cliente, nombre, apellido, email, telefono in cursor.fetchall():
+                indice.agregar(id_cliente, nombre, apellido, email)
+                telefonos.agregar(id_cliente, telefono)
+                total += 1
+            ClienteDAO._indice_texto = indice
+            ClienteDAO._indice_telefonos = telefonos
+            
+            logger.info(f"Índice de texto cargado con {total} clientes")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error al cargar índice de texto: {e}")
+            return False
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    self.conexion.desconectar()
+                except:
+                    pass
+    
+    def contar(self, aproximado: bool = False) -> int:
         """
         Cuenta el total de clientes en la base de datos
         
+        El conteo exacto se guarda en memoria, se ajusta con cada alta o baja
+        hecha por el DAO y se vuelve a contar con COUNT(*) cuando caduca
+        (ver _total_clientes), así que las llamadas seguidas no recorren la
+        tabla.
+        
+        Args:
+            aproximado (bool): Usar la estimación de las estadísticas de la
+                tabla (information_schema.TABLES.TABLE_ROWS en MySQL,
+                sqlite_stat1 en SQLite); sirve para tableros donde un error
+                de unos pocos porcentajes es aceptable. Si no hay
+                estadísticas se retorna el conteo exacto.
+        
         Returns:
             int: Número total de clientes
         """
+        total = self._total_clientes.obtener()
+        if total is not None:
+            return total
+        
         conn = None
         cursor = None
         
         try:
-            conn = self.conexion.conectar()
+            conn = self.conexion.conectar(lectura=True)
             if not conn:
                 return 0
             
             cursor = conn.cursor()
+            
+            if aproximado:
+                estimado = self._estimar_total(cursor)
+                if estimado is not None:
+                    return estimado
+            
             sql = "SELECT COUNT(*) FROM clientes"
             cursor.execute(sql)
             resultado = cursor.fetchone()
             
-            return resultado[0] if resultado else 0
+            total = resultado[0] if resultado else 0
+            self._total_clientes.fijar(total)
+            return total
             
         except Exception as e:
             logger.error(f"Error al contar clientes: {e}")
@@ -674,7 +926,86 @@ class ClienteDAO:
                 except:
                     pass
     
-    def buscar_avanzada(self, nombre=None, telefono=None, email=None) -> List[Cliente]:
+    def estadisticas(self, recalcular: bool = False) -> Dict:
+        """
+        Estadísticas de todos los clientes (ver estadisticas_clientes)
+        
+        Se calculan en una pasada sobre iterar() y luego se mantienen con
+        cada alta, cambio o baja hecha por el DAO; se recalculan cuando
+        caducan (RECONCILIAR_ESTADISTICAS) para absorber los cambios de
+        otros procesos.
+        
+        Args:
+            recalcular (bool): Recorrer la tabla aunque no hayan caducado
+            
+        Returns:
+            dict: 'total', 'dominios_email', 'ciudades' y 'promedio_dias_registro'
+            
+        Raises:
+            ClienteDAOException: Si ocurre un error al recorrer la tabla
+        """
+        with self._lock_estadisticas:
+            acumulador = ClienteDAO._estadisticas
+            if (acumulador is not None and not recalcular and
+                    time.monotonic() - ClienteDAO._estadisticas_en < self.RECONCILIAR_ESTADISTICAS):
+                return acumulador.resultado()
+        
+        fechas = {}
+        
+        def recorrer():
+            for cliente in self.iterar():
+                fechas[cliente.id_cliente] = cliente.fecha_registro
+                yield cliente
+        
+        acumulador = AcumuladorEstadisticas(recorrer())
+        with self._lock_estadisticas:
+            ClienteDAO._estadisticas = acumulador
+            ClienteDAO._fechas_estadisticas = fechas
+            ClienteDAO._estadisticas_en = time.monotonic()
+            return acumulador.resultado()
+    
+    def _ajustar_estadisticas(self, agregar: Optional[Cliente] = None, quitar: Optional[Cliente] = None):
+        """
+        Aplica una escritura a las estadísticas mantenidas, si ya se calcularon
+        
+        Se quita el cliente con la fecha con que se contó y, en un cambio, se
+        vuelve a agregar con esa misma fecha. Un cliente que no se contó (lo
+        insertó otro proceso) no se quita.
+        """
+        with self._lock_estadisticas:
+            acumulador = ClienteDAO._estadisticas
+            if acumulador is None:
+                return
+            fechas = ClienteDAO._fechas_estadisticas
+            fecha = None
+            if quitar is not None and quitar.id_cliente in fechas:
+                fecha = fechas.pop(quitar.id_cliente)
+                acumulador.quitar(quitar, fecha)
+            if agregar is not None:
+                fecha = fecha or agregar.fecha_registro
+                acumulador.agregar(agregar, fecha)
+                fechas[agregar.id_cliente] = fecha
+    
+    def _estimar_total(self, cursor) -> Optional[int]:
+        """Filas estimadas de clientes según las estadísticas del motor, o None"""
+        if self.conexion.backend.nombre == 'sqlite':
+            try:
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = 'clientes' LIMIT 1")
+            except Exception:
+                # La tabla sqlite_stat1 solo existe después de ejecutar ANALYZE
+                return None
+            fila = cursor.fetchone()
+            return int(fila[0].split()[0]) if fila else None
+        
+        cursor.execute("""
+            SELECT TABLE_ROWS FROM information_schema.TABLES
+            WHERE table_schema = DATABASE() AND table_name = 'clientes'
+        """)
+        fila = cursor.fetchone()
+        return int(fila[0]) if fila and fila[0] is not None else None
+    
+    def buscar_avanzada(self, nombre=None, telefono=None, email=None,
+                        modo: str = 'like', limite: Optional[int] = None) -> List[Cliente]:
         """
         Búsqueda avanzada con múltiples criterios
         
@@ -682,50 +1013,48 @@ class ClienteDAO:
             nombre (str, optional): Nombre a buscar
             telefono (str, optional): Teléfono a buscar
             email (str, optional): Email a buscar
-            
+            modo (str): 'like' compara subcadenas con LIKE '%x%' (recorre la
+                tabla); 'texto' usa el índice FULLTEXT y las columnas de
+                dígitos del teléfono (ver Data/migraciones.py), o los índices
+                de trigramas en memoria con el backend SQLite
+            limite (int, optional): Máximo de resultados; en modo 'texto'
+                por defecto LIMITE_BUSQUEDA
+            
+        En modo 'texto' cada palabra del nombre debe aparecer en el nombre,
+        el apellido o el email, y el teléfono se compara por prefijo o sufijo
+        de sus dígitos ('5678' encuentra '1234-5678').
+        
         Returns:
             List[Cliente]: Lista de clientes que coinciden
         """
         if not any([nombre, telefono, email]):
             return []
         
+        if modo not in ('like', 'texto'):
+            raise ValueError(f"Modo de búsqueda inválido: {modo}")
+        
+        if modo == 'texto':
+            limite = limite or self.LIMITE_BUSQUEDA
+            try:
+                if self.conexion.backend.nombre == 'sqlite':
+                    return self._buscar_trigramas(nombre, telefono, email, limite)
+                return self._buscar_fulltext(nombre, telefono, email, limite)
+            except Exception as e:
+                logger.warning(f"Búsqueda por texto no disponible, se usa LIKE "
+                               f"(¿faltan migraciones? python -m Data.migraciones): {e}")
+        
         clientes = []
         conn = None
         cursor = None
         
         try:
-            conn = self.conexion.conectar()
+            conn = self.conexion.conectar(lectura=True)
             if not conn:
                 return []
             
-            condiciones = []
-            valores = []
-            
-            sql_base = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes WHERE 1=1
-            """
-            
-            if nombre:
-                condiciones.append("(nombre LIKE %s OR apellido LIKE %s)")
-                patron = f"%{nombre}%"
-                valores.extend([patron, patron])
-            
-            if telefono:
-                condiciones.append("telefono LIKE %s")
-                valores.append(f"%{telefono}%")
-            
-            if email:
-                condiciones.append("email LIKE %s")
-                valores.append(f"%{email}%")
-            
-            if condiciones:
-                sql_base += " AND " + " AND ".join(condiciones)
-            
-            sql_base += " ORDER BY nombre, apellido"
-            
+            sql, valores = self.sql_busqueda_like(nombre, telefono, email, limite)
             cursor = conn.cursor()
-            cursor.execute(sql_base, tuple(valores))
+            cursor.execute(sql, valores)
             resultados = cursor.fetchall()
             
             for row in resultados:
@@ -760,66 +1089,169 @@ class ClienteDAO:
                 except:
                     pass
     
-    def listar_paginado(self, pagina: int = 1, por_pagina: int = 10) -> Tuple[List[Cliente], int]:
+    @staticmethod
+    def sql_busqueda_like(nombre=None, telefono=None, email=None,
+                          limite: Optional[int] = None) -> Tuple[str, tuple]:
         """
-        Lista clientes con paginación
+        Consulta de buscar_avanzada(modo='like')
         
-        Args:
-            pagina (int): Número de página (inicia en 1)
-            por_pagina (int): Cantidad de registros por página
-            
         Returns:
-            Tuple[List[Cliente], int]: (lista_clientes, total_paginas)
+            Tuple[str, tuple]: (SQL, parámetros)
         """
+        condiciones = []
+        valores = []
+        
+        if nombre:
+            condiciones.append("(nombre LIKE %s OR apellido LIKE %s)")
+            patron = f"%{nombre}%"
+            valores.extend([patron, patron])
+        
+        if telefono:
+            condiciones.append("telefono LIKE %s")
+            valores.append(f"%{telefono}%")
+        
+        if email:
+            condiciones.append("email LIKE %s")
+            valores.append(f"%{email}%")
+        
+        sql = f"SELECT {_COLUMNAS} FROM clientes WHERE 1=1"
+        if condiciones:
+            sql += " AND " + " AND ".join(condiciones)
+        sql += " ORDER BY nombre, apellido"
+        
+        if limite:
+            sql += " LIMIT %s"
+            valores.append(int(limite))
+        
+        return sql, tuple(valores)
+    
+    @classmethod
+    def sql_busqueda_texto(cls, nombre=None, telefono=None, email=None,
+                           limite: Optional[int] = None) -> Optional[Tuple[str, tuple]]:
+        """
+        Consulta de buscar_avanzada(modo='texto') en MySQL, con MATCH ...
+        AGAINST y las columnas telefono_digitos / telefono_digitos_inv
+        
+        Returns:
+            Optional[Tuple[str, tuple]]: (SQL, parámetros), o None si ningún
+                criterio puede coincidir
+        """
+        condiciones = []
+        valores = []
+        terminos = []
+        
+        for palabra in _PALABRAS.findall(nombre or ''):
+            if len(palabra) >= cls.MIN_PALABRA_FULLTEXT:
+                terminos.append(f"+{palabra}*")
+            else:
+                # Palabras cortas: el índice FULLTEXT no las contiene
+                condiciones.append("(nombre LIKE %s OR apellido LIKE %s)")
+                valores.extend([f"{palabra}%", f"{palabra}%"])
+        
+        if email:
+            email = email.strip().lower()
+            if '@' in email:
+                condiciones.append("email = %s")
+                valores.append(email)
+            else:
+                terminos.extend(f"+{p}*" for p in _PALABRAS.findall(email)
+                                if len(p) >= cls.MIN_PALABRA_FULLTEXT)
+        
+        if terminos:
+            condiciones.insert(0, "MATCH(nombre, apellido, email) AGAINST (%s IN BOOLEAN MODE)")
+            valores.insert(0, " ".join(terminos))
+        
+        if telefono:
+            digitos = solo_digitos(telefono)
+            if not digitos:
+                return None
+            condiciones.append("(telefono_digitos LIKE %s OR telefono_digitos_inv LIKE %s)")
+            valores.extend([f"{digitos}%", f"{digitos[::-1]}%"])
+        
+        if not condiciones:
+            return None
+        
+        sql = (f"SELECT {_COLUMNAS} FROM clientes WHERE {' AND '.join(condiciones)} "
+               f"ORDER BY nombre, apellido LIMIT %s")
+        valores.append(int(limite or cls.LIMITE_BUSQUEDA))
+        return sql, tuple(valores)
+    
+    def _buscar_fulltext(self, nombre, telefono, email, limite: int) -> List[Cliente]:
+        """
+        buscar_avanzada(modo='texto') con MATCH ... AGAINST (ver sql_busqueda_texto)
+        
+        Raises:
+            Error del backend si faltan el índice FULLTEXT o las columnas
+        """
+        consulta = self.sql_busqueda_texto(nombre, telefono, email, limite)
+        if consulta is None:
+            return []
+        
         conn = None
         cursor = None
-        
         try:
-            # Calcular offset
-            offset = (pagina - 1) * por_pagina
-            
-            conn = self.conexion.conectar()
+            conn = self.conexion.conectar(lectura=True)
             if not conn:
-                return [], 0
+                raise ClienteDAOException("No se pudo establecer conexión con la base de datos")
             
             cursor = conn.cursor()
+            cursor.execute(*consulta)
+            return self._crear_clientes(cursor.fetchall())
             
-            # Contar total
-            cursor.execute("SELECT COUNT(*) FROM clientes")
-            total = cursor.fetchone()[0]
-            total_paginas = (total + por_pagina - 1) // por_pagina
-            
-            # Obtener datos paginados
-            sql = """
-                SELECT id_cliente, nombre, apellido, telefono, email, direccion 
-                FROM clientes 
-                ORDER BY nombre, apellido
-                LIMIT %s OFFSET %s
-            """
-            
-            cursor.execute(sql, (por_pagina, offset))
-            resultados = cursor.fetchall()
-            
-            clientes = []
-            for row in resultados:
+        finally:
+            if cursor:
                 try:
-                    cliente = Cliente(
-                        id_cliente=row[0],
-                        nombre=row[1],
-                        apellido=row[2],
-                        telefono=row[3],
-                        email=row[4],
-                        direccion=row[5]
-                    )
-                    clientes.append(cliente)
+                    cursor.close()
                 except:
-                    continue
-            
-            return clientes, total_paginas
+                    pass
+            if conn:
+                try:
+                    self.conexion.desconectar()
+                except:
+                    pass
+    
+    def _buscar_trigramas(self, nombre, telefono, email, limite: int) -> List[Cliente]:
+        """buscar_avanzada(modo='texto') con los índices de trigramas en memoria"""
+        if self._indice_texto is None and not self.cargar_indice_texto():
+            raise ClienteDAOException("No se pudo cargar el índice de texto")
+        indice, telefonos = self._indice_texto, self._indice_telefonos
+        
+        candidatos = None
+        for palabra in _PALABRAS.findall(nombre or ''):
+            candidatos = indice.buscar(palabra, candidatos)
+        if email:
+            candidatos = indice.buscar(email.strip(), candidatos)
+        if telefono:
+            digitos = solo_digitos(telefono)
+            if not digitos:
+                return []
+            candidatos = {i for i in telefonos.buscar(digitos, candidatos)
+                          if telefonos.texto(i).startswith(digitos) or telefonos.texto(i).endswith(digitos)}
+        
+        if not candidatos:
+            return []
+        
+        conn = None
+        cursor = None
+        try:
+            conn = self.conexion.conectar(lectura=True)
+            if not conn:
+                raise ClienteDAOException("No se pudo establecer conexión con la base de datos")
             
-        except Exception as e:
-            logger.error(f"Error en paginación: {e}")
-            return [], 0
+            cursor = conn.cursor()
+            ids = sorted(candidatos)
+            filas = []
+            for inicio in range(0, len(ids), self.TAMANO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANO_LOTE_IDS]
+                marcadores = ", ".join(["%s"] * len(lote))
+                cursor.execute(f"""
+                    SELECT id_cliente, nombre, apellido, telefono, email, direccion 
+                    FROM clientes WHERE id_cliente IN ({marcadores})
+                """, tuple(lote))
+                filas.extend(cursor.fetchall())
+            
+            filas.sort(key=lambda row: (row[1], row[2]))
+            return self._crear_clientes(filas[:limite])
             
         finally:
             if cursor:
@@ -831,4 +1263,48 @@ class ClienteDAO:
                 try:
                     self.conexion.desconectar()
                 except:
-                    pass
\ No newline at end of file
+                    pass
+    
+    def _crear_clientes(self, filas) -> List[Cliente]:
+        """Convierte filas (id, nombre, apellido, telefono, email, direccion) en clientes"""
+        clientes = []
+        for row in filas:
+            try:
+                clientes.append(Cliente(
+                    id_cliente=row[0],
+                    nombre=row[1],
+                    apellido=row[2],
+                    telefono=row[3],
+                    email=row[4],
+                    direccion=row[5]
+                ))
+            except Exception as e:
+                logger.warning(f"Error al crear objeto Cliente desde fila {row[0]}: {e}")
+        return clientes
+    
+    def listar_paginado(self, pagina: int = 1, por_pagina: int = 10) -> Tuple[List[Cliente], int]:
+        """
+        Lista clientes con paginación
+        
+        Args:
+            pagina (int): Número de página (inicia en 1)
+            por_pagina (int): Cantidad de registros por página
+            
+        Returns:
+            Tuple[List[Cliente], int]: (lista_clientes, total_paginas)
+        """
+        try:
+            # Calcular offset
+            offset = (pagina - 1) * por_pagina
+            
+            # Contar total (conteo mantenido en memoria, ver contar())
+            total = self.contar()
+            total_paginas = (total + por_pagina - 1) // por_pagina
+            
+            # Obtener datos paginados
+            resultados = self._consultar(SQL_LISTAR_PAGINADO, (por_pagina, offset))
+            return self._crear_clientes(resultados), total_paginas
+            
+        except Exception as e:
+            logger.error(f"Error en paginación: {e}")
+            return [], 0
\ No newline at end of file
@@ -0,0 +1,342 @@
+import logging
+from typing import AsyncIterator, List, Optional, Tuple
+
+from Data.conexionAsync import ConexionAsync
+from CreativeDesings.Cliente import Cliente
+
+logger = logging.getLogger(__name__)
+
+_COLUMNAS = "id_cliente, nombre, apellido, telefono, email, direccion"
+
+
+class ClienteDAOAsyncException(Exception):
+    """Excepción personalizada para errores del DAO asíncrono"""
+    pass
+
+
+def _cliente(row) -> Cliente:
+    """Crea un Cliente a partir de una fila de clientes"""
+    return Cliente(
+        id_cliente=row[0],
+        nombre=row[1],
+        apellido=row[2],
+        telefono=row[3],
+        email=row[4],
+        direccion=row[5]
+    )
+
+
+def _clientes(filas) -> List[Cliente]:
+    """Convierte filas en clientes omitiendo las que no se puedan construir"""
+    clientes = []
+    for row in filas:
+        try:
+            clientes.append(_cliente(row))
+        except Exception as e:
+            logger.warning(f"Error al crear objeto Cliente desde fila {row[0]}: {e}")
+    return clientes
+
+
+class ClienteDAOAsync:
+    """
+    Versión asíncrona de ClienteDAO con los mismos nombres de métodos y
+    los mismos valores de retorno
+
+    Las escrituras se confirman de inmediato, o al final del bloque si se
+    ejecutan dentro de conexion.transaccion().
+    """
+
+    def __init__(self, conexion: Optional[ConexionAsync] = None):
+        """Inicializa el DAO con la conexión asíncrona"""
+        self.conexion = conexion or ConexionAsync()
+
+    # ==================== MÉTODOS DE LECTURA ====================
+
+    async def listar(self) -> List[Cliente]:
+        """
+        Obtiene todos los clientes de la base de datos
+
+        Raises:
+            ClienteDAOAsyncException: Si ocurre un error en la consulta
+        """
+        try:
+            sql = f"SELECT {_COLUMNAS} FROM clientes ORDER BY nombre, apellido"
+            return _clientes(await self.conexion.consultar(sql))
+        except Exception as e:
+            logger.error(f"Error al listar clientes: {e}")
+            raise ClienteDAOAsyncException(f"Error al obtener lista de clientes: {e}")
+
+    async def iterar(self, tamano_lote: int = 500) -> AsyncIterator[Cliente]:
+        """
+        Recorre todos los clientes por lotes sin cargarlos completos en memoria
+
+        Uso:
+            async for cliente in dao.iterar():
+                ...
+        """
+        sql = f"SELECT {_COLUMNAS} FROM clientes ORDER BY id_cliente"
+        async for row in self.conexion.iterar(sql, tamano_lote=tamano_lote):
+            try:
+                cliente = _cliente(row)
+            except Exception as e:
+                logger.warning(f"Error al crear objeto Cliente desde fila {row[0]}: {e}")
+                continue
+            # Fuera del try: las excepciones lanzadas en el generador (athrow)
+            # no deben confundirse con filas inválidas
+            yield cliente
+
+    async def buscar_por_id(self, id_cliente: int) -> Optional[Cliente]:
+        """
+        Busca un cliente por su ID
+
+        Raises:
+            ClienteDAOAsyncException: Si ocurre un error en la consulta
+            ValueError: Si el ID no es válido
+        """
+        if not id_cliente or not isinstance(id_cliente, int) or id_cliente <= 0:
+            raise ValueError("El ID del cliente debe ser un entero positivo")
+
+        try:
+            sql = f"SELECT {_COLUMNAS} FROM clientes WHERE id_cliente = %s"
+            row = await self.conexion.consultar_uno(sql, (id_cliente,))
+            return _cliente(row) if row else None
+        except Exception as e:
+            logger.error(f"Error al buscar cliente por ID {id_cliente}: {e}")
+            raise ClienteDAOAsyncException(f"Error al buscar cliente: {e}")
+
+    async def buscar_por_nombre(self, nombre: str) -> List[Cliente]:
+        """
+        Busca clientes cuyo nombre o apellido contenga el texto especificado
+
+        Raises:
+            ClienteDAOAsyncException: Si ocurre un error en la consulta
+        """
+        if not nombre or not isinstance(nombre, str):
+            return []
+
+        try:
+            sql = f"""
+                SELECT {_COLUMNAS} FROM clientes
+                WHERE nombre LIKE %s OR apellido LIKE %s
+                ORDER BY nombre, apellido
+            """
+            patron = f"%{nombre.strip()}%"
+            return _clientes(await self.conexion.consultar(sql, (patron, patron)))
+        except Exception as e:
+            logger.error(f"Error al buscar clientes por nombre '{nombre}': {e}")
+            raise ClienteDAOAsyncException(f"Error en búsqueda por nombre: {e}")
+
+    async def buscar_por_email(self, email: str) -> Optional[Cliente]:
+        """Busca un cliente por su email (único)"""
+        if not email or not isinstance(email, str):
+            return None
+
+        try:
+            sql = f"SELECT {_COLUMNAS} FROM clientes WHERE email = %s"
+            row = await self.conexion.consultar_uno(sql, (email.strip().lower(),))
+            return _cliente(row) if row else None
+        except Exception as e:
+            logger.error(f"Error al buscar por email: {e}")
+            return None
+
+    async def buscar_por_telefono(self, telefono: str) -> List[Cliente]:
+        """Busca clientes por teléfono"""
+        if not telefono:
+            return []
+
+        try:
+            sql = f"SELECT {_COLUMNAS} FROM clientes WHERE telefono LIKE %s"
+            return _clientes(await self.conexion.consultar(sql, (f"%{telefono}%",)))
+        except Exception as e:
+            logger.error(f"Error al buscar por teléfono: {e}")
+            return []
+
+    # ==================== MÉTODOS DE ESCRITURA ====================
+
+    async def insertar(self, cliente: Cliente) -> Tuple[bool, str]:
+        """
+        Inserta un nuevo cliente en la base de datos
+
+        Returns:
+            Tuple[bool, str]: (éxito, mensaje)
+        """
+        if not isinstance(cliente, Cliente):
+            return False, "El objeto no es una instancia válida de Cliente"
+
+        valido, errores = cliente.validar_completo()
+        if not valido:
+            return False, f"Datos inválidos: {', '.join(errores)}"
+
+        try:
+            if await self.existe_email(cliente.email):
+                return False, f"El email {cliente.email} ya está registrado"
+
+            sql = """
+                INSERT INTO clientes (nombre, apellido, telefono, email, direccion)
+                VALUES (%s, %s, %s, %s, %s)
+            """
+            valores = (cliente.nombre, cliente.apellido, cliente.telefono,
+                       cliente.email.lower(), cliente.direccion)
+            _, cliente.id_cliente = await self.conexion.ejecutar(sql, valores)
+
+            logger.info(f"Cliente insertado exitosamente con ID {cliente.id_cliente}")
+            return True, f"Cliente registrado con ID {cliente.id_cliente}"
+
+        except Exception as e:
+            logger.error(f"Error al insertar cliente: {e}")
+            if self.conexion.en_transaccion():
+                raise
+            return False, f"Error al registrar cliente: {str(e)}"
+
+    async def actualizar(self, cliente: Cliente) -> Tuple[bool, str]:
+        """
+        Actualiza un cliente existente
+
+        Returns:
+            Tuple[bool, str]: (éxito, mensaje)
+        """
+        if not isinstance(cliente, Cliente):
+            return False, "El objeto no es una instancia válida de Cliente"
+
+        if not cliente.id_cliente:
+            return False, "El cliente debe tener un ID válido"
+
+        valido, errores = cliente.validar_completo()
+        if not valido:
+            return False, f"Datos inválidos: {', '.join(errores)}"
+
+        try:
+            if not await self.buscar_por_id(cliente.id_cliente):
+                return False, f"No existe cliente con ID {cliente.id_cliente}"
+
+            row = await self.conexion.consultar_uno(
+                "SELECT id_cliente FROM clientes WHERE email = %s LIMIT 1",
+                (cliente.email.lower(),))
+            if row and row[0] != cliente.id_cliente:
+                return False, f"El email {cliente.email} ya está en uso por otro cliente"
+
+            sql = """
+                UPDATE clientes
+                SET nombre = %s, apellido = %s, telefono = %s, email = %s, direccion = %s
+                WHERE id_cliente = %s
+            """
+            valores = (cliente.nombre, cliente.apellido, cliente.telefono,
+                       cliente.email.lower(), cliente.direccion, cliente.id_cliente)
+            filas, _ = await self.conexion.ejecutar(sql, valores)
+
+            if filas > 0:
+                logger.info(f"Cliente {cliente.id_cliente} actualizado exitosamente")
+                return True, "Cliente actualizado exitosamente"
+            return False, "No se realizaron cambios"
+
+        except Exception as e:
+            logger.error(f"Error al actualizar cliente: {e}")
+            if self.conexion.en_transaccion():
+                raise
+            return False, f"Error al actualizar: {str(e)}"
+
+    async def eliminar(self, id_cliente: int) -> Tuple[bool, str]:
+        """
+        Elimina un cliente de la base de datos
+
+        Returns:
+            Tuple[bool, str]: (éxito, mensaje)
+        """
+        if not id_cliente or not isinstance(id_cliente, int) or id_cliente <= 0:
+            return False, "ID de cliente inválido"
+
+        try:
+            filas, _ = await self.conexion.ejecutar(
+                "DELETE FROM clientes WHERE id_cliente = %s", (id_cliente,))
+
+            if filas > 0:
+                logger.info(f"Cliente {id_cliente} eliminado exitosamente")
+                return True, "Cliente eliminado exitosamente"
+            return False, f"No existe cliente con ID {id_cliente}"
+
+        except Exception as e:
+            logger.error(f"Error al eliminar cliente {id_cliente}: {e}")
+            if self.conexion.en_transaccion():
+                raise
+            return False, f"Error al eliminar: {str(e)}"
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    async def existe_email(self, email: str) -> bool:
+        """Verifica si un email ya existe en la base de datos"""
+        if not email or not isinstance(email, str):
+            return False
+        try:
+            row = await self.conexion.consultar_uno(
+                "SELECT 1 FROM clientes WHERE email = %s LIMIT 1",
+                (email.strip().lower(),))
+            return row is not None
+        except Exception as e:
+            logger.error(f"Error al verificar email: {e}")
+            return False
+
+    async def contar(self) -> int:
+        """Cuenta el total de clientes en la base de datos"""
+        try:
+            row = await self.conexion.consultar_uno("SELECT COUNT(*) FROM clientes")
+            return row[0] if row else 0
+        except Exception as e:
+            logger.error(f"Error al contar clientes: {e}")
+            return 0
+
+    async def buscar_avanzada(self, nombre=None, telefono=None, email=None) -> List[Cliente]:
+        """Búsqueda avanzada con múltiples criterios"""
+        if not any([nombre, telefono, email]):
+            return []
+
+        condiciones = []
+        valores = []
+
+        if nombre:
+            condiciones.append("(nombre LIKE %s OR apellido LIKE %s)")
+            patron = f"%{nombre}%"
+            valores.extend([patron, patron])
+
+        if telefono:
+            condiciones.append("telefono LIKE %s")
+            valores.append(f"%{telefono}%")
+
+        if email:
+            condiciones.append("email LIKE %s")
+            valores.append(f"%{email}%")
+
+        sql = f"""
+            SELECT {_COLUMNAS} FROM clientes
+            WHERE {" AND ".join(condiciones)}
+            ORDER BY nombre, apellido
+        """
+
+        try:
+            return _clientes(await self.conexion.consultar(sql, tuple(valores)))
+        except Exception as e:
+            logger.error(f"Error en búsqueda avanzada: {e}")
+            return []
+
+    async def listar_paginado(self, pagina: int = 1, por_pagina: int = 10) -> Tuple[List[Cliente], int]:
+        """
+        Lista clientes con paginación
+
+        Returns:
+            Tuple[List[Cliente], int]: (lista_clientes, total_paginas)
+        """
+        try:
+            offset = (pagina - 1) * por_pagina
+            total = await self.contar()
+            total_paginas = (total + por_pagina - 1) // por_pagina
+
+            sql = f"""
+                SELECT {_COLUMNAS} FROM clientes
+                ORDER BY nombre, apellido
+                LIMIT %s OFFSET %s
+            """
+            filas = await self.conexion.consultar(sql, (por_pagina, offset))
+            return _clientes(filas), total_paginas
+
+        except Exception as e:
+            logger.error(f"Error en paginación: {e}")
+            return [], 0
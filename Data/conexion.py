@@ -1,80 +1,298 @@
-import mysql.connector
-from mysql.connector import Error
+import re
+import time
 import logging
+import contextvars
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from Data.backends import obtener_backend
+from Data.configuracion import obtener_configuracion
+from Data.metricas import registro_consultas, ConexionInstrumentada
+from Data.resiliencia import PoliticaReintentos, obtener_corta_circuito
+from Data.replicas import obtener_enrutador
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Modos de ejecución de ejecutar_query
+MODO_LECTURA = 'lectura'
+MODO_ESCRITURA = 'escritura'
+
+# Sentencias que retornan filas (se evalúa sin copiar el texto de la query)
+_PATRON_LECTURA = re.compile(r"\s*\(?\s*(?:SELECT|SHOW|EXPLAIN|DESCRIBE)\b", re.IGNORECASE)
+
+# Instante (time.monotonic) de la última escritura del hilo o tarea asyncio
+# actual. Lo comparten todas las Conexion: tras escribir con un DAO, las
+# lecturas de cualquier otro DAO en la misma sesión también van a la primaria.
+_ultima_escritura = contextvars.ContextVar('ultima_escritura', default=None)
+
 
 class ConexionException(Exception):
     """Excepción personalizada para errores de conexión"""
     pass
 
 
+class _ControladorNoDisponible(Exception):
+    """Nunca se lanza: reemplaza a backend.Error cuando el controlador no se
+    puede importar, para que esos errores caigan en 'except Exception'"""
+    pass
+
+
 class Conexion:
     """
     Clase para manejar la conexión a la base de datos MySQL
     """
 
-    def __init__(self):
-        """Inicializa los parámetros de conexión"""
+    # Máximo de sentencias preparadas que se mantienen abiertas por conexión
+    MAX_SENTENCIAS_PREPARADAS = 64
+    # Medir conexión, ejecución y lectura de cada sentencia (ver Data/metricas.py)
+    INSTRUMENTAR = True
+
+    def __init__(self, usar_preparadas=True, mantener_conexion=None, backend=None, config=None):
+        """
+        Inicializa los parámetros de conexión
+
+        Args:
+            config (ConfiguracionBD, optional): Parámetros de conexión; por
+                defecto los del entorno (ver Data/configuracion.py)
+            backend (Backend, optional): Motor de base de datos; por defecto el
+                configurado con backends.configurar_backend() (MySQL)
+            usar_preparadas (bool): Reutilizar sentencias preparadas en el servidor
+            mantener_conexion (bool, optional): No cerrar la conexión después de
+                cada ejecutar_query, para que las sentencias preparadas se
+                reutilicen entre llamadas. Por defecto igual a usar_preparadas:
+                sin conexión abierta no hay sentencias que reutilizar.
+        """
         try:
-            self.host = 'localhost'
-            self.database = 'creative_designs'
-            self.user = 'root'
-            self.password = ''  # CAMBIA POR TU CONTRASEÑA DE MYSQL
-            self.port = 3306
+            self.config = config or obtener_configuracion()
+            self.host = self.config.host
+            self.database = self.config.database
+            self.user = self.config.user
+            self.password = self.config.password
+            self.port = self.config.port
+            self.charset = self.config.charset
+            self.timeout_conexion = self.config.timeout_conexion
+            # Fallos seguidos que abren el corta-circuito y segundos que permanece abierto
+            self.umbral_fallos = self.config.umbral_fallos
+            self.enfriamiento = self.config.enfriamiento
+            # Segundos tras una escritura en los que las lecturas siguen yendo a la
+            # primaria, para leer lo recién escrito aunque las réplicas tengan retraso
+            self.ventana_lectura_propia = self.config.ventana_lectura_propia
             self.conexion = None
+            self.backend = backend or obtener_backend()
+            self.usar_preparadas = usar_preparadas
+            self.mantener_conexion = usar_preparadas if mantener_conexion is None else mantener_conexion
+            # Cursores preparados de la conexión actual, indexados por texto SQL
+            self._sentencias = OrderedDict()
+            # Modo (lectura/escritura) ya detectado por texto SQL
+            self._modos = {}
+            # Reintentos ante errores transitorios (ver Data/resiliencia.py)
+            self.politica_reintentos = PoliticaReintentos(
+                self.config.intentos_conexion, self.config.espera_base, self.config.espera_maxima)
+            # Réplica de la conexión actual (None = primaria)
+            self._replica = None
+            self._fijada_primaria = 0
         except Exception as e:
             logger.error(f"Error al inicializar configuración de conexión: {e}")
             raise ConexionException(f"Error en configuración: {e}")
 
-    def conectar(self):
-        """Establece la conexión con la base de datos"""
+    def conectar(self, lectura=False):
+        """
+        Establece la conexión con la base de datos
+
+        Args:
+            lectura (bool): La conexión solo se usará para leer y puede ir a
+                una réplica (ver Data/replicas.py)
+
+        Las escrituras, las lecturas dentro de usar_primaria() y las lecturas
+        poco después de una escritura van a la primaria. Los errores
+        transitorios se reintentan con espera exponencial. Si el destino
+        acumula fallos seguidos, el corta-circuito rechaza los intentos de
+        inmediato durante el enfriamiento y se retorna None sin esperar.
+        """
+        if lectura and not self._lectura_en_primaria():
+            conn = self._conectar_replica()
+            if conn is not None:
+                return conn
+        elif not lectura:
+            self.marcar_escritura()
+        return self._conectar_primaria()
+
+    def conectar_lectura(self):
+        """Establece una conexión de solo lectura (réplica si hay disponibles)"""
+        return self.conectar(lectura=True)
+
+    def marcar_escritura(self):
+        """
+        Inicia la ventana en la que las lecturas van a la primaria, para todas
+        las conexiones del hilo o tarea actual
+        """
+        _ultima_escritura.set(time.monotonic())
+
+    @contextmanager
+    def usar_primaria(self):
+        """
+        Envía todas las operaciones del bloque a la primaria
+
+        Uso:
+            with dao.conexion.usar_primaria():
+                cliente = dao.buscar_por_id(1)
+                dao.actualizar(cliente)
+        """
+        self._fijada_primaria += 1
         try:
-            if self.conexion is None or not self.conexion.is_connected():
-                self.conexion = mysql.connector.connect(
-                    host=self.host,
-                    database=self.database,
-                    user=self.user,
-                    password=self.password,
-                    port=self.port,
-                    charset='utf8mb4'
-                )
-
-                if self.conexion.is_connected():
-                    db_info = self.conexion.get_server_info()
-                    logger.info(f"Conectado a MySQL Server versión {db_info}")
-                    return self.conexion
-                else:
-                    logger.error("No se pudo conectar a la base de datos")
-                    return None
-
-        except Error as e:
-            logger.error(f"Error al conectar a MySQL: {e}")
-            print(f"Error de conexión: {e}")
-            print("\nVerifique:")
-            print("1. MySQL está ejecutándose")
-            print("2. La base de datos 'creative_designs' existe")
-            print("3. Usuario y contraseña son correctos")
-            print(f"4. Configuración actual: host={self.host}, user={self.user}, db={self.database}")
+            yield self
+        finally:
+            self._fijada_primaria -= 1
+
+    def _lectura_en_primaria(self):
+        """Indica si las lecturas deben ir a la primaria en este momento"""
+        if self._fijada_primaria:
+            return True
+        ultima = _ultima_escritura.get()
+        return ultima is not None and time.monotonic() - ultima < self.ventana_lectura_propia
+
+    def _conectar_replica(self):
+        """Abre una conexión a la siguiente réplica sana; None si no hay ninguna"""
+        enrutador = obtener_enrutador()
+        if not enrutador.replicas:
+            return None
+
+        if self._replica is not None and self.verificar_conexion():
+            return self.conexion
+        self.desconectar()
+
+        for replica in enrutador.candidatas():
+            try:
+                self.conexion = self._abrir_conexion(replica.backend, replica.destino(self))
+                replica.cortacircuito.registrar_exito()
+                self._replica = replica
+                return self.conexion
+            except Exception as e:
+                replica.cortacircuito.registrar_fallo()
+                logger.warning(f"Réplica {replica!r} no disponible, se intenta la siguiente: {e}")
+
+        logger.warning("Sin réplicas disponibles, la lectura va a la primaria")
+        return None
+
+    def _error_backend(self):
+        """
+        Clase de error del backend, resuelta antes de un try
+
+        Evaluar backend.Error importa el controlador de MySQL al primer uso;
+        si no está instalado, el ImportError saldría de la propia cláusula
+        except sin pasar por 'except Exception'.
+        """
+        try:
+            return self.backend.Error
+        except ImportError:
+            return _ControladorNoDisponible
+
+    def _conectar_primaria(self):
+        """Abre (o reutiliza) la conexión a la base de datos primaria"""
+        cortacircuito = None
+        error_backend = self._error_backend()
+        try:
+            if self._replica is not None:
+                self.desconectar()
+            elif self.conexion is not None and self.conexion.is_connected():
+                # Conexión ya abierta
+                return self.conexion
+
+            # Las sentencias preparadas pertenecen a la conexión anterior
+            self._cerrar_sentencias()
+            self.conexion = None
+
+            destino = self.backend.descripcion(self)
+            cortacircuito = obtener_corta_circuito(destino, self.umbral_fallos, self.enfriamiento)
+            if not cortacircuito.permitir():
+                logger.warning(f"Conexión rechazada por corta-circuito abierto ({destino}), "
+                               f"reintento en {cortacircuito.segundos_restantes():.1f} s")
+                return None
+
+            esperas = self.politica_reintentos.esperas()
+            while True:
+                try:
+                    self.conexion = self._abrir_conexion()
+                    break
+                except error_backend as e:
+                    espera = next(esperas, None) if self.backend.es_transitorio(e) else None
+                    if espera is None:
+                        cortacircuito.registrar_fallo()
+                        raise
+                    logger.warning(f"Error transitorio al conectar ({e}), reintento en {espera:.2f} s")
+                    time.sleep(espera)
+
+            if self.conexion.is_connected():
+                cortacircuito.registrar_exito()
+                db_info = self.conexion.get_server_info()
+                logger.info(f"Conectado a {self.backend.nombre} versión {db_info}")
+                return self.conexion
+            else:
+                cortacircuito.registrar_fallo()
+                logger.error("No se pudo conectar a la base de datos")
+                return None
+
+        except error_backend as e:
+            logger.error(f"Error al conectar a {self.backend.nombre}: {e}")
+            # La ayuda se muestra una sola vez por caída, no en cada petición
+            if cortacircuito is None or cortacircuito.fallos_consecutivos <= 1:
+                print(f"Error de conexión: {e}")
+                print("\nVerifique:")
+                print("1. MySQL está ejecutándose")
+                print("2. La base de datos 'creative_designs' existe")
+                print("3. Usuario y contraseña son correctos (CD_DB_USER / CD_DB_PASSWORD)")
+                print(f"4. Configuración actual: {self.backend.descripcion(self)}")
             return None
 
         except Exception as e:
             logger.error(f"Error inesperado al conectar: {e}")
+            # Liberar el intento de prueba si el corta-circuito estaba semiabierto
+            if cortacircuito is not None:
+                cortacircuito.registrar_fallo()
             return None
 
+    def _abrir_conexion(self, backend=None, destino=None):
+        """
+        Abre una conexión con el backend registrando el tiempo empleado
+
+        Args:
+            backend (Backend, optional): Backend a usar (por defecto el de la primaria)
+            destino (optional): Parámetros de conexión (por defecto los de la primaria)
+        """
+        backend = backend or self.backend
+        destino = destino or self
+        if not self.INSTRUMENTAR:
+            return backend.conectar(destino)
+
+        inicio = time.perf_counter()
+        try:
+            conn = backend.conectar(destino)
+        except Exception:
+            registro_consultas.registrar_conexion(time.perf_counter() - inicio, exito=False)
+            raise
+        registro_consultas.registrar_conexion(time.perf_counter() - inicio)
+        return ConexionInstrumentada(conn, registro_consultas)
+
+    @staticmethod
+    def estadisticas_consultas():
+        """Retorna el reporte de tiempos de consultas del proceso"""
+        return registro_consultas.reporte()
+
     def desconectar(self):
         """Cierra la conexión con la base de datos"""
+        self._cerrar_sentencias()
+        self._replica = None
+        error_backend = self._error_backend()
         try:
             if self.conexion is not None and self.conexion.is_connected():
                 self.conexion.close()
-                logger.info("Conexión MySQL cerrada")
-        except Error as e:
+                logger.info(f"Conexión {self.backend.nombre} cerrada")
+        except error_backend as e:
             logger.error(f"Error al cerrar conexión: {e}")
         except Exception as e:
             logger.error(f"Error inesperado al cerrar: {e}")
+        finally:
+            self.conexion = None
 
     def obtener_cursor(self):
         """Retorna un cursor para ejecutar consultas"""
@@ -95,30 +313,111 @@ class Conexion:
         except:
             return False
 
-    def ejecutar_query(self, query, params=None):
-        """Ejecuta una query SQL"""
+    def _modo_query(self, query):
+        """Determina si una query retorna filas, recordando el resultado por texto SQL"""
+        modo = self._modos.get(query)
+        if modo is None:
+            modo = MODO_LECTURA if _PATRON_LECTURA.match(query) else MODO_ESCRITURA
+            if len(self._modos) < 1024:
+                self._modos[query] = modo
+        return modo
+
+    @property
+    def _reutiliza_sentencias(self):
+        """Las sentencias preparadas solo se guardan si la conexión sigue abierta"""
+        return self.usar_preparadas and self.mantener_conexion
+
+    def _cursor_para(self, conn, query):
+        """
+        Retorna un cursor para la query: un cursor preparado reutilizado si la
+        misma SQL ya se preparó en esta conexión, o uno normal si las sentencias
+        preparadas están desactivadas o la conexión se cierra tras cada query
+        """
+        if not self._reutiliza_sentencias:
+            return conn.cursor()
+
+        cursor = self._sentencias.get(query)
+        if cursor is not None:
+            self._sentencias.move_to_end(query)
+            return cursor
+
+        cursor = conn.cursor(prepared=True)
+        self._sentencias[query] = cursor
+        while len(self._sentencias) > self.MAX_SENTENCIAS_PREPARADAS:
+            _, antiguo = self._sentencias.popitem(last=False)
+            try:
+                antiguo.close()
+            except:
+                pass
+        return cursor
+
+    def _descartar_sentencia(self, query):
+        """Cierra y olvida la sentencia preparada de una query"""
+        cursor = self._sentencias.pop(query, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except:
+                pass
+
+    def _cerrar_sentencias(self):
+        """Cierra todas las sentencias preparadas de la conexión actual"""
+        while self._sentencias:
+            _, cursor = self._sentencias.popitem()
+            try:
+                cursor.close()
+            except:
+                pass
+
+    def ejecutar_query(self, query, params=None, modo=None):
+        """
+        Ejecuta una query SQL
+
+        Args:
+            query (str): Sentencia SQL con marcadores %s
+            params (tuple, optional): Parámetros de la sentencia
+            modo (str, optional): MODO_LECTURA retorna las filas, MODO_ESCRITURA
+                confirma y retorna las filas afectadas. Si se omite se detecta
+                a partir de la sentencia.
+
+        Returns:
+            tuple: (bool, resultado) - filas, filas afectadas o mensaje de error
+        """
         cursor = None
+        error_backend = self._error_backend()
         try:
-            conn = self.conectar()
+            if modo is None:
+                modo = self._modo_query(query)
+            elif modo not in (MODO_LECTURA, MODO_ESCRITURA):
+                raise ValueError(f"Modo inválido: {modo}")
+
+            conn = self.conectar(lectura=(modo == MODO_LECTURA))
             if not conn:
                 return False, "No se pudo conectar a la base de datos"
 
-            cursor = conn.cursor()
+            cursor = self._cursor_para(conn, query)
 
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
 
-            if query.strip().upper().startswith('SELECT'):
+            if modo == MODO_LECTURA:
                 resultado = cursor.fetchall()
+                if self.mantener_conexion:
+                    # Terminar la transacción implícita de la lectura: en una
+                    # conexión que sigue abierta, InnoDB seguiría usando la
+                    # misma instantánea y las lecturas siguientes no verían
+                    # los cambios de otras conexiones
+                    conn.commit()
                 return True, resultado
             else:
                 conn.commit()
                 return True, cursor.rowcount
 
-        except Error as e:
+        except error_backend as e:
             logger.error(f"Error al ejecutar query: {e}")
+            self._descartar_sentencia(query)
             if self.conexion:
                 try:
                     self.conexion.rollback()
@@ -128,15 +427,17 @@ class Conexion:
 
         except Exception as e:
             logger.error(f"Error inesperado: {e}")
+            self._descartar_sentencia(query)
             return False, str(e)
 
         finally:
-            if cursor:
+            if cursor and not self._reutiliza_sentencias:
                 try:
                     cursor.close()
                 except:
                     pass
-            self.desconectar()
+            if not self.mantener_conexion:
+                self.desconectar()
 
 
 # Función de prueba
@@ -173,7 +474,7 @@ def probar_conexion():
             print("\nPosibles soluciones:")
             print("1. Verificar que MySQL esté ejecutándose")
             print("2. Crear la base de datos: mysql -u root -p < basedeDatos.sql")
-            print("3. Verificar usuario y contraseña en conexion.py")
+            print("3. Verificar CD_DB_USER y CD_DB_PASSWORD (ver Data/configuracion.py)")
             return False
 
     except Exception as e:
@@ -182,4 +483,5 @@ def probar_conexion():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     probar_conexion()
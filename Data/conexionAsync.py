@@ -0,0 +1,220 @@
+import logging
+import contextvars
+from contextlib import asynccontextmanager
+
+from Data.configuracion import obtener_configuracion
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+class ConexionAsyncException(Exception):
+    """Excepción personalizada para errores de la conexión asíncrona"""
+    pass
+
+
+class ConexionAsync:
+    """
+    Pool de conexiones asíncronas a MySQL (aiomysql)
+
+    Equivalente asíncrono de Conexion: las consultas no bloquean el event loop,
+    por lo que un servidor web puede atender muchas peticiones concurrentes sin
+    un hilo por consulta.
+
+    Las conexiones trabajan en autocommit: cada consulta suelta ve los datos
+    confirmados más recientes y ninguna vuelve al pool con una transacción
+    abierta. transaccion() inicia una transacción explícita con BEGIN.
+
+    Se puede inyectar cualquier pool con la interfaz de aiomysql (acquire(),
+    close(), wait_closed() y conexiones en autocommit con cursor(), begin(),
+    commit(), rollback()), por ejemplo uno falso en memoria para pruebas.
+    """
+
+    def __init__(self, pool=None, minimo=None, maximo=None, config=None):
+        """
+        Inicializa los parámetros de conexión
+
+        Args:
+            pool (optional): Pool ya creado; si se omite se crea con aiomysql
+            minimo (int, optional): Conexiones mínimas del pool (CD_DB_POOL_MINIMO)
+            maximo (int, optional): Conexiones máximas del pool (CD_DB_POOL_MAXIMO)
+            config (ConfiguracionBD, optional): Parámetros de conexión; por
+                defecto los del entorno (ver Data/configuracion.py)
+        """
+        config = config or obtener_configuracion()
+        self.host = config.host
+        self.database = config.database
+        self.user = config.user
+        self.password = config.password
+        self.port = config.port
+        self.charset = config.charset
+        self.timeout_conexion = config.timeout_conexion
+        self.minimo = config.pool_minimo if minimo is None else minimo
+        self.maximo = config.pool_maximo if maximo is None else maximo
+        self.pool = pool
+        # Clase de cursor sin buffer para iterar resultados grandes
+        self.cursor_streaming = None
+        # Conexión de la transacción en curso dentro de la tarea actual. Es
+        # propia de cada instancia: otra ConexionAsync (otra base de datos)
+        # usada en la misma tarea no debe recibir esta conexión.
+        self._conexion_transaccion = contextvars.ContextVar(
+            f'conexion_transaccion_{id(self):x}', default=None)
+
+    async def conectar(self):
+        """Crea el pool de conexiones si aún no existe"""
+        if self.pool is not None:
+            return self.pool
+
+        try:
+            import aiomysql
+        except ImportError as e:
+            raise ConexionAsyncException(f"aiomysql no está instalado: {e}")
+
+        try:
+            self.pool = await aiomysql.create_pool(
+                host=self.host,
+                db=self.database,
+                user=self.user,
+                password=self.password,
+                port=self.port,
+                charset=self.charset,
+                connect_timeout=self.timeout_conexion,
+                autocommit=True,
+                minsize=self.minimo,
+                maxsize=self.maximo
+            )
+            self.cursor_streaming = aiomysql.SSCursor
+            logger.info(f"Pool asíncrono creado ({self.minimo}-{self.maximo} conexiones)")
+            return self.pool
+        except Exception as e:
+            logger.error(f"Error al crear pool asíncrono: {e}")
+            raise ConexionAsyncException(f"No se pudo conectar a la base de datos: {e}")
+
+    async def desconectar(self):
+        """Cierra el pool y todas sus conexiones"""
+        if self.pool is None:
+            return
+        try:
+            self.pool.close()
+            await self.pool.wait_closed()
+            logger.info("Pool asíncrono cerrado")
+        except Exception as e:
+            logger.error(f"Error al cerrar pool asíncrono: {e}")
+        finally:
+            self.pool = None
+
+    @asynccontextmanager
+    async def adquirir(self):
+        """
+        Obtiene una conexión del pool
+
+        Dentro de una transacción retorna la conexión de la transacción para
+        que todas las operaciones de la tarea compartan el mismo commit.
+        """
+        conn = self._conexion_transaccion.get()
+        if conn is not None:
+            yield conn
+            return
+
+        pool = await self.conectar()
+        async with pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def transaccion(self):
+        """
+        Agrupa varias operaciones en una transacción
+
+        Uso:
+            async with conexion.transaccion():
+                await dao.insertar(...)
+                await dao.actualizar(...)
+        """
+        conn = self._conexion_transaccion.get()
+        if conn is not None:
+            # Transacción anidada: se integra en la exterior
+            yield conn
+            return
+
+        pool = await self.conectar()
+        async with pool.acquire() as conn:
+            await conn.begin()
+            token = self._conexion_transaccion.set(conn)
+            try:
+                yield conn
+                await conn.commit()
+            except BaseException:
+                try:
+                    await conn.rollback()
+                except Exception as e:
+                    logger.error(f"Error al revertir transacción: {e}")
+                raise
+            finally:
+                self._conexion_transaccion.reset(token)
+
+    def en_transaccion(self):
+        """Indica si la tarea actual está dentro de una transacción"""
+        return self._conexion_transaccion.get() is not None
+
+    async def consultar(self, query, params=None):
+        """Ejecuta una consulta y retorna todas las filas"""
+        async with self.adquirir() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
+
+    async def consultar_uno(self, query, params=None):
+        """Ejecuta una consulta y retorna la primera fila o None"""
+        async with self.adquirir() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return await cursor.fetchone()
+
+    async def ejecutar(self, query, params=None):
+        """
+        Ejecuta una sentencia de escritura
+
+        Fuera de una transacción se confirma inmediatamente (autocommit).
+
+        Returns:
+            tuple: (filas_afectadas, ultimo_id)
+        """
+        async with self.adquirir() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return cursor.rowcount, cursor.lastrowid
+
+    async def iterar(self, query, params=None, tamano_lote=500):
+        """
+        Recorre el resultado de una consulta por lotes sin cargarlo completo
+
+        Si el recorrido puede interrumpirse antes del final, conviene cerrar
+        el generador explícitamente para liberar la conexión de inmediato:
+
+        Uso:
+            async with contextlib.aclosing(conexion.iterar(sql)) as filas:
+                async for fila in filas:
+                    ...
+        """
+        async with self.adquirir() as conn:
+            if self.cursor_streaming is not None:
+                cursor = await conn.cursor(self.cursor_streaming)
+            else:
+                cursor = await conn.cursor()
+            try:
+                await cursor.execute(query, params)
+                while True:
+                    filas = await cursor.fetchmany(tamano_lote)
+                    if not filas:
+                        break
+                    for fila in filas:
+                        yield fila
+            finally:
+                # Un cursor sin buffer deja en la conexión las filas que no se
+                # leyeron; close() las descarta antes de devolverla al pool
+                try:
+                    await cursor.close()
+                except Exception as e:
+                    logger.error(f"Error al cerrar cursor de iteración: {e}")
+                    # No devolver al pool una conexión con un resultado a medias
+                    conn.close()
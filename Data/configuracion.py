@@ -0,0 +1,195 @@
+"""
+CONFIGURACIÓN - Creative Designs
+Parámetros de conexión a la base de datos leídos del entorno
+
+Descripción: La configuración se carga una sola vez por proceso y la
+comparten Conexion, ConexionAsync, los backends y el enrutador de réplicas.
+Cada valor se toma, por orden de prioridad, de:
+
+    1. Variables de entorno CD_DB_<NOMBRE> (p. ej. CD_DB_HOST, CD_DB_PORT)
+    2. El archivo indicado en CD_CONFIG (.json, o .ini con sección [basedatos])
+    3. Los valores por defecto de esta clase
+
+Ejemplo:
+    CD_DB_PASSWORD=secreto CD_DB_REPLICAS=10.0.0.2,10.0.0.3:3307 python main.py
+    CD_DB_BACKEND=sqlite CD_DB_RUTA_SQLITE=/tmp/cd.db python main.py
+"""
+
+import os
+import logging
+import threading
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+PREFIJO_ENTORNO = "CD_DB_"
+VARIABLE_ARCHIVO = "CD_CONFIG"
+SECCION_INI = "basedatos"
+
+
+class ConfiguracionException(Exception):
+    """Excepción para valores de configuración inválidos"""
+    pass
+
+
+class ConfiguracionBD:
+    """
+    Parámetros de la base de datos
+
+    Los atributos de clase son los valores por defecto; cada uno puede
+    sobrescribirse con la variable de entorno CD_DB_<NOMBRE EN MAYÚSCULAS>
+    o con una clave del mismo nombre en el archivo de configuración.
+    """
+
+    # Conexión
+    host = 'localhost'
+    port = 3306
+    database = 'creative_designs'
+    user = 'root'
+    password = ''
+    charset = 'utf8mb4'
+    timeout_conexion = 5
+    # Backend: 'mysql' o 'sqlite' (ruta_sqlite = archivo o ':memory:')
+    backend = 'mysql'
+    ruta_sqlite = ':memory:'
+    # Pool de ConexionAsync
+    pool_minimo = 1
+    pool_maximo = 10
+    # Reintentos y corta-circuito (ver Data/resiliencia.py)
+    intentos_conexion = 3
+    espera_base = 0.1
+    espera_maxima = 2.0
+    umbral_fallos = 5
+    enfriamiento = 30.0
+    # Réplicas de lectura "host[:puerto]" separadas por comas (ver Data/replicas.py)
+    replicas = ''
+    ventana_lectura_propia = 2.0
+
+    def __init__(self, **valores):
+        for nombre, valor in valores.items():
+            self.asignar(nombre, valor)
+
+    @classmethod
+    def campos(cls) -> List[str]:
+        """Nombres de los parámetros configurables"""
+        return [nombre for nombre, valor in vars(cls).items()
+                if not nombre.startswith('_') and isinstance(valor, (str, int, float))]
+
+    def asignar(self, nombre: str, valor):
+        """
+        Asigna un parámetro convirtiéndolo al tipo de su valor por defecto
+
+        Raises:
+            ConfiguracionException: Si el parámetro no existe o el valor no es válido
+        """
+        nombre = nombre.lower()
+        if nombre not in self.campos():
+            raise ConfiguracionException(f"Parámetro de configuración desconocido: {nombre}")
+
+        tipo = type(getattr(type(self), nombre))
+        try:
+            setattr(self, nombre, tipo(valor))
+        except (TypeError, ValueError):
+            raise ConfiguracionException(
+                f"Valor inválido para {nombre}: {valor!r} (se esperaba {tipo.__name__})")
+
+    def lista_replicas(self) -> List[tuple]:
+        """
+        Retorna las réplicas configuradas
+
+        Returns:
+            List[tuple]: (host, puerto) de cada réplica; puerto None si se omitió
+        """
+        resultado = []
+        for entrada in self.replicas.split(','):
+            entrada = entrada.strip()
+            if not entrada:
+                continue
+            host, _, puerto = entrada.partition(':')
+            resultado.append((host, int(puerto) if puerto else None))
+        return resultado
+
+    def to_dict(self, ocultar_password: bool = True) -> dict:
+        """Convierte la configuración a diccionario"""
+        datos = {nombre: getattr(self, nombre) for nombre in self.campos()}
+        if ocultar_password and datos['password']:
+            datos['password'] = '***'
+        return datos
+
+    def __repr__(self):
+        return f"ConfiguracionBD({self.to_dict()})"
+
+
+def _leer_archivo(ruta: str) -> dict:
+    """Lee un archivo de configuración .json o .ini"""
+    if ruta.lower().endswith('.json'):
+        import json
+        with open(ruta, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        return datos.get(SECCION_INI, datos)
+
+    import configparser
+    parser = configparser.ConfigParser()
+    with open(ruta, 'r', encoding='utf-8') as f:
+        parser.read_file(f)
+    if not parser.has_section(SECCION_INI):
+        return {}
+    return dict(parser.items(SECCION_INI))
+
+
+def cargar_configuracion(ruta: Optional[str] = None, entorno=None) -> ConfiguracionBD:
+    """
+    Construye la configuración a partir de un archivo y del entorno
+
+    Args:
+        ruta (str, optional): Archivo de configuración; por defecto CD_CONFIG
+        entorno (dict, optional): Variables de entorno; por defecto os.environ
+
+    Raises:
+        ConfiguracionException: Si el archivo no se puede leer o un valor es inválido
+    """
+    entorno = os.environ if entorno is None else entorno
+    config = ConfiguracionBD()
+
+    ruta = ruta or entorno.get(VARIABLE_ARCHIVO)
+    if ruta:
+        try:
+            valores = _leer_archivo(ruta)
+        except Exception as e:
+            raise ConfiguracionException(f"No se pudo leer la configuración de {ruta}: {e}")
+        for nombre, valor in valores.items():
+            config.asignar(nombre, valor)
+        logger.info(f"Configuración cargada desde {ruta}")
+
+    for nombre in config.campos():
+        valor = entorno.get(PREFIJO_ENTORNO + nombre.upper())
+        if valor is not None:
+            config.asignar(nombre, valor)
+
+    return config
+
+
+_configuracion: Optional[ConfiguracionBD] = None
+_lock = threading.Lock()
+
+
+def obtener_configuracion() -> ConfiguracionBD:
+    """Retorna la configuración del proceso, cargándola la primera vez"""
+    global _configuracion
+    if _configuracion is None:
+        with _lock:
+            if _configuracion is None:
+                _configuracion = cargar_configuracion()
+    return _configuracion
+
+
+def configurar(config: ConfiguracionBD):
+    """
+    Reemplaza la configuración del proceso
+
+    Afecta a las conexiones creadas a partir de ahora. Si el backend o las
+    réplicas ya se usaron, hay que volver a configurarlos con
+    backends.configurar_backend() y replicas.configurar_replicas().
+    """
+    global _configuracion
+    _configuracion = config
@@ -0,0 +1,407 @@
+"""
+MÉTRICAS DE CONSULTAS - Creative Designs
+Medición de tiempos de la capa de datos
+
+Descripción: Mide las fases de conexión, ejecución y lectura de cada
+sentencia, acumula contadores e histogramas de latencia por plantilla SQL
+(p50/p95/p99) y escribe en un log aparte las sentencias que superan un umbral,
+con los parámetros ocultos.
+"""
+
+import re
+import math
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Log de consultas lentas (se puede dirigir a un archivo con configurar_log_lento)
+logger_lento = logging.getLogger("creative_designs.consultas_lentas")
+
+# Parámetros que se describen en el log lento antes de resumir el resto
+_MAX_PARAMETROS_LOG = 10
+
+_ESPACIOS = re.compile(r"\s+")
+_LISTA_MARCADORES = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+_LITERAL_CADENA = re.compile(r"'(?:[^'\\]|\\.)*'")
+_LITERAL_NUMERO = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+class HistogramaLatencia:
+    """
+    Histograma de latencias con cubetas de crecimiento geométrico
+
+    Usa memoria constante sin importar cuántas muestras reciba; los
+    percentiles se estiman con un error relativo menor al factor de
+    crecimiento entre cubetas (10%).
+    """
+
+    MINIMO = 1e-5      # 10 microsegundos
+    FACTOR = 1.1
+    CUBETAS = 200      # cubre hasta ~30 minutos
+
+    def __init__(self):
+        self.cuentas = [0] * (self.CUBETAS + 1)
+        self.total = 0
+        self.suma = 0.0
+        self.maximo = 0.0
+
+    def _indice(self, segundos: float) -> int:
+        if segundos <= self.MINIMO:
+            return 0
+        indice = int(math.log(segundos / self.MINIMO, self.FACTOR)) + 1
+        return min(indice, self.CUBETAS)
+
+    def agregar(self, segundos: float):
+        """Registra una muestra en segundos"""
+        self.cuentas[self._indice(segundos)] += 1
+        self.total += 1
+        self.suma += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def percentil(self, p: float) -> float:
+        """
+        Estima un percentil
+
+        Args:
+            p (float): Percentil entre 0 y 100
+
+        Returns:
+            float: Latencia estimada en segundos
+        """
+        if not self.total:
+            return 0.0
+        objetivo = max(1, math.ceil(self.total * p / 100.0))
+        acumulado = 0
+        for indice, cuenta in enumerate(self.cuentas):
+            acumulado += cuenta
+            if acumulado >= objetivo:
+                limite = self.MINIMO * (self.FACTOR ** indice)
+                return min(limite, self.maximo)
+        return self.maximo
+
+    def resumen(self) -> Dict:
+        """Retorna conteo, promedio, p50, p95, p99 y máximo en milisegundos"""
+        return {
+            'muestras': self.total,
+            'promedio_ms': (self.suma / self.total * 1000) if self.total else 0.0,
+            'p50_ms': self.percentil(50) * 1000,
+            'p95_ms': self.percentil(95) * 1000,
+            'p99_ms': self.percentil(99) * 1000,
+            'max_ms': self.maximo * 1000
+        }
+
+
+class _EstadisticaSentencia:
+    """Contadores de una plantilla SQL"""
+
+    __slots__ = ('llamadas', 'errores', 'lentas', 'ejecucion', 'lectura', 'total')
+
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.lentas = 0
+        self.ejecucion = HistogramaLatencia()
+        self.lectura = HistogramaLatencia()
+        self.total = HistogramaLatencia()
+
+
+def normalizar_sql(sql: str) -> str:
+    """
+    Obtiene la plantilla de una sentencia para agrupar sus métricas
+
+    Colapsa espacios, reemplaza literales por ? y las listas IN (%s, %s, ...)
+    de cualquier longitud por IN (%s...).
+
+    Args:
+        sql (str): Sentencia SQL
+
+    Returns:
+        str: Plantilla normalizada
+    """
+    plantilla = _ESPACIOS.sub(" ", sql).strip()
+    plantilla = _LISTA_MARCADORES.sub("(%s...)", plantilla)
+    plantilla = _LITERAL_CADENA.sub("?", plantilla)
+    return _LITERAL_NUMERO.sub("?", plantilla)
+
+
+def ocultar_parametros(params) -> str:
+    """
+    Describe los parámetros sin revelar sus valores (tipo y longitud)
+
+    Args:
+        params: Tupla, lista o diccionario de parámetros
+
+    Returns:
+        str: Descripción segura para el log
+    """
+    if params is None:
+        return "()"
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {_ocultar(v)}" for k, v in params.items()) + "}"
+    try:
+        valores = list(params)
+    except TypeError:
+        return _ocultar(params)
+    descripcion = ", ".join(_ocultar(v) for v in valores[:_MAX_PARAMETROS_LOG])
+    if len(valores) > _MAX_PARAMETROS_LOG:
+        descripcion += f", ... {len(valores)} en total"
+    return "(" + descripcion + ")"
+
+
+def _ocultar(valor) -> str:
+    if valor is None:
+        return "NULL"
+    if isinstance(valor, (str, bytes)):
+        return f"<{type(valor).__name__}:{len(valor)}>"
+    return f"<{type(valor).__name__}>"
+
+
+class RegistroConsultas:
+    """
+    Acumula las métricas de todas las sentencias del proceso
+
+    Atributos:
+        umbral_lento (float): Segundos a partir de los cuales una sentencia
+            se escribe en el log de consultas lentas
+    """
+
+    def __init__(self, umbral_lento: float = 0.5):
+        self.umbral_lento = umbral_lento
+        self._lock = threading.Lock()
+        self._sentencias: Dict[str, _EstadisticaSentencia] = {}
+        self._plantillas: Dict[str, str] = {}
+        self.conexiones = HistogramaLatencia()
+        self.errores_conexion = 0
+
+    def plantilla(self, sql: str) -> str:
+        """Retorna la plantilla de una sentencia (memorizada por texto SQL)"""
+        plantilla = self._plantillas.get(sql)
+        if plantilla is None:
+            plantilla = normalizar_sql(sql)
+            if len(self._plantillas) < 4096:
+                self._plantillas[sql] = plantilla
+        return plantilla
+
+    def registrar_conexion(self, segundos: float, exito: bool = True):
+        """Registra el tiempo de apertura de una conexión"""
+        with self._lock:
+            self.conexiones.agregar(segundos)
+            if not exito:
+                self.errores_conexion += 1
+
+    def registrar_sentencia(self, sql: str, ejecucion: float, lectura: float = 0.0,
+                            params=None, error: bool = False):
+        """
+        Registra una sentencia completa
+
+        Args:
+            sql (str): Sentencia ejecutada
+            ejecucion (float): Segundos en execute()
+            lectura (float): Segundos en fetch*()
+            params: Parámetros (solo se usan, ocultos, en el log lento)
+            error (bool): Si la ejecución falló
+        """
+        plantilla = self.plantilla(sql)
+        total = ejecucion + lectura
+        lenta = total >= self.umbral_lento
+
+        with self._lock:
+            estadistica = self._sentencias.get(plantilla)
+            if estadistica is None:
+                estadistica = self._sentencias[plantilla] = _EstadisticaSentencia()
+            estadistica.llamadas += 1
+            estadistica.ejecucion.agregar(ejecucion)
+            estadistica.total.agregar(total)
+            if lectura:
+                estadistica.lectura.agregar(lectura)
+            if error:
+                estadistica.errores += 1
+            if lenta:
+                estadistica.lentas += 1
+
+        if lenta:
+            logger_lento.warning(
+                f"Consulta lenta {total * 1000:.1f} ms "
+                f"(ejecución {ejecucion * 1000:.1f} ms, lectura {lectura * 1000:.1f} ms): "
+                f"{plantilla} params={ocultar_parametros(params)}"
+            )
+
+    def estadisticas(self) -> Dict:
+        """
+        Retorna las métricas acumuladas
+
+        Returns:
+            dict: Métricas de conexión y por plantilla SQL
+        """
+        with self._lock:
+            sentencias = {
+                plantilla: {
+                    'llamadas': e.llamadas,
+                    'errores': e.errores,
+                    'lentas': e.lentas,
+                    'ejecucion': e.ejecucion.resumen(),
+                    'lectura': e.lectura.resumen(),
+                    'total': e.total.resumen()
+                }
+                for plantilla, e in self._sentencias.items()
+            }
+            return {
+                'conexiones': self.conexiones.resumen(),
+                'errores_conexion': self.errores_conexion,
+                'sentencias': sentencias
+            }
+
+    def reporte(self, limite: int = 15) -> str:
+        """
+        Genera un reporte legible ordenado por tiempo total acumulado
+
+        Args:
+            limite (int): Número máximo de sentencias a mostrar
+
+        Returns:
+            str: Reporte formateado
+        """
+        datos = self.estadisticas()
+        conexiones = datos['conexiones']
+        lineas = [
+            "=" * 60,
+            "ESTADÍSTICAS DE CONSULTAS",
+            "=" * 60,
+            f"Conexiones: {conexiones['muestras']} (errores: {datos['errores_conexion']}) "
+            f"p50={conexiones['p50_ms']:.1f}ms p95={conexiones['p95_ms']:.1f}ms",
+            "-" * 60
+        ]
+        ordenadas = sorted(datos['sentencias'].items(),
+                           key=lambda item: item[1]['total']['promedio_ms'] * item[1]['llamadas'],
+                           reverse=True)
+        for plantilla, e in ordenadas[:limite]:
+            total = e['total']
+            lineas.append(plantilla[:100])
+            lineas.append(
+                f"  llamadas={e['llamadas']} errores={e['errores']} lentas={e['lentas']} "
+                f"p50={total['p50_ms']:.1f}ms p95={total['p95_ms']:.1f}ms "
+                f"p99={total['p99_ms']:.1f}ms max={total['max_ms']:.1f}ms"
+            )
+        if not ordenadas:
+            lineas.append("Sin consultas registradas")
+        lineas.append("=" * 60)
+        return "\n".join(lineas)
+
+    def reiniciar(self):
+        """Descarta todas las métricas acumuladas"""
+        with self._lock:
+            self._sentencias.clear()
+            self.conexiones = HistogramaLatencia()
+            self.errores_conexion = 0
+
+
+class CursorInstrumentado:
+    """Cursor que mide execute() y fetch*() y los reporta al registro"""
+
+    def __init__(self, cursor, registro: RegistroConsultas):
+        self._cursor = cursor
+        self._registro = registro
+        self._sql = None
+        self._params = None
+        self._ejecucion = 0.0
+        self._lectura = 0.0
+
+    def __getattr__(self, nombre):
+        return getattr(self._cursor, nombre)
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def _finalizar(self):
+        """Reporta la sentencia en curso (al leer todo, re-ejecutar o cerrar)"""
+        if self._sql is not None:
+            self._registro.registrar_sentencia(self._sql, self._ejecucion, self._lectura, self._params)
+            self._sql = None
+
+    def execute(self, sql, params=None, *args, **kwargs):
+        self._finalizar()
+        inicio = time.perf_counter()
+        try:
+            if params is None:
+                resultado = self._cursor.execute(sql, *args, **kwargs)
+            else:
+                resultado = self._cursor.execute(sql, params, *args, **kwargs)
+        except Exception:
+            self._registro.registrar_sentencia(sql, time.perf_counter() - inicio,
+                                               params=params, error=True)
+            raise
+        self._sql = sql
+        self._params = params
+        self._ejecucion = time.perf_counter() - inicio
+        self._lectura = 0.0
+        return resultado
+
+    def executemany(self, sql, lista_params, *args, **kwargs):
+        self._finalizar()
+        inicio = time.perf_counter()
+        try:
+            resultado = self._cursor.executemany(sql, lista_params, *args, **kwargs)
+        except Exception:
+            self._registro.registrar_sentencia(sql, time.perf_counter() - inicio, error=True)
+            raise
+        self._registro.registrar_sentencia(sql, time.perf_counter() - inicio)
+        return resultado
+
+    def _leer(self, metodo, *args):
+        inicio = time.perf_counter()
+        try:
+            return metodo(*args)
+        finally:
+            self._lectura += time.perf_counter() - inicio
+
+    def fetchone(self):
+        return self._leer(self._cursor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._leer(self._cursor.fetchmany, *args)
+
+    def fetchall(self):
+        filas = self._leer(self._cursor.fetchall)
+        self._finalizar()
+        return filas
+
+    def close(self):
+        self._finalizar()
+        return self._cursor.close()
+
+
+class ConexionInstrumentada:
+    """Envoltura de una conexión cuyos cursores se miden"""
+
+    def __init__(self, conexion, registro: RegistroConsultas):
+        self._conexion = conexion
+        self._registro = registro
+
+    def __getattr__(self, nombre):
+        return getattr(self._conexion, nombre)
+
+    def cursor(self, *args, **kwargs):
+        return CursorInstrumentado(self._conexion.cursor(*args, **kwargs), self._registro)
+
+
+def configurar_log_lento(ruta: str, umbral: Optional[float] = None):
+    """
+    Escribe las consultas lentas en un archivo
+
+    Args:
+        ruta (str): Archivo de log
+        umbral (float, optional): Nuevo umbral en segundos
+    """
+    manejador = logging.FileHandler(ruta, encoding="utf-8")
+    manejador.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+    logger_lento.addHandler(manejador)
+    if umbral is not None:
+        registro_consultas.umbral_lento = umbral
+
+
+# Registro compartido por todas las conexiones del proceso
+registro_consultas = RegistroConsultas()
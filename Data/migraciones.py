@@ -0,0 +1,501 @@
+"""
+MIGRACIONES DE ESQUEMA - Creative Designs
+Índices y columnas versionados para las consultas de los DAO
+
+Descripción: basedeDatos.sql solo define claves primarias, pero los DAO
+filtran y ordenan por Sticker.nombre, Sticker.categoria_id, clientes.email,
+clientes.telefono y ORDER BY nombre, apellido. Cada migración agrega un grupo
+de índices y se registra en la tabla schema_migraciones, de modo que
+aplicar_migraciones() solo ejecuta las pendientes y se puede correr en cada
+despliegue. verificar_indices() ejecuta EXPLAIN sobre las mismas consultas
+que ejecutan los DAO y reporta las que recorren la tabla o un índice completo
+u ordenan en memoria; las que por naturaleza leen toda la tabla (listados
+completos, LIKE '%x%') se reportan aparte como recorridos esperados.
+
+Uso:
+    python -m Data.migraciones              # aplica las migraciones pendientes
+    python -m Data.migraciones --verificar  # muestra el plan de cada consulta
+"""
+
+import sys
+import logging
+from typing import Dict, List, Optional
+
+from Data import clienteDAO, productoDAO
+from Data.conexion import Conexion
+
+logger = logging.getLogger(__name__)
+
+TABLA_MIGRACIONES = "schema_migraciones"
+
+
+class MigracionException(Exception):
+    """Excepción para errores al aplicar migraciones"""
+    pass
+
+
+class Indice:
+    """
+    Definición de un índice
+
+    Atributos:
+        nombre (str): Nombre del índice
+        tabla (str): Tabla indexada
+        columnas (tuple): Columnas en orden
+        tipo (str): '' (normal), 'UNIQUE' o 'FULLTEXT'
+        dialectos (tuple, optional): Dialectos donde se crea; por defecto
+            todos, salvo FULLTEXT que solo existe en MySQL
+    """
+
+    def __init__(self, nombre: str, tabla: str, columnas: tuple, tipo: str = '',
+                 dialectos: Optional[tuple] = None):
+        self.nombre = nombre
+        self.tabla = tabla
+        self.columnas = tuple(columnas)
+        self.tipo = tipo.upper()
+        if dialectos is None:
+            dialectos = ("mysql",) if self.tipo == "FULLTEXT" else ("mysql", "sqlite")
+        self.dialectos = dialectos
+
+    def soportado(self, dialecto: str) -> bool:
+        return dialecto in self.dialectos
+
+    def existe(self, cursor, dialecto: str) -> bool:
+        """Indica si el índice ya existe por nombre o por columnas"""
+        existentes = _indices_existentes(cursor, dialecto, self.tabla)
+        if self.nombre in existentes:
+            return True
+        columnas = tuple(c.lower() for c in self.columnas)
+        return any(tuple(c.lower() for c in cols) == columnas for cols in existentes.values())
+
+    def sql(self, dialecto: str) -> str:
+        """Sentencia CREATE INDEX para el dialecto ('mysql' o 'sqlite')"""
+        columnas = ", ".join(self.columnas)
+        tipo = f"{self.tipo} " if self.tipo else ""
+        si_no_existe = "IF NOT EXISTS " if dialecto == "sqlite" else ""
+        return f"CREATE {tipo}INDEX {si_no_existe}{self.nombre} ON {self.tabla} ({columnas})"
+
+    def __repr__(self):
+        return f"Indice({self.nombre} ON {self.tabla}({', '.join(self.columnas)}))"
+
+
+class ColumnaGenerada:
+    """
+    Columna calculada a partir de otras columnas de la fila
+
+    En MySQL se crea STORED (indexable y sin costo al leer); SQLite solo
+    permite agregar columnas VIRTUAL con ALTER TABLE, que también se pueden
+    indexar. Si una expresión es None la columna se omite en ese dialecto.
+
+    Atributos:
+        nombre (str): Nombre de la columna
+        tabla (str): Tabla a modificar
+        tipo_sql (str): Tipo de la columna (p. ej. 'VARCHAR(20)')
+        expresiones (dict): Dialecto -> expresión SQL
+    """
+
+    def __init__(self, nombre: str, tabla: str, tipo_sql: str, mysql: Optional[str],
+                 sqlite: Optional[str] = None):
+        self.nombre = nombre
+        self.tabla = tabla
+        self.tipo_sql = tipo_sql
+        self.expresiones = {"mysql": mysql, "sqlite": sqlite}
+
+    def soportado(self, dialecto: str) -> bool:
+        return self.expresiones.get(dialecto) is not None
+
+    def existe(self, cursor, dialecto: str) -> bool:
+        """Indica si la tabla ya tiene la columna"""
+        if dialecto == "sqlite":
+            # table_xinfo incluye las columnas generadas (table_info no)
+            cursor.execute(f"PRAGMA table_xinfo({self.tabla})")
+            return any(fila[1].lower() == self.nombre.lower() for fila in cursor.fetchall())
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+        """, (self.tabla, self.nombre))
+        return cursor.fetchone()[0] > 0
+
+    def sql(self, dialecto: str) -> str:
+        """Sentencia ALTER TABLE para el dialecto ('mysql' o 'sqlite')"""
+        almacenamiento = "VIRTUAL" if dialecto == "sqlite" else "STORED"
+        return (f"ALTER TABLE {self.tabla} ADD COLUMN {self.nombre} {self.tipo_sql} "
+                f"GENERATED ALWAYS AS ({self.expresiones[dialecto]}) {almacenamiento}")
+
+    def __repr__(self):
+        return f"ColumnaGenerada({self.tabla}.{self.nombre})"
+
+
+class Migracion:
+    """
+    Grupo de cambios de esquema que se aplica una sola vez
+
+    Atributos:
+        version (int): Número de versión (creciente)
+        descripcion (str): Texto que se guarda en schema_migraciones
+        operaciones (list): Índices y columnas a crear, en orden
+    """
+
+    def __init__(self, version: int, descripcion: str, operaciones: list):
+        self.version = version
+        self.descripcion = descripcion
+        self.operaciones = operaciones
+
+
+def _sin_separadores(columna: str) -> str:
+    """Expresión SQL que quita de un teléfono los separadores habituales"""
+    expresion = columna
+    for caracter in (" ", "-", "(", ")", "+", "."):
+        expresion = f"REPLACE({expresion}, '{caracter}', '')"
+    return expresion
+
+
+MIGRACIONES = [
+    Migracion(1, "Índices de Sticker por nombre y categoría", [
+        # listar() y buscar_por_nombre() ordenan por nombre
+        Indice("idx_sticker_nombre", "Sticker", ("nombre",)),
+        # listar_por_categoria(): filtra por categoría y ordena por nombre
+        Indice("idx_sticker_categoria_nombre", "Sticker", ("categoria_id", "nombre")),
+    ]),
+    Migracion(2, "Índices de clientes por email, teléfono y nombre", [
+        # Bases creadas antes de que basedeDatos.sql definiera la clave única
+        Indice("uk_clientes_email", "clientes", ("email",), "UNIQUE"),
+        Indice("idx_clientes_telefono", "clientes", ("telefono",)),
+        # ORDER BY nombre, apellido con desempate estable para paginar
+        Indice("idx_clientes_nombre_apellido", "clientes", ("nombre", "apellido", "id_cliente")),
+    ]),
+    Migracion(3, "Índice FULLTEXT de Sticker por nombre y especificaciones", [
+        # Solo MySQL: SQLite no tiene índices FULLTEXT y se omite
+        Indice("ft_sticker_nombre_especificaciones", "Sticker",
+               ("nombre", "especificaciones"), "FULLTEXT"),
+    ]),
+    Migracion(4, "Búsqueda de clientes por texto y dígitos de teléfono", [
+        # ClienteDAO.buscar_avanzada(modo='texto'); en SQLite se usa el
+        # índice de trigramas en memoria (ver Data/trigramas.py)
+        Indice("ft_clientes_nombre_apellido_email", "clientes",
+               ("nombre", "apellido", "email"), "FULLTEXT"),
+        # Dígitos del teléfono para buscar por prefijo con un índice, y los
+        # mismos dígitos al revés para buscar por sufijo (últimos dígitos)
+        ColumnaGenerada("telefono_digitos", "clientes", "VARCHAR(20)",
+                        mysql=_sin_separadores("telefono"), sqlite=_sin_separadores("telefono")),
+        ColumnaGenerada("telefono_digitos_inv", "clientes", "VARCHAR(20)",
+                        mysql=f"REVERSE({_sin_separadores('telefono')})"),
+        Indice("idx_clientes_telefono_digitos", "clientes", ("telefono_digitos",)),
+        Indice("idx_clientes_telefono_digitos_inv", "clientes", ("telefono_digitos_inv",),
+               dialectos=("mysql",)),
+    ]),
+]
+
+
+class ConsultaDAO:
+    """
+    Consulta de un DAO cuyo plan se verifica con EXPLAIN
+
+    Atributos:
+        descripcion (str): Método del DAO que la ejecuta
+        sql (str): SQL con marcadores %s, tal como la ejecuta el DAO
+        params (tuple): Parámetros de ejemplo
+        recorrido_esperado (bool): La consulta lee toda la tabla por
+            naturaleza (listado completo, LIKE '%x%'); basta con que no
+            ordene en memoria
+        dialectos (tuple): Dialectos donde se verifica
+    """
+
+    def __init__(self, descripcion: str, sql: str, params: tuple = (),
+                 recorrido_esperado: bool = False, dialectos: tuple = ("mysql", "sqlite")):
+        self.descripcion = descripcion
+        self.sql = sql
+        self.params = tuple(params)
+        self.recorrido_esperado = recorrido_esperado
+        self.dialectos = dialectos
+
+    def __repr__(self):
+        return f"ConsultaDAO({self.descripcion})"
+
+
+EMAIL_EJEMPLO = "juan.perez@example.com"
+
+# Consultas de lectura de los DAO, construidas con las mismas constantes SQL
+# que usan productoDAO.py y clienteDAO.py
+CONSULTAS_DAO = [
+    ConsultaDAO("ProductoDAO.listar", productoDAO.SQL_LISTAR, recorrido_esperado=True),
+    ConsultaDAO("ProductoDAO.listar_por_categoria", productoDAO.SQL_LISTAR_POR_CATEGORIA, (1,)),
+    ConsultaDAO("ProductoDAO.listar_con_categoria",
+                productoDAO.SQL_LISTAR_CON_CATEGORIA.format(orden="s.nombre"), recorrido_esperado=True),
+    ConsultaDAO("ProductoDAO.buscar_por_id", productoDAO.SQL_BUSCAR_POR_ID, (1,)),
+    ConsultaDAO("ProductoDAO.buscar_por_ids",
+                productoDAO.SQL_BUSCAR_POR_IDS.format(marcadores="%s, %s, %s"), (1, 2, 3)),
+    ConsultaDAO("ProductoDAO.buscar_por_nombre", productoDAO.SQL_BUSCAR_POR_NOMBRE, ("%vinilo%",),
+                recorrido_esperado=True),
+    ConsultaDAO("ClienteDAO.listar", clienteDAO.SQL_LISTAR, recorrido_esperado=True),
+    ConsultaDAO("ClienteDAO.iterar", clienteDAO.SQL_ITERAR, (0, 1000)),
+    ConsultaDAO("ClienteDAO.buscar_por_id", clienteDAO.SQL_BUSCAR_POR_ID, (1,)),
+    ConsultaDAO("ClienteDAO.buscar_por_nombre", clienteDAO.SQL_BUSCAR_POR_NOMBRE, ("%juan%", "%juan%"),
+                recorrido_esperado=True),
+    ConsultaDAO("ClienteDAO.buscar_por_email", clienteDAO.SQL_BUSCAR_POR_EMAIL, (EMAIL_EJEMPLO,)),
+    ConsultaDAO("ClienteDAO.buscar_por_telefono", clienteDAO.SQL_BUSCAR_POR_TELEFONO, ("%5555%",),
+                recorrido_esperado=True),
+    ConsultaDAO("ClienteDAO.existe_email", clienteDAO.SQL_EXISTE_EMAIL, (EMAIL_EJEMPLO,)),
+    # Recorre el índice (nombre, apellido) en orden y se detiene tras LIMIT + OFFSET filas
+    ConsultaDAO("ClienteDAO.listar_paginado", clienteDAO.SQL_LISTAR_PAGINADO, (10, 0),
+                recorrido_esperado=True),
+    ConsultaDAO("ClienteDAO.buscar_avanzada(modo='like')",
+                *clienteDAO.ClienteDAO.sql_busqueda_like(nombre="juan", limite=50),
+                recorrido_esperado=True),
+    ConsultaDAO("ClienteDAO.buscar_avanzada(modo='texto')",
+                *clienteDAO.ClienteDAO.sql_busqueda_texto(nombre="juan", telefono="5555"),
+                dialectos=("mysql",)),
+    ConsultaDAO("ClienteDAO.buscar_avanzada(modo='texto', email)",
+                *clienteDAO.ClienteDAO.sql_busqueda_texto(email=EMAIL_EJEMPLO),
+                dialectos=("mysql",)),
+]
+
+
+def _dialecto(conexion: Conexion) -> str:
+    return "sqlite" if conexion.backend.nombre == "sqlite" else "mysql"
+
+
+def _indices_existentes(cursor, dialecto: str, tabla: str) -> Dict[str, tuple]:
+    """
+    Retorna los índices de una tabla
+
+    Returns:
+        Dict[str, tuple]: nombre del índice -> columnas en orden
+    """
+    if dialecto == "sqlite":
+        cursor.execute(f"PRAGMA index_list({tabla})")
+        nombres = [fila[1] for fila in cursor.fetchall()]
+        indices = {}
+        for nombre in nombres:
+            cursor.execute(f"PRAGMA index_info({nombre})")
+            indices[nombre] = tuple(fila[2] for fila in sorted(cursor.fetchall()))
+        return indices
+
+    cursor.execute("""
+        SELECT index_name, column_name
+        FROM information_schema.STATISTICS
+        WHERE table_schema = DATABASE() AND table_name = %s
+        ORDER BY index_name, seq_in_index
+    """, (tabla,))
+    indices = {}
+    for nombre, columna in cursor.fetchall():
+        indices.setdefault(nombre, ())
+        indices[nombre] += (columna,)
+    return indices
+
+
+def _crear_tabla_migraciones(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {TABLA_MIGRACIONES} (
+            version INT PRIMARY KEY,
+            descripcion VARCHAR(255) NOT NULL,
+            aplicada_en TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def versiones_aplicadas(conexion: Optional[Conexion] = None) -> List[int]:
+    """Retorna las versiones ya registradas en schema_migraciones"""
+    conexion = conexion or Conexion()
+    cursor = None
+    try:
+        conn = conexion.conectar()
+        if not conn:
+            raise MigracionException("No se pudo conectar a la base de datos")
+        cursor = conn.cursor()
+        _crear_tabla_migraciones(cursor)
+        cursor.execute(f"SELECT version FROM {TABLA_MIGRACIONES} ORDER BY version")
+        return [fila[0] for fila in cursor.fetchall()]
+    except conexion.backend.Error as e:
+        raise MigracionException(f"Error al leer {TABLA_MIGRACIONES}: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        conexion.desconectar()
+
+
+def aplicar_migraciones(conexion: Optional[Conexion] = None,
+                        migraciones: Optional[List[Migracion]] = None) -> List[int]:
+    """
+    Aplica las migraciones pendientes en orden de versión
+
+    Los índices que ya existen (con el mismo nombre o las mismas columnas)
+    y las columnas que ya existen se omiten, por lo que una base modificada
+    a mano no falla.
+
+    Args:
+        conexion (Conexion, optional): Conexión a usar
+        migraciones (list, optional): Migraciones; por defecto MIGRACIONES
+
+    Returns:
+        List[int]: Versiones aplicadas en esta llamada
+
+    Raises:
+        MigracionException: Si un índice no se puede crear (p. ej. emails
+            duplicados al crear uk_clientes_email)
+    """
+    conexion = conexion or Conexion()
+    migraciones = sorted(migraciones or MIGRACIONES, key=lambda m: m.version)
+    dialecto = _dialecto(conexion)
+    aplicadas = set(versiones_aplicadas(conexion))
+    nuevas = []
+
+    cursor = None
+    try:
+        conn = conexion.conectar()
+        if not conn:
+            raise MigracionException("No se pudo conectar a la base de datos")
+        cursor = conn.cursor()
+
+        for migracion in migraciones:
+            if migracion.version in aplicadas:
+                continue
+
+            for operacion in migracion.operaciones:
+                if not operacion.soportado(dialecto):
+                    logger.info(f"{operacion!r} omitido: no aplica a {dialecto}")
+                    continue
+                if operacion.existe(cursor, dialecto):
+                    logger.info(f"{operacion!r} ya existe")
+                    continue
+                try:
+                    cursor.execute(operacion.sql(dialecto))
+                except conexion.backend.Error as e:
+                    conn.rollback()
+                    raise MigracionException(
+                        f"Migración {migracion.version}: no se pudo crear {operacion!r}: {e}")
+                logger.info(f"Creado: {operacion!r}")
+
+            cursor.execute(
+                f"INSERT INTO {TABLA_MIGRACIONES} (version, descripcion) VALUES (%s, %s)",
+                (migracion.version, migracion.descripcion))
+            conn.commit()
+            nuevas.append(migracion.version)
+            logger.info(f"Migración {migracion.version} aplicada: {migracion.descripcion}")
+
+        return nuevas
+
+    except conexion.backend.Error as e:
+        raise MigracionException(f"Error al aplicar migraciones: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        conexion.desconectar()
+
+
+# ==================== VERIFICACIÓN CON EXPLAIN ====================
+
+def _analizar_plan_mysql(cursor) -> dict:
+    """Interpreta las filas de EXPLAIN de MySQL"""
+    columnas = [d[0].lower() for d in cursor.description]
+    filas = [dict(zip(columnas, fila)) for fila in cursor.fetchall()]
+    # Filas sin tabla: consultas resueltas por el optimizador (p. ej. "Impossible WHERE")
+    accesos = [f for f in filas if f.get('table')]
+    # type=ALL recorre la tabla y type=index el índice completo; cualquier
+    # otro acceso sin índice (salvo const/system) también lee toda la tabla
+    recorre = any(f.get('type') in ('ALL', 'index') or
+                  not (f.get('key') or f.get('type') in ('const', 'system')) for f in accesos)
+    extra = " ".join(str(f.get('extra') or '') for f in filas)
+    return {
+        'recorre_tabla': recorre,
+        'ordena_en_memoria': 'Using filesort' in extra,
+        'plan': [f"{f.get('table')}: type={f.get('type')} key={f.get('key')} {f.get('extra') or ''}".strip()
+                 for f in filas]
+    }
+
+
+def _analizar_plan_sqlite(cursor) -> dict:
+    """Interpreta las filas de EXPLAIN QUERY PLAN de SQLite"""
+    detalles = [fila[-1] for fila in cursor.fetchall()]
+    # SCAN recorre la tabla, o el índice completo con "USING INDEX"; solo
+    # SEARCH usa el índice para llegar a las filas
+    return {
+        'recorre_tabla': any(d.startswith("SCAN") and not d.startswith("SCAN CONSTANT ROW")
+                             for d in detalles),
+        'ordena_en_memoria': any("TEMP B-TREE" in d for d in detalles),
+        'plan': detalles
+    }
+
+
+def verificar_indices(conexion: Optional[Conexion] = None, consultas=None) -> List[dict]:
+    """
+    Ejecuta EXPLAIN sobre las consultas de los DAO
+
+    Una consulta es correcta si no ordena en memoria y, salvo que sea un
+    recorrido esperado, llega a sus filas con un índice (SCAN en SQLite y
+    type=ALL o type=index en MySQL cuentan como recorridos). En tablas casi
+    vacías el optimizador puede preferir recorrer la tabla aunque exista el
+    índice; el resultado es representativo con datos reales.
+
+    Args:
+        conexion (Conexion, optional): Conexión a usar
+        consultas (list, optional): ConsultaDAO a verificar; por defecto
+            CONSULTAS_DAO
+
+    Returns:
+        List[dict]: Por consulta: 'consulta', 'correcta', 'recorre_tabla',
+            'recorrido_esperado', 'ordena_en_memoria' y 'plan' (líneas del plan)
+    """
+    conexion = conexion or Conexion()
+    dialecto = _dialecto(conexion)
+    prefijo, analizar = (("EXPLAIN QUERY PLAN", _analizar_plan_sqlite) if dialecto == "sqlite"
+                         else ("EXPLAIN", _analizar_plan_mysql))
+    resultados = []
+
+    cursor = None
+    try:
+        conn = conexion.conectar(lectura=True)
+        if not conn:
+            raise MigracionException("No se pudo conectar a la base de datos")
+        cursor = conn.cursor()
+
+        for consulta in consultas or CONSULTAS_DAO:
+            if dialecto not in consulta.dialectos:
+                continue
+            cursor.execute(f"{prefijo} {consulta.sql}", consulta.params)
+            resultado = analizar(cursor)
+            resultado['consulta'] = consulta.descripcion
+            resultado['recorrido_esperado'] = consulta.recorrido_esperado
+            resultado['correcta'] = not resultado['ordena_en_memoria'] and (
+                consulta.recorrido_esperado or not resultado['recorre_tabla'])
+            if not resultado['correcta']:
+                logger.warning(f"{consulta.descripcion} no usa los índices esperados: {resultado['plan']}")
+            resultados.append(resultado)
+
+        return resultados
+
+    except conexion.backend.Error as e:
+        raise MigracionException(f"Error al verificar índices: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        conexion.desconectar()
+
+
+def main(argumentos=None):
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    logging.basicConfig(level=logging.INFO)
+
+    if "--verificar" in argumentos:
+        resultados = verificar_indices()
+        esperados = [r for r in resultados if r['recorrido_esperado']]
+        for titulo, grupo in (("Consultas con índice", [r for r in resultados if not r['recorrido_esperado']]),
+                              ("Recorridos esperados (leen toda la tabla)", esperados)):
+            print(titulo)
+            for r in grupo:
+                print(f"{'✓' if r['correcta'] else '✗'} {r['consulta']}")
+                for linea in r['plan']:
+                    print(f"    {linea}")
+        if not all(r['correcta'] for r in resultados):
+            sys.exit(1)
+        return
+
+    nuevas = aplicar_migraciones()
+    if nuevas:
+        print(f"✓ Migraciones aplicadas: {', '.join(map(str, nuevas))}")
+    else:
+        print("✓ El esquema está al día")
+
+
+if __name__ == "__main__":
+    main()
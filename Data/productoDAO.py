@@ -1,156 +1,210 @@
-import sys
-import os
+import copy
 import logging
 
-# Agregar directorio raíz al path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
-
-# Importar conexión
-try:
-    from Data.conexion import Conexion
-except ImportError:
-    try:
-        from conexion import Conexion
-    except ImportError as e:
-        print(f"Error: No se pudo importar Conexion: {e}")
-        sys.exit(1)
-
-# Importar clase Producto
-try:
-    from Productos import Producto
-except ImportError as e:
-    print(f"Error: No se pudo importar Producto: {e}")
-    sys.exit(1)
-
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
+from Data.conexion import Conexion, ConexionException, MODO_LECTURA
+from Data.cache import CacheLRU, ContadorVersion
+from CreativeDesings.Productos import Producto
+
 logger = logging.getLogger(__name__)
 
+# Consultas de lectura (Data/migraciones.py verifica su plan con EXPLAIN)
+SQL_LISTAR = """SELECT s.id, s.nombre, s.precio, s.medida, s.especificaciones, s.categoria_id
+    FROM Sticker s ORDER BY s.nombre"""
+SQL_LISTAR_POR_CATEGORIA = """SELECT s.id, s.nombre, s.precio, s.medida, s.especificaciones, s.categoria_id
+    FROM Sticker s WHERE s.categoria_id = %s ORDER BY s.nombre"""
+SQL_LISTAR_CATEGORIAS = "SELECT id, nombre, descripcion FROM CategoriaSticker ORDER BY id"
+# {orden}: "s.nombre", o "c.id, s.nombre" para agrupar por categoría
+SQL_LISTAR_CON_CATEGORIA = """SELECT s.id, s.nombre, s.precio, s.medida, s.especificaciones,
+    s.categoria_id, c.nombre, c.descripcion
+    FROM Sticker s LEFT JOIN CategoriaSticker c ON c.id = s.categoria_id
+    ORDER BY {orden}"""
+SQL_BUSCAR_POR_ID = """SELECT id, nombre, precio, medida, especificaciones, categoria_id
+    FROM Sticker WHERE id = %s"""
+# {marcadores}: un %s por cada id del lote
+SQL_BUSCAR_POR_IDS = """SELECT id, nombre, precio, medida, especificaciones, categoria_id
+    FROM Sticker WHERE id IN ({marcadores})"""
+SQL_BUSCAR_POR_NOMBRE = """SELECT id, nombre, precio, medida, especificaciones, categoria_id
+    FROM Sticker WHERE nombre LIKE %s ORDER BY nombre"""
+
 
 class ProductoDAO:
+    # Diccionario de categorías por id, compartido durante la vida del proceso
+    _categorias = None
+    # Máximo de ids por consulta WHERE id IN (...)
+    TAMANO_LOTE_IDS = 500
+
     def __init__(self):
         self.conexion = Conexion()
+        # Último error de lectura (None si la última consulta fue exitosa)
+        self.ultimo_error = None
+
+    def _consultar(self, sql, params=None):
+        """
+        Ejecuta una lectura con Conexion.ejecutar_query, que reutiliza la
+        sentencia preparada de cada SQL mientras la conexión sigue abierta
+
+        Raises:
+            ConexionException: Si la consulta falla
+        """
+        exito, resultado = self.conexion.ejecutar_query(sql, params, MODO_LECTURA)
+        if not exito:
+            raise ConexionException(resultado)
+        return resultado
 
     def listar(self):
         """Retorna todos los productos (stickers)"""
         productos = []
+        self.ultimo_error = None
         try:
-            conn = self.conexion.conectar()
-            cursor = conn.cursor()
-            sql = """SELECT s.id, s.nombre, s.precio, s.medida, 
-                     s.especificaciones, s.categoria_id 
-                     FROM Sticker s ORDER BY s.nombre"""
-            cursor.execute(sql)
-            resultados = cursor.fetchall()
-
-            for row in resultados:
+            for row in self._consultar(SQL_LISTAR):
                 producto = Producto(row[0], row[1], row[2], row[3], row[4], row[5])
                 productos.append(producto)
-
-            cursor.close()
         except Exception as e:
             logger.error(f"Error al listar productos: {e}")
-        finally:
-            self.conexion.desconectar()
+            self.ultimo_error = e
 
         return productos
 
     def listar_por_categoria(self, categoria_id):
         """Lista productos de una categoría específica"""
         productos = []
+        self.ultimo_error = None
         try:
-            conn = self.conexion.conectar()
-            cursor = conn.cursor()
-            sql = """SELECT s.id, s.nombre, s.precio, s.medida, 
-                     s.especificaciones, s.categoria_id 
-                     FROM Sticker s 
-                     WHERE s.categoria_id = %s
-                     ORDER BY s.nombre"""
-            cursor.execute(sql, (categoria_id,))
-            resultados = cursor.fetchall()
-
-            for row in resultados:
+            for row in self._consultar(SQL_LISTAR_POR_CATEGORIA, (categoria_id,)):
                 producto = Producto(row[0], row[1], row[2], row[3], row[4], row[5])
                 productos.append(producto)
-
-            cursor.close()
         except Exception as e:
             logger.error(f"Error al listar productos por categoría: {e}")
-        finally:
-            self.conexion.desconectar()
+            self.ultimo_error = e
 
         return productos
 
     def listar_categorias(self):
         """Lista todas las categorías de stickers"""
         categorias = []
+        self.ultimo_error = None
         try:
-            conn = self.conexion.conectar()
-            cursor = conn.cursor()
-            sql = "SELECT id, nombre, descripcion FROM CategoriaSticker ORDER BY id"
-            cursor.execute(sql)
-            resultados = cursor.fetchall()
-
-            for row in resultados:
+            for row in self._consultar(SQL_LISTAR_CATEGORIAS):
                 categorias.append({
                     'id': row[0],
                     'nombre': row[1],
                     'descripcion': row[2]
                 })
-
-            cursor.close()
         except Exception as e:
             logger.error(f"Error al listar categorías: {e}")
-        finally:
-            self.conexion.desconectar()
+            self.ultimo_error = e
 
         return categorias
 
+    def obtener_categorias_dict(self):
+        """
+        Retorna las categorías indexadas por id
+
+        La tabla CategoriaSticker tiene pocas filas y casi no cambia, por lo
+        que se consulta una sola vez por proceso.
+        """
+        if ProductoDAO._categorias is None:
+            categorias = self.listar_categorias()
+            if self.ultimo_error is not None:
+                return {}
+            ProductoDAO._categorias = {c['id']: c for c in categorias}
+        return ProductoDAO._categorias
+
+    @classmethod
+    def invalidar_categorias(cls):
+        """Descarta el diccionario de categorías para recargarlo en el próximo uso"""
+        cls._categorias = None
+
+    def listar_con_categoria(self, agrupar=False):
+        """
+        Lista los productos junto con el nombre y descripción de su categoría
+        en una sola consulta
+
+        Si agrupar es True retorna un diccionario categoria_id -> categoría con
+        la lista de sus productos en la clave 'productos'.
+        """
+        productos = []
+        self.ultimo_error = None
+        try:
+            orden = "c.id, s.nombre" if agrupar else "s.nombre"
+            for row in self._consultar(SQL_LISTAR_CON_CATEGORIA.format(orden=orden)):
+                producto = Producto(row[0], row[1], row[2], row[3], row[4], row[5]).to_dict()
+                producto['categoria_nombre'] = row[6]
+                producto['categoria_descripcion'] = row[7]
+                productos.append(producto)
+        except Exception as e:
+            logger.error(f"Error al listar productos con categoría: {e}")
+            self.ultimo_error = e
+
+        if not agrupar:
+            return productos
+
+        grupos = {}
+        for producto in productos:
+            categoria_id = producto['categoria_id']
+            if categoria_id not in grupos:
+                grupos[categoria_id] = {
+                    'id': categoria_id,
+                    'nombre': producto['categoria_nombre'],
+                    'descripcion': producto['categoria_descripcion'],
+                    'productos': []
+                }
+            grupos[categoria_id]['productos'].append(producto)
+        return grupos
+
     def buscar_por_id(self, id_producto):
         """Busca un producto por su ID"""
         producto = None
+        self.ultimo_error = None
         try:
-            conn = self.conexion.conectar()
-            cursor = conn.cursor()
-            sql = """SELECT id, nombre, precio, medida, especificaciones, categoria_id 
-                     FROM Sticker WHERE id = %s"""
-            cursor.execute(sql, (id_producto,))
-            row = cursor.fetchone()
+            filas = self._consultar(SQL_BUSCAR_POR_ID, (id_producto,))
 
-            if row:
+            if filas:
+                row = filas[0]
                 producto = Producto(row[0], row[1], row[2], row[3], row[4], row[5])
-
-            cursor.close()
         except Exception as e:
             logger.error(f"Error al buscar producto: {e}")
-        finally:
-            self.conexion.desconectar()
+            self.ultimo_error = e
 
         return producto
 
+    def buscar_por_ids(self, ids):
+        """
+        Busca varios productos por ID con una consulta por cada lote de
+        TAMANO_LOTE_IDS ids
+
+        Retorna un diccionario id -> Producto; los ids inexistentes no aparecen.
+        """
+        productos = {}
+        self.ultimo_error = None
+        ids = list(dict.fromkeys(i for i in ids if i is not None))
+        if not ids:
+            return productos
+
+        try:
+            for inicio in range(0, len(ids), self.TAMANO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANO_LOTE_IDS]
+                sql = SQL_BUSCAR_POR_IDS.format(marcadores=", ".join(["%s"] * len(lote)))
+                for row in self._consultar(sql, tuple(lote)):
+                    productos[row[0]] = Producto(row[0], row[1], row[2], row[3], row[4], row[5])
+        except Exception as e:
+            logger.error(f"Error al buscar productos por ids: {e}")
+            self.ultimo_error = e
+
+        return productos
+
     def buscar_por_nombre(self, nombre):
         """Busca productos por nombre"""
         productos = []
+        self.ultimo_error = None
         try:
-            conn = self.conexion.conectar()
-            cursor = conn.cursor()
-            sql = """SELECT id, nombre, precio, medida, especificaciones, categoria_id 
-                     FROM Sticker WHERE nombre LIKE %s ORDER BY nombre"""
             patron = f"%{nombre}%"
-            cursor.execute(sql, (patron,))
-            resultados = cursor.fetchall()
-
-            for row in resultados:
+            for row in self._consultar(SQL_BUSCAR_POR_NOMBRE, (patron,)):
                 producto = Producto(row[0], row[1], row[2], row[3], row[4], row[5])
                 productos.append(producto)
-
-            cursor.close()
         except Exception as e:
             logger.error(f"Error al buscar productos: {e}")
-        finally:
-            self.conexion.desconectar()
+            self.ultimo_error = e
 
         return productos
 
@@ -218,4 +272,125 @@ class ProductoDAO:
         finally:
             self.conexion.desconectar()
 
-        return resultado
\ No newline at end of file
+        return resultado
+
+
+class ProductoDAOCache(ProductoDAO):
+    """
+    ProductoDAO con caché de lectura
+
+    Las lecturas del catálogo se sirven desde una caché LRU con TTL y las
+    escrituras invalidan solo las entradas afectadas. Cada escritura publica
+    una nueva versión en el ContadorVersion, de modo que otros procesos que
+    compartan el mismo archivo de versión descartan su caché.
+    """
+
+    def __init__(self, max_entradas=256, ttl=300.0, ruta_version=None):
+        super().__init__()
+        self.cache = CacheLRU(max_entradas, ttl, ContadorVersion(ruta_version))
+
+    @classmethod
+    def _copiar(cls, valor):
+        """
+        Copia de un valor cacheado para entregar al llamador
+
+        Los Producto y diccionarios de la caché son mutables: si se entregaran
+        tal cual, modificar un resultado alteraría lo que reciben las lecturas
+        siguientes.
+        """
+        if isinstance(valor, Producto):
+            return copy.copy(valor)
+        if isinstance(valor, list):
+            return [cls._copiar(v) for v in valor]
+        if isinstance(valor, dict):
+            return {k: cls._copiar(v) for k, v in valor.items()}
+        return valor
+
+    def _leer(self, clave, cargar):
+        """Lee a través de la caché sin almacenar resultados fallidos"""
+        valor = self.cache.obtener_o_cargar(
+            clave, cargar, lambda v: self.ultimo_error is None and v is not None)
+        return self._copiar(valor)
+
+    def listar(self):
+        """Retorna todos los productos (stickers) desde la caché"""
+        return self._leer(('listar',), super().listar)
+
+    def listar_por_categoria(self, categoria_id):
+        """Lista productos de una categoría desde la caché"""
+        cargar = lambda: super(ProductoDAOCache, self).listar_por_categoria(categoria_id)
+        return self._leer(('categoria', categoria_id), cargar)
+
+    def listar_categorias(self):
+        """Lista todas las categorías desde la caché"""
+        return self._leer(('categorias',), super().listar_categorias)
+
+    def listar_con_categoria(self, agrupar=False):
+        """Lista productos con su categoría desde la caché"""
+        cargar = lambda: super(ProductoDAOCache, self).listar_con_categoria(agrupar)
+        return self._leer(('con_categoria', agrupar), cargar)
+
+    def buscar_por_id(self, id_producto):
+        """Busca un producto por su ID en la caché (los no encontrados no se cachean)"""
+        cargar = lambda: super(ProductoDAOCache, self).buscar_por_id(id_producto)
+        return self._leer(('id', id_producto), cargar)
+
+    def buscar_por_ids(self, ids):
+        """Busca varios productos usando la caché y consultando solo los faltantes"""
+        productos = {}
+        faltantes = []
+        for id_producto in dict.fromkeys(ids):
+            producto = self.cache.obtener(('id', id_producto), None)
+            if producto is not None:
+                productos[id_producto] = self._copiar(producto)
+            elif id_producto is not None:
+                faltantes.append(id_producto)
+
+        if faltantes:
+            version = self.cache.version.actual()
+            encontrados = super().buscar_por_ids(faltantes)
+            # Como en obtener_o_cargar: no guardar si hubo una escritura durante la consulta
+            if self.ultimo_error is None and self.cache.version.actual() == version:
+                for id_producto, producto in encontrados.items():
+                    self.cache.guardar(('id', id_producto), self._copiar(producto))
+            productos.update(encontrados)
+        return productos
+
+    def _invalidar_producto(self, id_producto, *categorias):
+        """Invalida las entradas que pueden contener al producto"""
+        anterior = self.cache.obtener(('id', id_producto), None, contar=False)
+        if anterior is not None:
+            categorias += (anterior.categoria_id,)
+        elif id_producto is not None:
+            # Categoría anterior desconocida: invalidar todas las listas por categoría
+            self.cache.invalidar_si(lambda clave: clave[0] == 'categoria')
+
+        self.cache.invalidar(('listar',), ('id', id_producto),
+                             ('con_categoria', False), ('con_categoria', True),
+                             *[('categoria', c) for c in set(categorias)])
+        self.cache.publicar_cambio()
+
+    def insertar(self, producto):
+        """Inserta un producto e invalida las listas afectadas"""
+        resultado = super().insertar(producto)
+        if resultado:
+            self._invalidar_producto(None, producto.categoria_id)
+        return resultado
+
+    def actualizar(self, producto):
+        """Actualiza un producto e invalida sus entradas en caché"""
+        resultado = super().actualizar(producto)
+        if resultado:
+            self._invalidar_producto(producto.id_producto, producto.categoria_id)
+        return resultado
+
+    def eliminar(self, id_producto):
+        """Elimina un producto e invalida sus entradas en caché"""
+        resultado = super().eliminar(id_producto)
+        if resultado:
+            self._invalidar_producto(id_producto)
+        return resultado
+
+    def estadisticas_cache(self):
+        """Retorna las métricas de aciertos de la caché"""
+        return self.cache.estadisticas()
@@ -0,0 +1,175 @@
+import logging
+
+from Data.conexionAsync import ConexionAsync
+from CreativeDesings.Productos import Producto
+
+logger = logging.getLogger(__name__)
+
+_COLUMNAS = "s.id, s.nombre, s.precio, s.medida, s.especificaciones, s.categoria_id"
+
+
+def _producto(row):
+    """Crea un Producto a partir de una fila de Sticker"""
+    return Producto(row[0], row[1], row[2], row[3], row[4], row[5])
+
+
+class ProductoDAOAsync:
+    """
+    Versión asíncrona de ProductoDAO con los mismos nombres de métodos
+
+    Las lecturas retornan los mismos valores por defecto que ProductoDAO ante
+    un error; las escrituras participan de la transacción en curso si se
+    ejecutan dentro de conexion.transaccion().
+    """
+
+    TAMANO_LOTE_IDS = 500
+
+    def __init__(self, conexion=None):
+        self.conexion = conexion or ConexionAsync()
+
+    async def listar(self):
+        """Retorna todos los productos (stickers)"""
+        try:
+            sql = f"SELECT {_COLUMNAS} FROM Sticker s ORDER BY s.nombre"
+            return [_producto(row) for row in await self.conexion.consultar(sql)]
+        except Exception as e:
+            logger.error(f"Error al listar productos: {e}")
+            return []
+
+    async def iterar(self, tamano_lote=500):
+        """Recorre todos los productos sin cargarlos en memoria a la vez"""
+        sql = f"SELECT {_COLUMNAS} FROM Sticker s ORDER BY s.id"
+        async for row in self.conexion.iterar(sql, tamano_lote=tamano_lote):
+            yield _producto(row)
+
+    async def listar_por_categoria(self, categoria_id):
+        """Lista productos de una categoría específica"""
+        try:
+            sql = f"""SELECT {_COLUMNAS} FROM Sticker s
+                     WHERE s.categoria_id = %s ORDER BY s.nombre"""
+            filas = await self.conexion.consultar(sql, (categoria_id,))
+            return [_producto(row) for row in filas]
+        except Exception as e:
+            logger.error(f"Error al listar productos por categoría: {e}")
+            return []
+
+    async def listar_categorias(self):
+        """Lista todas las categorías de stickers"""
+        try:
+            sql = "SELECT id, nombre, descripcion FROM CategoriaSticker ORDER BY id"
+            return [{'id': row[0], 'nombre': row[1], 'descripcion': row[2]}
+                    for row in await self.conexion.consultar(sql)]
+        except Exception as e:
+            logger.error(f"Error al listar categorías: {e}")
+            return []
+
+    async def listar_con_categoria(self, agrupar=False):
+        """Lista los productos con el nombre y descripción de su categoría"""
+        try:
+            orden = "c.id, s.nombre" if agrupar else "s.nombre"
+            sql = f"""SELECT {_COLUMNAS}, c.nombre, c.descripcion
+                     FROM Sticker s
+                     LEFT JOIN CategoriaSticker c ON c.id = s.categoria_id
+                     ORDER BY {orden}"""
+            filas = await self.conexion.consultar(sql)
+        except Exception as e:
+            logger.error(f"Error al listar productos con categoría: {e}")
+            filas = []
+
+        productos = []
+        for row in filas:
+            producto = _producto(row).to_dict()
+            producto['categoria_nombre'] = row[6]
+            producto['categoria_descripcion'] = row[7]
+            productos.append(producto)
+
+        if not agrupar:
+            return productos
+
+        grupos = {}
+        for producto in productos:
+            grupo = grupos.setdefault(producto['categoria_id'], {
+                'id': producto['categoria_id'],
+                'nombre': producto['categoria_nombre'],
+                'descripcion': producto['categoria_descripcion'],
+                'productos': []
+            })
+            grupo['productos'].append(producto)
+        return grupos
+
+    async def buscar_por_id(self, id_producto):
+        """Busca un producto por su ID"""
+        try:
+            sql = f"SELECT {_COLUMNAS} FROM Sticker s WHERE s.id = %s"
+            row = await self.conexion.consultar_uno(sql, (id_producto,))
+            return _producto(row) if row else None
+        except Exception as e:
+            logger.error(f"Error al buscar producto: {e}")
+            return None
+
+    async def buscar_por_ids(self, ids):
+        """Busca varios productos por ID; retorna un diccionario id -> Producto"""
+        productos = {}
+        ids = list(dict.fromkeys(i for i in ids if i is not None))
+        try:
+            for inicio in range(0, len(ids), self.TAMANO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANO_LOTE_IDS]
+                marcadores = ", ".join(["%s"] * len(lote))
+                sql = f"SELECT {_COLUMNAS} FROM Sticker s WHERE s.id IN ({marcadores})"
+                for row in await self.conexion.consultar(sql, tuple(lote)):
+                    productos[row[0]] = _producto(row)
+        except Exception as e:
+            logger.error(f"Error al buscar productos por ids: {e}")
+        return productos
+
+    async def buscar_por_nombre(self, nombre):
+        """Busca productos por nombre"""
+        try:
+            sql = f"""SELECT {_COLUMNAS} FROM Sticker s
+                     WHERE s.nombre LIKE %s ORDER BY s.nombre"""
+            filas = await self.conexion.consultar(sql, (f"%{nombre}%",))
+            return [_producto(row) for row in filas]
+        except Exception as e:
+            logger.error(f"Error al buscar productos: {e}")
+            return []
+
+    async def insertar(self, producto):
+        """Inserta un nuevo producto"""
+        try:
+            sql = """INSERT INTO Sticker (categoria_id, nombre, precio, medida, especificaciones)
+                     VALUES (%s, %s, %s, %s, %s)"""
+            valores = (producto.categoria_id, producto.nombre, producto.precio,
+                       producto.medida, producto.especificaciones)
+            _, producto.id_producto = await self.conexion.ejecutar(sql, valores)
+            return True
+        except Exception as e:
+            logger.error(f"Error al insertar producto: {e}")
+            if self.conexion.en_transaccion():
+                raise
+            return False
+
+    async def actualizar(self, producto):
+        """Actualiza un producto existente"""
+        try:
+            sql = """UPDATE Sticker SET categoria_id=%s, nombre=%s, precio=%s,
+                     medida=%s, especificaciones=%s WHERE id=%s"""
+            valores = (producto.categoria_id, producto.nombre, producto.precio,
+                       producto.medida, producto.especificaciones, producto.id_producto)
+            await self.conexion.ejecutar(sql, valores)
+            return True
+        except Exception as e:
+            logger.error(f"Error al actualizar producto: {e}")
+            if self.conexion.en_transaccion():
+                raise
+            return False
+
+    async def eliminar(self, id_producto):
+        """Elimina un producto por su ID"""
+        try:
+            await self.conexion.ejecutar("DELETE FROM Sticker WHERE id = %s", (id_producto,))
+            return True
+        except Exception as e:
+            logger.error(f"Error al eliminar producto: {e}")
+            if self.conexion.en_transaccion():
+                raise
+            return False
@@ -0,0 +1,156 @@
+"""
+RÉPLICAS DE LECTURA - Creative Designs
+Enrutamiento de las lecturas de los DAO hacia réplicas
+
+Descripción: Las consultas de lectura se reparten en round-robin entre las
+réplicas configuradas. Cada réplica tiene su propio corta-circuito que actúa
+como chequeo de salud: una réplica que falla deja de recibir tráfico durante
+el enfriamiento y vuelve a probarse después. Si no hay réplicas disponibles
+las lecturas van a la primaria.
+"""
+
+import logging
+import threading
+from typing import Iterator, List, Optional
+
+from Data.configuracion import obtener_configuracion
+from Data.resiliencia import CortaCircuito
+
+logger = logging.getLogger(__name__)
+
+
+class Replica:
+    """
+    Destino de lectura
+
+    Los parámetros omitidos se toman de la conexión primaria, de modo que una
+    réplica MySQL normalmente solo necesita host y/o puerto.
+
+    Atributos:
+        host, port, user, password, database: Parámetros de conexión
+        backend (Backend, optional): Backend propio (p. ej. otro archivo SQLite)
+    """
+
+    def __init__(self, host=None, port=None, user=None, password=None, database=None,
+                 backend=None, umbral_fallos: int = 1, enfriamiento: float = 10.0):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.backend = backend
+        self.cortacircuito = CortaCircuito(umbral_fallos, enfriamiento)
+
+    def destino(self, primaria):
+        """
+        Retorna los parámetros de conexión completos de la réplica
+
+        Args:
+            primaria (Conexion): Conexión primaria de la que se heredan valores
+        """
+        return _Destino(
+            host=self.host or primaria.host,
+            port=self.port or primaria.port,
+            user=self.user or primaria.user,
+            password=self.password if self.password is not None else primaria.password,
+            database=self.database or primaria.database,
+            charset=primaria.charset,
+            timeout_conexion=primaria.timeout_conexion
+        )
+
+    @property
+    def disponible(self) -> bool:
+        return self.cortacircuito.estado == CortaCircuito.CERRADO
+
+    def __repr__(self):
+        if self.backend is not None:
+            return f"Replica({self.backend.descripcion(None)})"
+        return f"Replica(host={self.host}, port={self.port})"
+
+
+class _Destino:
+    """Parámetros de conexión con la forma que esperan los backends"""
+
+    def __init__(self, **parametros):
+        self.__dict__.update(parametros)
+
+
+class EnrutadorLecturas:
+    """Reparte las lecturas entre réplicas en round-robin"""
+
+    def __init__(self, replicas: Optional[List[Replica]] = None):
+        self.replicas = list(replicas or [])
+        self._siguiente = 0
+        self._lock = threading.Lock()
+
+    def candidatas(self) -> Iterator[Replica]:
+        """
+        Genera las réplicas a intentar, empezando por la siguiente en turno y
+        omitiendo las que tienen el corta-circuito abierto
+        """
+        with self._lock:
+            total = len(self.replicas)
+            if not total:
+                return
+            inicio = self._siguiente
+            self._siguiente = (self._siguiente + 1) % total
+        for desplazamiento in range(total):
+            replica = self.replicas[(inicio + desplazamiento) % total]
+            if replica.cortacircuito.permitir():
+                yield replica
+
+    def verificar_salud(self, primaria) -> dict:
+        """
+        Prueba la conexión a cada réplica con SELECT 1 y actualiza su estado
+
+        Args:
+            primaria (Conexion): Conexión de la que se heredan los parámetros
+
+        Returns:
+            dict: repr de la réplica -> True si responde
+        """
+        resultado = {}
+        for replica in self.replicas:
+            backend = replica.backend or primaria.backend
+            try:
+                conn = backend.conectar(replica.destino(primaria))
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+                cursor.close()
+                conn.close()
+                replica.cortacircuito.registrar_exito()
+                resultado[repr(replica)] = True
+            except Exception as e:
+                logger.warning(f"Réplica {replica!r} no responde: {e}")
+                replica.cortacircuito.registrar_fallo()
+                resultado[repr(replica)] = False
+        return resultado
+
+
+_enrutador: Optional[EnrutadorLecturas] = None
+
+
+def configurar_replicas(replicas: List[Replica]):
+    """
+    Define las réplicas de lectura del proceso
+
+    Ejemplo:
+        configurar_replicas([Replica(host='10.0.0.2'), Replica(host='10.0.0.3')])
+    """
+    global _enrutador
+    _enrutador = EnrutadorLecturas(replicas)
+
+
+def obtener_enrutador() -> EnrutadorLecturas:
+    """
+    Retorna el enrutador de lecturas configurado
+
+    Si no se llamó a configurar_replicas(), las réplicas se toman de
+    CD_DB_REPLICAS (ver Data/configuracion.py).
+    """
+    global _enrutador
+    if _enrutador is None:
+        _enrutador = EnrutadorLecturas(
+            [Replica(host=host, port=port) for host, port in obtener_configuracion().lista_replicas()])
+    return _enrutador
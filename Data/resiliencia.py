@@ -0,0 +1,154 @@
+"""
+RESILIENCIA DE CONEXIÓN - Creative Designs
+Reintentos con espera exponencial y corta-circuito para la base de datos
+
+Descripción: Ante errores transitorios (reinicio de MySQL, conexión perdida)
+la conexión se reintenta con esperas exponenciales con jitter. Si los fallos
+se repiten, el corta-circuito se abre y las conexiones fallan de inmediato
+durante un periodo de enfriamiento, para que las peticiones no paguen el
+timeout de conexión una y otra vez mientras dura la caída.
+"""
+
+import time
+import random
+import logging
+import threading
+from typing import Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class PoliticaReintentos:
+    """
+    Política de reintentos con espera exponencial y jitter completo
+
+    Atributos:
+        intentos (int): Número total de intentos (1 = sin reintentos)
+        espera_base (float): Espera del primer reintento en segundos
+        espera_maxima (float): Tope de cada espera en segundos
+    """
+
+    def __init__(self, intentos: int = 3, espera_base: float = 0.1, espera_maxima: float = 2.0):
+        self.intentos = max(1, intentos)
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+
+    def esperas(self) -> Iterator[float]:
+        """
+        Genera la espera previa a cada reintento
+
+        Returns:
+            Iterator[float]: intentos - 1 esperas en segundos
+        """
+        for n in range(self.intentos - 1):
+            tope = min(self.espera_maxima, self.espera_base * (2 ** n))
+            yield random.uniform(0, tope)
+
+
+class CortaCircuito:
+    """
+    Corta-circuito de tres estados
+
+    - cerrado: las conexiones se intentan normalmente
+    - abierto: tras umbral_fallos fallos seguidos se rechaza todo intento
+      durante 'enfriamiento' segundos
+    - semiabierto: pasado el enfriamiento se permite un único intento de
+      prueba; si tiene éxito el circuito se cierra, si falla se vuelve a abrir
+    """
+
+    CERRADO = "cerrado"
+    ABIERTO = "abierto"
+    SEMIABIERTO = "semiabierto"
+
+    def __init__(self, umbral_fallos: int = 5, enfriamiento: float = 30.0):
+        self.umbral_fallos = umbral_fallos
+        self.enfriamiento = enfriamiento
+        self.estado = self.CERRADO
+        self.fallos_consecutivos = 0
+        self.rechazos = 0
+        self._abierto_desde = 0.0
+        self._prueba_en_curso = False
+        self._lock = threading.Lock()
+
+    def permitir(self) -> bool:
+        """
+        Indica si se puede intentar una conexión
+
+        Returns:
+            bool: False si el circuito está abierto
+        """
+        with self._lock:
+            if self.estado == self.CERRADO:
+                return True
+
+            if self.estado == self.ABIERTO:
+                if time.monotonic() - self._abierto_desde < self.enfriamiento:
+                    self.rechazos += 1
+                    return False
+                self.estado = self.SEMIABIERTO
+                self._prueba_en_curso = False
+
+            # Semiabierto: solo un intento de prueba a la vez
+            if self._prueba_en_curso:
+                self.rechazos += 1
+                return False
+            self._prueba_en_curso = True
+            return True
+
+    def registrar_exito(self):
+        """Cierra el circuito tras una conexión exitosa"""
+        with self._lock:
+            if self.estado != self.CERRADO:
+                logger.info("Corta-circuito cerrado: la base de datos responde de nuevo")
+            self.estado = self.CERRADO
+            self.fallos_consecutivos = 0
+            self._prueba_en_curso = False
+
+    def registrar_fallo(self) -> bool:
+        """
+        Registra un fallo de conexión
+
+        Returns:
+            bool: True si este fallo abrió el circuito
+        """
+        with self._lock:
+            self.fallos_consecutivos += 1
+            self._prueba_en_curso = False
+            if self.estado == self.SEMIABIERTO or (
+                    self.estado == self.CERRADO and self.fallos_consecutivos >= self.umbral_fallos):
+                self.estado = self.ABIERTO
+                self._abierto_desde = time.monotonic()
+                logger.warning(f"Corta-circuito abierto por {self.enfriamiento:.1f} s "
+                               f"tras {self.fallos_consecutivos} fallos consecutivos")
+                return True
+            return False
+
+    def segundos_restantes(self) -> float:
+        """Segundos que faltan para permitir un intento de prueba"""
+        with self._lock:
+            if self.estado != self.ABIERTO:
+                return 0.0
+            return max(0.0, self.enfriamiento - (time.monotonic() - self._abierto_desde))
+
+
+# Un corta-circuito por destino (host/base de datos), compartido en el proceso
+_cortacircuitos: Dict[str, CortaCircuito] = {}
+_lock_registro = threading.Lock()
+
+
+def obtener_corta_circuito(clave: str, umbral_fallos: int = 5, enfriamiento: float = 30.0) -> CortaCircuito:
+    """
+    Retorna el corta-circuito de un destino, creándolo si no existe
+
+    Args:
+        clave (str): Identificador del destino
+        umbral_fallos (int): Fallos seguidos que abren el circuito
+        enfriamiento (float): Segundos que el circuito permanece abierto
+    """
+    cortacircuito = _cortacircuitos.get(clave)
+    if cortacircuito is None:
+        with _lock_registro:
+            cortacircuito = _cortacircuitos.get(clave)
+            if cortacircuito is None:
+                cortacircuito = _cortacircuitos[clave] = CortaCircuito(umbral_fallos, enfriamiento)
+    return cortacircuito
@@ -0,0 +1,121 @@
+"""
+ÍNDICE DE TRIGRAMAS - Creative Designs
+Búsqueda de subcadenas en memoria para el backend SQLite
+
+Descripción: SQLite no tiene índices FULLTEXT, así que ClienteDAO mantiene
+en memoria un índice invertido de trigramas (subcadenas de 3 caracteres).
+Una búsqueda intersecta las listas de los trigramas del texto buscado y solo
+verifica la subcadena en esos candidatos, en lugar de aplicar LIKE '%x%' a
+toda la tabla.
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, Optional, Set
+
+_NO_DIGITOS = re.compile(r"\D")
+
+
+def normalizar_texto(texto: Optional[str]) -> str:
+    """Minúsculas y sin acentos, como la colación utf8mb4_general_ci de MySQL"""
+    if not texto:
+        return ""
+    descompuesto = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def solo_digitos(telefono: Optional[str]) -> str:
+    """Deja solo los dígitos de un teléfono ('(502) 1234-5678' -> '50212345678')"""
+    return _NO_DIGITOS.sub("", telefono or "")
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas sobre un texto por id
+
+    Los textos se guardan normalizados para verificar los candidatos; las
+    búsquedas de menos de 3 caracteres recorren los textos en memoria.
+    """
+
+    N = 3
+
+    def __init__(self, normalizar=normalizar_texto):
+        self._normalizar = normalizar
+        self._textos: Dict[int, str] = {}
+        self._trigramas: Dict[str, Set[int]] = {}
+        self._lock = threading.Lock()
+
+    def _trigramas_de(self, texto: str) -> Set[str]:
+        return {texto[i:i + self.N] for i in range(len(texto) - self.N + 1)}
+
+    def agregar(self, id_: int, *textos: Optional[str]):
+        """
+        Indexa (o reemplaza) los textos de un id
+
+        Args:
+            id_ (int): Identificador del registro
+            textos (str): Campos a indexar; se unen con un separador para que
+                ningún trigrama cruce de un campo a otro
+        """
+        texto = "\x00".join(self._normalizar(t) for t in textos if t)
+        with self._lock:
+            self._quitar(id_)
+            self._textos[id_] = texto
+            for trigrama in self._trigramas_de(texto):
+                self._trigramas.setdefault(trigrama, set()).add(id_)
+
+    def quitar(self, id_: int):
+        """Elimina un id del índice"""
+        with self._lock:
+            self._quitar(id_)
+
+    def _quitar(self, id_: int):
+        texto = self._textos.pop(id_, None)
+        if texto is None:
+            return
+        for trigrama in self._trigramas_de(texto):
+            ids = self._trigramas.get(trigrama)
+            if ids is not None:
+                ids.discard(id_)
+                if not ids:
+                    del self._trigramas[trigrama]
+
+    def texto(self, id_: int) -> Optional[str]:
+        """Texto normalizado de un id"""
+        return self._textos.get(id_)
+
+    def buscar(self, consulta: str, candidatos: Optional[Iterable[int]] = None) -> Set[int]:
+        """
+        Ids cuyo texto contiene la consulta
+
+        Args:
+            consulta (str): Subcadena a buscar (se normaliza)
+            candidatos (iterable, optional): Limitar la búsqueda a estos ids
+
+        Returns:
+            Set[int]: Ids que contienen la subcadena
+        """
+        consulta = self._normalizar(consulta)
+        if not consulta:
+            return set(self._textos) if candidatos is None else set(candidatos)
+
+        with self._lock:
+            if len(consulta) >= self.N:
+                # Intersectar empezando por la lista más corta
+                listas = sorted((self._trigramas.get(t, set()) for t in self._trigramas_de(consulta)),
+                                key=len)
+                encontrados = set(listas[0])
+                for ids in listas[1:]:
+                    encontrados &= ids
+                    if not encontrados:
+                        break
+                if candidatos is not None:
+                    encontrados &= set(candidatos)
+            else:
+                encontrados = set(self._textos) if candidatos is None else set(candidatos)
+
+            return {i for i in encontrados if consulta in self._textos.get(i, "")}
+
+    def __len__(self):
+        return len(self._textos)
@@ -2,6 +2,9 @@
 CREATE DATABASE IF NOT EXISTS creative_designs;
 USE creative_designs;
 
+-- Los índices secundarios se crean con las migraciones versionadas:
+--   python -m Data.migraciones
+
 -- Tabla de Categorías de Stickers
 CREATE TABLE CategoriaSticker (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -28,7 +31,8 @@ CREATE TABLE clientes (
     apellido VARCHAR(100) NOT NULL,
     telefono VARCHAR(20),
     email VARCHAR(100),
-    direccion TEXT
+    direccion TEXT,
+    UNIQUE KEY uk_clientes_email (email)
 );
 
 -- Insertar Categorías
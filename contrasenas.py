@@ -0,0 +1,62 @@
+# administrador/contrasenas.py
+"""Hashes de contraseñas compartidos por seguridad.py (contraseña de
+administración) y Administrador (usuarios del registro). El costo vive solo
+aquí, así que calibrar() afecta a ambos."""
+import os, hmac, time, hashlib
+
+# Formato de los hashes: pbkdf2_sha256$<iteraciones>$<sal hex>$<hash hex>
+ALGORITMO = "pbkdf2_sha256"
+# Costo por defecto; calibrar() lo ajusta a la latencia deseada
+ITERACIONES = 200_000
+MIN_ITERACIONES = 50_000
+LARGO_SAL = 16
+
+def _derivar(pwd, sal, iteraciones):
+    return hashlib.pbkdf2_hmac("sha256", pwd.encode(), bytes.fromhex(sal), iteraciones).hex()
+
+def hash_password(pwd, iteraciones=None):
+    """Hash con sal aleatoria; el resultado incluye algoritmo, costo y sal"""
+    iteraciones = iteraciones or ITERACIONES
+    sal = os.urandom(LARGO_SAL).hex()
+    return f"{ALGORITMO}${iteraciones}${sal}${_derivar(pwd, sal, iteraciones)}"
+
+def verificar_hash(pwd, h):
+    """Compara una contraseña con un hash en tiempo constante.
+    Acepta también los hashes SHA-256 sin sal del formato anterior."""
+    if not h:
+        return False
+    if "$" not in h:
+        return hmac.compare_digest(hashlib.sha256(pwd.encode()).hexdigest(), h)
+    try:
+        algoritmo, iteraciones, sal, esperado = h.split("$")
+        if algoritmo != ALGORITMO:
+            return False
+        return hmac.compare_digest(_derivar(pwd, sal, int(iteraciones)), esperado)
+    except ValueError:
+        return False
+
+def necesita_rehash(h):
+    """True si el hash es del formato anterior o tiene menos costo que el actual"""
+    if not h or "$" not in h:
+        return True
+    try:
+        return int(h.split("$")[1]) < ITERACIONES
+    except (IndexError, ValueError):
+        return True
+
+def calibrar(latencia=0.1, aplicar=True):
+    """Iteraciones para que verificar una contraseña tarde ~latencia segundos
+    en esta máquina (nunca menos de MIN_ITERACIONES). Con aplicar=True pasan
+    a ser el costo de los hashes nuevos."""
+    global ITERACIONES
+    prueba = 20_000
+    mejor = None
+    for _ in range(3):
+        inicio = time.perf_counter()
+        _derivar("calibracion", "00" * LARGO_SAL, prueba)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    iteraciones = max(MIN_ITERACIONES, int(prueba * latencia / max(mejor, 1e-9)) // 1000 * 1000)
+    if aplicar:
+        ITERACIONES = iteraciones
+    return iteraciones
@@ -0,0 +1,287 @@
+# administrador/limitador_intentos.py
+"""
+LIMITADOR DE INTENTOS - Creative Designs
+Protección contra fuerza bruta compartida entre procesos
+
+Descripción: Cuenta los inicios de sesión fallidos por usuario y por origen
+(p. ej. la IP o la terminal) en ventanas deslizantes. Cada clave guarda solo
+el conteo de la ventana actual y el de la anterior, y la ventana deslizante
+se estima ponderando la anterior según cuánto de ella sigue dentro del
+intervalo, así que verificar y registrar un intento es O(1) sin importar el
+número de usuarios. Al superar el máximo la clave queda bloqueada durante
+'bloqueo' segundos.
+
+Sin ruta_sqlite los contadores viven en memoria del proceso. Con ruta_sqlite
+se guardan en un archivo SQLite local (una fila por clave, leída por llave
+primaria), de modo que varios procesos comparten los bloqueos y estos
+sobreviven a un reinicio sin consultar MySQL en cada intento.
+
+Ejemplo:
+    limitador = LimitadorIntentos(ruta_sqlite='data/intentos.db')
+    servicio = ServicioLogin(registro, limitador=limitador)
+    servicio.autenticar('admin', 'admin123', origen='10.0.0.7')
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LimitadorIntentos:
+    """
+    Contadores de fallos por usuario y por origen con bloqueo temporal
+
+    Atributos:
+        max_fallos (int): Fallos tolerados por usuario dentro de la ventana
+        max_fallos_origen (int): Fallos tolerados por origen (varios usuarios
+            pueden compartir un origen)
+        ventana (float): Segundos de la ventana deslizante
+        bloqueo (float): Segundos que dura un bloqueo
+    """
+
+    # Claves en memoria a partir de las cuales se descartan las caducadas
+    MAX_CLAVES_MEMORIA = 10000
+
+    def __init__(self, max_fallos: int = 5, max_fallos_origen: int = 20, ventana: float = 300.0,
+                 bloqueo: float = 900.0, ruta_sqlite: Optional[str] = None):
+        self.max_fallos = max_fallos
+        self.max_fallos_origen = max_fallos_origen
+        self.ventana = ventana
+        self.bloqueo = bloqueo
+        self.ruta_sqlite = ruta_sqlite
+        # clave -> [inicio de la ventana actual, fallos actuales, fallos de la anterior, bloqueado hasta]
+        self._estados: Dict[str, List[float]] = {}
+        self._accesos: Dict[str, float] = {}
+        # Tamaño de _estados que dispara la próxima purga (ver _purgar)
+        self._limite_purga = self.MAX_CLAVES_MEMORIA
+        self._lock = threading.Lock()
+        self._conn = self._abrir() if ruta_sqlite else None
+
+    # ==================== ALMACENAMIENTO ====================
+
+    def _abrir(self) -> sqlite3.Connection:
+        directorio = os.path.dirname(self.ruta_sqlite)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        # isolation_level=None: las transacciones se controlan con BEGIN IMMEDIATE
+        conn = sqlite3.connect(self.ruta_sqlite, timeout=5.0, isolation_level=None,
+                               check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS intentos_login (
+                clave TEXT PRIMARY KEY,
+                inicio REAL NOT NULL,
+                actual INTEGER NOT NULL,
+                anterior INTEGER NOT NULL,
+                bloqueado_hasta REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS accesos_login (
+                usuario TEXT PRIMARY KEY,
+                fecha REAL NOT NULL
+            )
+        """)
+        return conn
+
+    def _leer(self, clave: str) -> Optional[List[float]]:
+        if self._conn is None:
+            return self._estados.get(clave)
+        fila = self._conn.execute(
+            "SELECT inicio, actual, anterior, bloqueado_hasta FROM intentos_login WHERE clave = ?",
+            (clave,)).fetchone()
+        return list(fila) if fila else None
+
+    def _escribir(self, clave: str, estado: Optional[List[float]]):
+        if self._conn is None:
+            if estado is None:
+                self._estados.pop(clave, None)
+            else:
+                self._estados[clave] = estado
+            return
+        if estado is None:
+            self._conn.execute("DELETE FROM intentos_login WHERE clave = ?", (clave,))
+        else:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO intentos_login (clave, inicio, actual, anterior, bloqueado_hasta) "
+                "VALUES (?, ?, ?, ?, ?)", (clave, *estado))
+
+    def _transaccion(self, operacion):
+        """Ejecuta operacion() con el lock del proceso y, en SQLite, en una
+        transacción que bloquea a los demás procesos hasta terminar"""
+        with self._lock:
+            if self._conn is None:
+                return operacion()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                resultado = operacion()
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return resultado
+
+    # ==================== VENTANAS ====================
+
+    @staticmethod
+    def _claves(usuario: str, origen: Optional[str]) -> List[Tuple[str, bool]]:
+        claves = [("usuario:" + (usuario or "").strip().lower(), False)]
+        if origen:
+            claves.append(("origen:" + origen, True))
+        return claves
+
+    def _avanzar(self, estado: List[float], ahora: float) -> List[float]:
+        """Desplaza la ventana de un estado hasta la que contiene 'ahora'"""
+        inicio, actual, anterior, bloqueado_hasta = estado
+        transcurridas = int((ahora - inicio) // self.ventana)
+        if transcurridas == 1:
+            anterior, actual = actual, 0
+        elif transcurridas > 1:
+            anterior = actual = 0
+        if transcurridas > 0:
+            inicio += transcurridas * self.ventana
+        return [inicio, actual, anterior, bloqueado_hasta]
+
+    def _estimar(self, estado: List[float], ahora: float) -> float:
+        """Fallos estimados en los últimos 'ventana' segundos"""
+        inicio, actual, anterior, _ = estado
+        peso_anterior = 1.0 - (ahora - inicio) / self.ventana
+        return actual + anterior * peso_anterior
+
+    # ==================== API ====================
+
+    def permitir(self, usuario: str, origen: Optional[str] = None) -> Tuple[bool, float]:
+        """
+        Indica si se puede intentar un inicio de sesión (no cuenta el intento)
+
+        Returns:
+            tuple: (permitido, segundos que faltan para el desbloqueo)
+        """
+        ahora = time.time()
+
+        def operacion():
+            espera = 0.0
+            for clave, _ in self._claves(usuario, origen):
+                estado = self._leer(clave)
+                if estado and estado[3] > ahora:
+                    espera = max(espera, estado[3] - ahora)
+            return espera
+
+        # Solo lectura: no hace falta bloquear a los demás procesos
+        with self._lock:
+            espera = operacion()
+        return espera <= 0, espera
+
+    def registrar_fallo(self, usuario: str, origen: Optional[str] = None) -> bool:
+        """
+        Cuenta un fallo y bloquea las claves que superen su máximo
+
+        Returns:
+            bool: True si el usuario o el origen quedaron bloqueados
+        """
+        ahora = time.time()
+
+        def operacion():
+            bloqueado = False
+            for clave, es_origen in self._claves(usuario, origen):
+                estado = self._leer(clave) or [ahora, 0, 0, 0.0]
+                estado = self._avanzar(estado, ahora)
+                estado[1] += 1
+                maximo = self.max_fallos_origen if es_origen else self.max_fallos
+                if self._estimar(estado, ahora) >= maximo:
+                    estado[3] = ahora + self.bloqueo
+                    logger.warning(f"Inicio de sesión bloqueado {self.bloqueo:.0f} s para {clave}")
+                bloqueado = bloqueado or estado[3] > ahora
+                self._escribir(clave, estado)
+            self._purgar(ahora)
+            return bloqueado
+
+        return self._transaccion(operacion)
+
+    def registrar_exito(self, usuario: str, origen: Optional[str] = None):
+        """
+        Reinicia los fallos del usuario (no los del origen) y guarda el acceso
+        """
+        ahora = time.time()
+        usuario = (usuario or "").strip().lower()
+
+        def operacion():
+            self._escribir("usuario:" + usuario, None)
+            if self._conn is None:
+                self._accesos[usuario] = ahora
+            else:
+                self._conn.execute("INSERT OR REPLACE INTO accesos_login (usuario, fecha) VALUES (?, ?)",
+                                   (usuario, ahora))
+
+        self._transaccion(operacion)
+
+    def ultimo_acceso(self, usuario: str) -> Optional[float]:
+        """Instante (time.time()) del último inicio de sesión exitoso, o None"""
+        usuario = (usuario or "").strip().lower()
+        with self._lock:
+            if self._conn is None:
+                return self._accesos.get(usuario)
+            fila = self._conn.execute("SELECT fecha FROM accesos_login WHERE usuario = ?",
+                                      (usuario,)).fetchone()
+            return fila[0] if fila else None
+
+    def desbloquear(self, usuario: str, origen: Optional[str] = None):
+        """Elimina los contadores y bloqueos de un usuario (y de un origen)"""
+        def operacion():
+            for clave, _ in self._claves(usuario, origen):
+                self._escribir(clave, None)
+
+        self._transaccion(operacion)
+
+    # ==================== MANTENIMIENTO ====================
+
+    def _caducado(self, estado: List[float], ahora: float) -> bool:
+        return estado[3] <= ahora and ahora - estado[0] >= 2 * self.ventana
+
+    def _purgar(self, ahora: float):
+        """
+        Descarta en memoria las claves sin fallos recientes ni bloqueo
+
+        Recorrer las claves cuesta O(n), así que la siguiente purga espera a
+        que el diccionario duplique lo que quedó: cada registrar_fallo sigue
+        costando O(1) amortizado aunque casi todas las claves estén vigentes.
+        """
+        if self._conn is None and len(self._estados) > self._limite_purga:
+            for clave in [c for c, e in self._estados.items() if self._caducado(e, ahora)]:
+                del self._estados[clave]
+            self._limite_purga = max(self.MAX_CLAVES_MEMORIA, 2 * len(self._estados))
+
+    def limpiar(self) -> int:
+        """
+        Elimina las claves caducadas (para ejecutar periódicamente con SQLite)
+
+        Returns:
+            int: Claves eliminadas
+        """
+        ahora = time.time()
+
+        def operacion():
+            if self._conn is None:
+                caducadas = [c for c, e in self._estados.items() if self._caducado(e, ahora)]
+                for clave in caducadas:
+                    del self._estados[clave]
+                self._limite_purga = max(self.MAX_CLAVES_MEMORIA, 2 * len(self._estados))
+                return len(caducadas)
+            cursor = self._conn.execute(
+                "DELETE FROM intentos_login WHERE bloqueado_hasta <= ? AND inicio <= ?",
+                (ahora, ahora - 2 * self.ventana))
+            return cursor.rowcount
+
+        return self._transaccion(operacion)
+
+    def cerrar(self):
+        """Cierra el archivo SQLite, si hay uno"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,12 +3,18 @@ from producto.producto import ProductoManager
 from producto.busquedas import busqueda_secuencial, busqueda_binaria
 from producto.ordenamientos import ordenar_automaticamente
 from administrador import seguridad
+from administrador.servicio_login import ServicioLogin
+from administrador.limitador_intentos import LimitadorIntentos
 from cliente.pedido import Pedido
 import getpass
+import logging
 
 pm = ProductoManager()
 contador_pedidos = 1
 pedidos = []
+# Verifica la contraseña de administración con límite de intentos y bloqueos
+# que sobreviven a un reinicio
+servicio_login = ServicioLogin(limitador=LimitadorIntentos(ruta_sqlite="data/intentos.db"))
 
 def menu_cliente():
     global contador_pedidos
@@ -34,7 +40,7 @@ def menu_cliente():
                 if pid == 0: break
                 cant = int(input("Cantidad: "))
                 items.append((pid, cant))
-            pedido = Pedido(contador_pedidos, cli, items, pm.buscar_por_id)
+            pedido = Pedido(contador_pedidos, cli, items, pm.buscar_por_id, pm.buscar_por_ids)
             print(pedido.generar_factura())
             pedidos.append(pedido)
             contador_pedidos += 1
@@ -46,7 +52,7 @@ def menu_admin():
         print("Primera vez: crea contraseña admin.")
         seguridad.crear_o_cambiar()
     else:
-        if not seguridad.verificar(getpass.getpass("Contraseña: ")):
+        if not servicio_login.verificar_admin(getpass.getpass("Contraseña: ")):
             print("Acceso denegado.")
             return
     while True:
@@ -55,7 +61,8 @@ def menu_admin():
         print("2. Eliminar producto")
         print("3. Ordenar productos automáticamente")
         print("4. Cambiar contraseña")
-        print("5. Salir")
+        print("5. Estadísticas de consultas")
+        print("6. Salir")
         op = input("> ")
         if op == "1":
             nid = int(input("ID: "))
@@ -75,6 +82,9 @@ def menu_admin():
         elif op == "4":
             seguridad.crear_o_cambiar()
         elif op == "5":
+            from Data.metricas import registro_consultas
+            print(registro_consultas.reporte())
+        elif op == "6":
             break
 
 def main():
@@ -93,4 +103,5 @@ def main():
             break
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
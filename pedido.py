@@ -1,23 +1,41 @@
 # cliente/pedido.py
 from datetime import datetime
 
+def _campo(prod, nombre):
+    # Los productos pueden venir como dict (ProductoManager) o como Producto (ProductoDAO)
+    return prod[nombre] if isinstance(prod, dict) else getattr(prod, nombre)
+
 class Pedido:
-    def __init__(self, id_pedido, cliente_nombre, items, buscar_producto):
+    def __init__(self, id_pedido, cliente_nombre, items, buscar_producto, buscar_productos=None):
         self.id_pedido = id_pedido
         self.cliente = cliente_nombre
         self.items = items
         self.estado = "creado"
         self.fecha = datetime.now().isoformat(timespec='seconds')
         self.buscar_producto = buscar_producto
+        # buscar_productos(ids) -> {id: producto}: resuelve todos los items en una sola llamada
+        self.buscar_productos = buscar_productos
+        self._productos = None
+
+    def productos(self):
+        if self._productos is None:
+            ids = [pid for pid, qty in self.items]
+            if self.buscar_productos:
+                self._productos = self.buscar_productos(ids)
+            else:
+                self._productos = {pid: self.buscar_producto(pid) for pid in dict.fromkeys(ids)}
+        return self._productos
 
     def total(self):
-        return sum(self.buscar_producto(pid)["precio"] * qty for pid, qty in self.items)
+        prods = self.productos()
+        return sum(_campo(prods[pid], "precio") * qty for pid, qty in self.items)
 
     def generar_factura(self):
         lines = [f"Factura #{self.id_pedido}", f"Cliente: {self.cliente}", f"Fecha: {self.fecha}", "-"*40]
+        prods = self.productos()
         for pid, qty in self.items:
-            prod = self.buscar_producto(pid)
-            lines.append(f"{prod['nombre']} x{qty} - Q{prod['precio']:.2f}")
+            prod = prods[pid]
+            lines.append(f"{_campo(prod, 'nombre')} x{qty} - Q{_campo(prod, 'precio'):.2f}")
         lines.append("-"*40)
         lines.append(f"Total: Q{self.total():.2f}")
         return "\n".join(lines)
@@ -17,5 +17,13 @@ class ProductoManager:
     def buscar_por_id(self, id_prod):
         return self.hash_productos.buscar(id_prod)
 
+    def buscar_por_ids(self, ids):
+        encontrados = {}
+        for id_prod in ids:
+            prod = self.hash_productos.buscar(id_prod)
+            if prod is not None:
+                encontrados[id_prod] = prod
+        return encontrados
+
     def listar(self):
         return self.productos
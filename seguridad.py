@@ -1,24 +1,50 @@
 # administrador/seguridad.py
-import os, hashlib, getpass
+import os, getpass, threading
+
+# Los hashes se calculan en contrasenas.py (también los usa Administrador);
+# el costo actual es contrasenas.ITERACIONES
+from administrador.contrasenas import ALGORITMO, MIN_ITERACIONES, LARGO_SAL, hash_password, verificar_hash, necesita_rehash, calibrar
 
 RUTA_HASH = "data/admin_hash.txt"
 
-def hash_password(pwd):
-    return hashlib.sha256(pwd.encode()).hexdigest()
+# Último contenido leído de RUTA_HASH: (ruta, mtime_ns, tamaño, hash)
+_cache_hash = None
+_lock_hash = threading.Lock()
 
 def leer_hash():
-    if not os.path.exists(RUTA_HASH):
+    """Hash guardado; el archivo solo se vuelve a leer si cambió su mtime o tamaño"""
+    global _cache_hash
+    try:
+        st = os.stat(RUTA_HASH)
+    except FileNotFoundError:
+        _cache_hash = None
         return None
-    with open(RUTA_HASH, "r", encoding="utf-8") as f:
-        return f.read().strip()
+    cache = _cache_hash
+    if cache and cache[:3] == (RUTA_HASH, st.st_mtime_ns, st.st_size):
+        return cache[3]
+    with _lock_hash:
+        with open(RUTA_HASH, "r", encoding="utf-8") as f:
+            h = f.read().strip()
+        _cache_hash = (RUTA_HASH, st.st_mtime_ns, st.st_size, h)
+    return h
 
 def guardar_hash(h):
-    os.makedirs("data", exist_ok=True)
-    with open(RUTA_HASH, "w", encoding="utf-8") as f:
-        f.write(h)
+    global _cache_hash
+    os.makedirs(os.path.dirname(RUTA_HASH) or ".", exist_ok=True)
+    with _lock_hash:
+        with open(RUTA_HASH, "w", encoding="utf-8") as f:
+            f.write(h)
+        st = os.stat(RUTA_HASH)
+        _cache_hash = (RUTA_HASH, st.st_mtime_ns, st.st_size, h)
 
 def verificar(pwd):
-    return hash_password(pwd) == leer_hash()
+    h = leer_hash()
+    if not verificar_hash(pwd, h):
+        return False
+    # Migrar al formato y costo actuales aprovechando que se conoce la contraseña
+    if necesita_rehash(h):
+        guardar_hash(hash_password(pwd))
+    return True
 
 def crear_o_cambiar():
     p1 = getpass.getpass("Nueva contraseña: ").strip()
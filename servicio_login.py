@@ -0,0 +1,241 @@
+# administrador/servicio_login.py
+"""
+SERVICIO DE LOGIN - Creative Designs
+Verificación de contraseñas fuera del hilo que atiende al usuario
+
+Descripción: Verificar un hash PBKDF2 tarda del orden de 0.1 s a propósito
+(ver seguridad.calibrar). Este servicio hace esa verificación en un pool de
+hilos acotado (hashlib libera el GIL mientras calcula, así que los hilos
+trabajan en paralelo), limita cuántas verificaciones pueden esperar en cola
+y cuántos intentos puede hacer cada usuario por ventana de tiempo. Con un
+LimitadorIntentos (ver limitador_intentos.py) los fallos se cuentan además
+por usuario y por origen en un almacén compartido entre procesos, y los
+usuarios u orígenes bloqueados se rechazan antes de ocupar el pool. Ofrece
+una interfaz síncrona, una con Future y una para asyncio.
+
+Ejemplo:
+    servicio = ServicioLogin(RegistroUsuario(almacen))
+    exito, mensaje, admin = servicio.autenticar('admin', 'admin123')
+    exito, mensaje, admin = await servicio.autenticar_async('admin', 'admin123')
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from administrador import seguridad
+
+logger = logging.getLogger(__name__)
+
+MENSAJE_OCUPADO = "El servicio de inicio de sesión está ocupado, intente de nuevo en unos segundos"
+MENSAJE_CREDENCIALES = "Usuario o contraseña incorrectos"
+# Clave de los intentos con la contraseña de administración (data/admin_hash.txt)
+USUARIO_ADMIN = "__admin__"
+
+
+class ServicioLogin:
+    """
+    Autenticación en un pool de hilos con límite de cola y de intentos
+
+    Atributos:
+        registro (RegistroUsuario): Usuarios a autenticar (opcional si solo se
+            usa verificar_admin)
+        max_pendientes (int): Verificaciones en curso o en cola; las que
+            excedan el límite se rechazan sin esperar
+        intentos_por_ventana (int): Intentos permitidos por usuario en cada
+            ventana de 'ventana' segundos
+        limitador (LimitadorIntentos, optional): Bloqueos por fallos
+            compartidos entre procesos
+    """
+
+    # Usuarios en memoria a partir de los cuales se descartan los inactivos
+    MAX_USUARIOS_MEMORIA = 10000
+
+    def __init__(self, registro=None, max_hilos: int = 4, max_pendientes: int = 32,
+                 intentos_por_ventana: int = 5, ventana: float = 60.0, limitador=None):
+        self.registro = registro
+        self.limitador = limitador
+        self.max_pendientes = max_pendientes
+        self.intentos_por_ventana = intentos_por_ventana
+        self.ventana = ventana
+        self._pool = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix="login")
+        self._cupos = threading.BoundedSemaphore(max_pendientes)
+        # Instantes de los intentos recientes por usuario
+        self._intentos: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        # Un intento a la vez por usuario: validar_credenciales modifica el
+        # contador de intentos fallidos
+        self._locks_usuario: Dict[str, threading.Lock] = {}
+        self._hash_ficticio = None
+
+    # ==================== LÍMITES ====================
+
+    def _registrar_intento(self, usuario: str) -> bool:
+        """Cuenta un intento; False si el usuario ya agotó los de la ventana"""
+        ahora = time.monotonic()
+        with self._lock:
+            intentos = self._intentos.setdefault(usuario, deque())
+            while intentos and ahora - intentos[0] >= self.ventana:
+                intentos.popleft()
+            if len(intentos) >= self.intentos_por_ventana:
+                return False
+            intentos.append(ahora)
+            # Evitar que el diccionario crezca con usuarios que ya no intentan
+            if len(self._intentos) > self.MAX_USUARIOS_MEMORIA:
+                for clave in [c for c in self._intentos if not self._reciente(c, ahora)]:
+                    del self._intentos[clave]
+            return True
+
+    def _reciente(self, usuario: str, ahora: float) -> bool:
+        """True si el usuario hizo algún intento dentro de la ventana"""
+        intentos = self._intentos.get(usuario)
+        return bool(intentos) and ahora - intentos[-1] < self.ventana
+
+    def _lock_de(self, usuario: str) -> threading.Lock:
+        with self._lock:
+            lock = self._locks_usuario.get(usuario)
+            if lock is None:
+                if len(self._locks_usuario) > self.MAX_USUARIOS_MEMORIA:
+                    # Quien va a usar un lock registró antes un intento, así
+                    # que solo se descartan los libres de usuarios inactivos
+                    ahora = time.monotonic()
+                    for clave in [c for c, l in self._locks_usuario.items()
+                                  if not l.locked() and not self._reciente(c, ahora)]:
+                        del self._locks_usuario[clave]
+                lock = self._locks_usuario[usuario] = threading.Lock()
+            return lock
+
+    def _enviar(self, funcion, *args) -> Optional[Future]:
+        """Envía una tarea al pool; None si la cola está llena"""
+        if not self._cupos.acquire(blocking=False):
+            logger.warning("Cola de verificación de contraseñas llena; se rechaza el intento")
+            return None
+        try:
+            futuro = self._pool.submit(funcion, *args)
+        except RuntimeError:
+            # Pool cerrado
+            self._cupos.release()
+            raise
+        futuro.add_done_callback(lambda _: self._cupos.release())
+        return futuro
+
+    @staticmethod
+    def _resuelto(resultado) -> Future:
+        futuro = Future()
+        futuro.set_result(resultado)
+        return futuro
+
+    # ==================== USUARIOS DEL REGISTRO ====================
+
+    def _bloqueado(self, usuario: str, origen: Optional[str]) -> Optional[str]:
+        """Mensaje de rechazo si el limitador tiene bloqueado al usuario o al origen"""
+        if self.limitador is None:
+            return None
+        permitido, espera = self.limitador.permitir(usuario, origen)
+        if permitido:
+            return None
+        return f"Demasiados intentos fallidos. Intente de nuevo en {int(espera) + 1} segundos."
+
+    def _autenticar(self, usuario: str, password: str,
+                    origen: Optional[str]) -> Tuple[bool, str, Optional[object]]:
+        admin = self.registro.buscar_por_usuario(usuario)
+        if admin is None:
+            # Gastar el mismo tiempo que con un usuario real para no revelar cuáles existen
+            if self._hash_ficticio is None:
+                self._hash_ficticio = seguridad.hash_password("usuario inexistente")
+            seguridad.verificar_hash(password, self._hash_ficticio)
+            if self.limitador is not None:
+                self.limitador.registrar_fallo(usuario, origen)
+            return False, MENSAJE_CREDENCIALES, None
+
+        with self._lock_de(admin.usuario):
+            hash_anterior = admin.password_hash
+            exito, mensaje = admin.validar_credenciales(usuario, password, self.limitador, origen)
+            # Persistir intentos fallidos, último acceso o hash actualizado
+            if exito or admin.password_hash != hash_anterior or admin.intentos_fallidos:
+                self.registro.guardar_cambios(admin)
+        return exito, mensaje, admin if exito else None
+
+    def autenticar_futuro(self, usuario: str, password: str, origen: Optional[str] = None) -> Future:
+        """
+        Inicia la autenticación de un usuario del registro
+
+        Args:
+            origen (str, optional): Origen del intento (IP, terminal) para el limitador
+
+        Returns:
+            Future: Resultado (exito, mensaje, administrador o None)
+        """
+        clave = (usuario or "").strip().lower()
+        if not self._registrar_intento(clave):
+            return self._resuelto((False, "Demasiados intentos. Espere un momento e intente de nuevo", None))
+        mensaje = self._bloqueado(usuario, origen)
+        if mensaje:
+            return self._resuelto((False, mensaje, None))
+        futuro = self._enviar(self._autenticar, usuario, password, origen)
+        return futuro if futuro is not None else self._resuelto((False, MENSAJE_OCUPADO, None))
+
+    def autenticar(self, usuario: str, password: str, origen: Optional[str] = None,
+                   timeout: Optional[float] = None) -> Tuple[bool, str, Optional[object]]:
+        """
+        Autentica un usuario del registro esperando el resultado
+
+        Returns:
+            tuple: (exito, mensaje, administrador o None)
+        """
+        return self.autenticar_futuro(usuario, password, origen).result(timeout)
+
+    async def autenticar_async(self, usuario: str, password: str,
+                               origen: Optional[str] = None) -> Tuple[bool, str, Optional[object]]:
+        """Versión para asyncio de autenticar(); no bloquea el event loop"""
+        return await asyncio.wrap_future(self.autenticar_futuro(usuario, password, origen))
+
+    # ==================== CONTRASEÑA DE ADMINISTRACIÓN ====================
+
+    def _verificar_admin(self, password: str, origen: Optional[str]) -> bool:
+        correcta = seguridad.verificar(password)
+        if self.limitador is not None:
+            if correcta:
+                self.limitador.registrar_exito(USUARIO_ADMIN, origen)
+            else:
+                self.limitador.registrar_fallo(USUARIO_ADMIN, origen)
+        return correcta
+
+    def verificar_admin_futuro(self, password: str, origen: Optional[str] = None) -> Future:
+        """
+        Inicia seguridad.verificar() (contraseña de data/admin_hash.txt)
+
+        Returns:
+            Future: True si la contraseña es correcta; False también si se
+                agotaron los intentos o la cola está llena
+        """
+        if not self._registrar_intento(USUARIO_ADMIN) or self._bloqueado(USUARIO_ADMIN, origen):
+            return self._resuelto(False)
+        futuro = self._enviar(self._verificar_admin, password, origen)
+        return futuro if futuro is not None else self._resuelto(False)
+
+    def verificar_admin(self, password: str, origen: Optional[str] = None,
+                        timeout: Optional[float] = None) -> bool:
+        """Versión síncrona de verificar_admin_futuro()"""
+        return self.verificar_admin_futuro(password, origen).result(timeout)
+
+    async def verificar_admin_async(self, password: str, origen: Optional[str] = None) -> bool:
+        """Versión para asyncio de verificar_admin()"""
+        return await asyncio.wrap_future(self.verificar_admin_futuro(password, origen))
+
+    # ==================== CICLO DE VIDA ====================
+
+    def cerrar(self, esperar: bool = True):
+        """Detiene el pool; las verificaciones en curso terminan si esperar=True"""
+        self._pool.shutdown(wait=esperar)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
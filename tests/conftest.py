@@ -0,0 +1,69 @@
+"""
+Configuración común de las pruebas
+
+Los módulos del proyecto se importan como en la aplicación: el paquete Data y
+los módulos raíz desde la raíz del proyecto, y los de CreativeDesings también
+por nombre (RegistroUsuario usa "from Administrador import Administrador").
+Los módulos de administración (seguridad.py, servicio_login.py, ...) viven en
+la raíz pero pertenecen al paquete administrador, como indica su primera
+línea; se importan como administrador.<módulo>, igual que en main.py.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for ruta in (RAIZ, os.path.join(RAIZ, "CreativeDesings")):
+    if ruta not in sys.path:
+        sys.path.insert(0, ruta)
+
+if "administrador" not in sys.modules:
+    _administrador = types.ModuleType("administrador")
+    _administrador.__path__ = [RAIZ]
+    sys.modules["administrador"] = _administrador
+
+from Data import backends, replicas  # noqa: E402
+from Data.backends import BackendSQLite  # noqa: E402
+
+
+@pytest.fixture
+def bd_sqlite(tmp_path):
+    """Backend SQLite en un archivo temporal con el esquema de basedeDatos.sql y sin réplicas"""
+    backend = BackendSQLite(str(tmp_path / "creative_designs.db"))
+    # Crear el esquema antes de que las pruebas escriban desde otra conexión
+    backend.conectar()
+    backends.configurar_backend(backend)
+    replicas.configurar_replicas([])
+    yield backend
+    backend.cerrar()
+    backends._backend_actual = None
+    replicas._enrutador = None
+
+
+@pytest.fixture
+def cliente_dao(bd_sqlite):
+    """ClienteDAO sobre bd_sqlite, sin el estado compartido que dejen otras pruebas"""
+    from Data.clienteDAO import ClienteDAO
+    ClienteDAO._cache_emails.limpiar()
+    ClienteDAO._filtro_emails = None
+    ClienteDAO._indice_texto = ClienteDAO._indice_telefonos = None
+    ClienteDAO._total_clientes.invalidar()
+    ClienteDAO._estadisticas = None
+    yield ClienteDAO()
+    ClienteDAO._cache_emails.limpiar()
+    ClienteDAO._filtro_emails = None
+    ClienteDAO._estadisticas = None
+
+
+def ejecutar_externo(backend, sql, params=()):
+    """Ejecuta SQL en una conexión propia, como lo haría otro proceso"""
+    import sqlite3
+    conn = sqlite3.connect(backend.ruta)
+    try:
+        conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
@@ -0,0 +1,122 @@
+"""
+Pool asíncrono falso con la interfaz de aiomysql, sobre sqlite3
+
+Permite probar ConexionAsync y los DAO asíncronos sin un servidor MySQL.
+Cada conexión del pool es una conexión sqlite3 propia al mismo archivo, en
+autocommit como las que crea ConexionAsync, de modo que el aislamiento entre
+transacciones es real.
+"""
+
+import sqlite3
+from contextlib import asynccontextmanager
+
+
+class CursorFalso:
+    """Cursor con los métodos asíncronos de aiomysql; se puede usar con await o async with"""
+
+    def __init__(self, conexion):
+        self._cursor = conexion._sqlite.cursor()
+        self.cerrado = False
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def __await__(self):
+        return self._listo().__await__()
+
+    async def _listo(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def execute(self, sql, params=None):
+        self._cursor.execute(sql.replace("%s", "?"), params or ())
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+
+    async def fetchone(self):
+        return self._cursor.fetchone()
+
+    async def fetchall(self):
+        return self._cursor.fetchall()
+
+    async def fetchmany(self, tamano):
+        return self._cursor.fetchmany(tamano)
+
+    async def close(self):
+        self.cerrado = True
+        self._cursor.close()
+
+
+class ConexionFalsa:
+    def __init__(self, ruta):
+        self._sqlite = sqlite3.connect(ruta, isolation_level=None, check_same_thread=False)
+        self.cursores = []
+        self.cerrada = False
+
+    @property
+    def en_transaccion(self):
+        return self._sqlite.in_transaction
+
+    def cursor(self, clase=None):
+        cursor = CursorFalso(self)
+        self.cursores.append(cursor)
+        return cursor
+
+    async def begin(self):
+        self._sqlite.execute("BEGIN")
+
+    async def commit(self):
+        if self._sqlite.in_transaction:
+            self._sqlite.execute("COMMIT")
+
+    async def rollback(self):
+        if self._sqlite.in_transaction:
+            self._sqlite.execute("ROLLBACK")
+
+    def close(self):
+        self.cerrada = True
+        self._sqlite.close()
+
+
+class PoolFalso:
+    """
+    Pool de ConexionFalsa
+
+    Atributos:
+        libres (list): Conexiones devueltas al pool
+        devueltas_en_transaccion (int): Conexiones que volvieron al pool con
+            una transacción abierta (debería ser siempre 0)
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.libres = []
+        self.creadas = []
+        self.devueltas_en_transaccion = 0
+        self.cerrado = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = self.libres.pop() if self.libres else None
+        if conn is None:
+            conn = ConexionFalsa(self.ruta)
+            self.creadas.append(conn)
+        try:
+            yield conn
+        finally:
+            if not conn.cerrada:
+                if conn.en_transaccion:
+                    self.devueltas_en_transaccion += 1
+                self.libres.append(conn)
+
+    def close(self):
+        self.cerrado = True
+
+    async def wait_closed(self):
+        for conn in self.creadas:
+            if not conn.cerrada:
+                conn.close()
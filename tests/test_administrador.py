@@ -0,0 +1,65 @@
+"""Pruebas de las contraseñas de Administrador y RegistroUsuario"""
+
+import pytest
+
+from Administrador import Administrador
+from RegistroUsuario import RegistroUsuario
+from AlmacenUsuarios import AlmacenUsuarios
+
+
+@pytest.fixture(autouse=True)
+def hash_rapido(monkeypatch):
+    """Hashes de bajo costo para que las pruebas no tarden"""
+    from administrador import contrasenas
+    monkeypatch.setattr(contrasenas, "ITERACIONES", 1000)
+
+
+def test_no_conserva_la_contrasena_en_texto_plano():
+    admin = Administrador(1, "Ana Pérez", "ana_perez", "clave123", "vendedor")
+    with pytest.raises(AttributeError):
+        admin.password
+    assert "clave123" not in repr(vars(admin))
+    assert admin.verificar_password("clave123")
+    assert admin.validar_completo() == (True, [])
+
+
+def test_contrasena_invalida_se_reporta():
+    admin = Administrador(1, "Ana Pérez", "ana_perez", "solotexto", "vendedor")
+    valido, errores = admin.validar_completo()
+    assert not valido
+    assert errores == ["Contraseña: La contraseña debe contener al menos una letra y un número"]
+    assert not Administrador(1, "Ana Pérez", "ana_perez", "", "vendedor").validar_password()[0]
+
+
+def test_usuario_recargado_es_valido(tmp_path):
+    ruta = str(tmp_path / "usuarios.jsonl")
+    registro = RegistroUsuario(AlmacenUsuarios(ruta))
+    assert registro.registrar(Administrador(None, "Ana Pérez", "ana_perez", "clave123", "vendedor"))
+
+    recargado = RegistroUsuario(AlmacenUsuarios(ruta)).buscar_por_usuario("ana_perez")
+    assert recargado.validar_completo() == (True, [])
+    assert recargado.verificar_password("clave123")
+
+
+def test_calibrar_afecta_a_administrador_y_seguridad(monkeypatch):
+    from administrador import contrasenas, seguridad
+    monkeypatch.setattr(contrasenas, "ITERACIONES", contrasenas.MIN_ITERACIONES)
+    iteraciones = seguridad.calibrar(latencia=0.001)
+    assert contrasenas.ITERACIONES == iteraciones
+    admin = Administrador(1, "Ana Pérez", "ana_perez", "clave123", "vendedor")
+    assert admin.password_hash.split("$")[1] == str(iteraciones)
+    assert seguridad.hash_password("clave123").split("$")[1] == str(iteraciones)
+
+
+def test_cambiar_password():
+    admin = Administrador(1, "Ana Pérez", "ana_perez", "clave123", "vendedor")
+    assert admin.cambiar_password("clave123", "corta", "corta")[0] is False
+    assert admin.cambiar_password("clave123", "nueva456", "nueva456") == (True, "Contraseña cambiada exitosamente")
+    assert admin.verificar_password("nueva456") and not admin.verificar_password("clave123")
+    assert admin.validar_password()[0]
+
+
+def test_registrar_rechaza_contrasena_invalida():
+    registro = RegistroUsuario()
+    assert not registro.registrar(Administrador(None, "Ana Pérez", "ana_perez", "abc", "vendedor"))
+    assert registro.buscar_por_usuario("ana_perez") is None
@@ -0,0 +1,57 @@
+"""Pruebas del diario de usuarios"""
+
+import json
+
+from AlmacenUsuarios import AlmacenUsuarios
+
+
+def _datos(usuario, id_admin, nombre="Ana"):
+    return {'id_admin': id_admin, 'usuario': usuario, 'nombre': nombre, 'password_hash': 'x'}
+
+
+def _lineas(ruta):
+    with open(ruta, encoding='utf-8') as f:
+        return [json.loads(linea) for linea in f if linea.strip()]
+
+
+def test_recarga_el_ultimo_estado(tmp_path):
+    ruta = str(tmp_path / "usuarios.jsonl")
+    almacen = AlmacenUsuarios(ruta)
+    almacen.guardar(_datos("ana", 1))
+    almacen.guardar(_datos("luis", 2))
+    almacen.guardar(_datos("ana", 1, nombre="Ana María"))
+    almacen.eliminar("luis")
+
+    recargado = AlmacenUsuarios(ruta)
+    assert recargado.cargar() == [_datos("ana", 1, nombre="Ana María")]
+    # El id del usuario eliminado no se reutiliza
+    assert recargado.ultimo_id == 2
+
+
+def test_compacta_cuando_sobran_lineas_obsoletas(tmp_path, monkeypatch):
+    monkeypatch.setattr(AlmacenUsuarios, "MIN_OBSOLETAS_COMPACTAR", 5)
+    ruta = str(tmp_path / "usuarios.jsonl")
+    almacen = AlmacenUsuarios(ruta)
+    almacen.guardar(_datos("temporal", 9))
+    almacen.eliminar("temporal")
+    for cambio in range(10):
+        almacen.guardar(_datos("ana", 1, nombre=f"Ana {cambio}"))
+
+    lineas = _lineas(ruta)
+    assert len(lineas) < 12
+    assert lineas[0] == {'op': 'secuencia', 'ultimo_id': 9}
+
+    recargado = AlmacenUsuarios(ruta)
+    assert recargado.cargar() == [_datos("ana", 1, nombre="Ana 9")]
+    assert recargado.ultimo_id == 9
+
+
+def test_linea_cortada_se_omite(tmp_path):
+    ruta = tmp_path / "usuarios.jsonl"
+    ruta.write_text(json.dumps({'op': 'guardar', 'datos': _datos("ana", 1)}) + "\n{\"op\": \"guar",
+                    encoding='utf-8')
+    almacen = AlmacenUsuarios(str(ruta))
+    assert len(almacen.cargar()) == 1
+    almacen.guardar(_datos("luis", 2))
+
+    assert [u['usuario'] for u in AlmacenUsuarios(str(ruta)).cargar()] == ["ana", "luis"]
@@ -0,0 +1,48 @@
+import sqlite3
+
+import pytest
+
+from Data.backends import BackendSQLite
+from Data.conexion import Conexion
+
+SQL_CONTAR = "SELECT COUNT(*) FROM clientes"
+
+
+def test_cada_conexion_tiene_su_propia_transaccion(bd_sqlite):
+    escritora = bd_sqlite.conectar()
+    lectora = bd_sqlite.conectar()
+    cursor = escritora.cursor()
+    cursor.execute(SQL_CONTAR)
+    antes = cursor.fetchone()[0]
+    cursor.execute("INSERT INTO clientes (nombre, apellido) VALUES (%s, %s)", ("Ana", "Paz"))
+
+    otro = lectora.cursor()
+    otro.execute(SQL_CONTAR)
+    assert otro.fetchone()[0] == antes
+    escritora.rollback()
+    escritora.close()
+    lectora.close()
+
+
+def test_close_cierra_la_conexion(bd_sqlite):
+    conn = bd_sqlite.conectar()
+    sqlite_conn = conn._conn
+    conn.close()
+    assert not conn.is_connected()
+    with pytest.raises(sqlite3.ProgrammingError):
+        sqlite_conn.execute("SELECT 1")
+
+
+def test_memoria_persiste_entre_conexiones_y_se_aisla_por_backend():
+    primero = BackendSQLite(":memory:")
+    segundo = BackendSQLite(":memory:")
+    try:
+        conexion = Conexion(backend=primero)
+        assert conexion.ejecutar_query("INSERT INTO clientes (nombre, apellido) VALUES (%s, %s)",
+                                       ("Eva", "Ruiz"))[0]
+        conexion.desconectar()
+        total = Conexion(backend=primero).ejecutar_query(SQL_CONTAR)[1][0][0]
+        assert Conexion(backend=segundo).ejecutar_query(SQL_CONTAR)[1][0][0] == total - 1
+    finally:
+        primero.cerrar()
+        segundo.cerrar()
@@ -0,0 +1,70 @@
+from Data.cache import CacheLRU, ContadorVersion
+from Data.productoDAO import ProductoDAOCache
+
+
+def test_contador_version_detecta_escrituras_seguidas(tmp_path):
+    ruta = str(tmp_path / "version.txt")
+    escritor = ContadorVersion(ruta)
+    lector = ContadorVersion(ruta)
+    assert lector.actual() == 0
+    # Varias escrituras dentro de la misma resolución de mtime y con el mismo tamaño
+    for esperado in range(1, 6):
+        escritor.incrementar()
+        assert lector.actual() == esperado
+
+
+def test_cache_se_vacia_si_otro_proceso_publica(tmp_path):
+    ruta = str(tmp_path / "version.txt")
+    cache = CacheLRU(10, ttl=None, version=ContadorVersion(ruta))
+    cache.guardar("a", 1)
+    ContadorVersion(ruta).incrementar()
+    assert cache.obtener("a") is None
+
+
+def test_obtener_o_cargar_no_guarda_si_hubo_escritura_al_cargar(tmp_path):
+    ruta = str(tmp_path / "version.txt")
+    cache = CacheLRU(10, ttl=None, version=ContadorVersion(ruta))
+    otro_proceso = ContadorVersion(ruta)
+
+    def cargar():
+        otro_proceso.incrementar()
+        return "viejo"
+
+    assert cache.obtener_o_cargar("a", cargar) == "viejo"
+    assert "a" not in cache
+
+
+def test_obtener_o_cargar_respeta_cachear():
+    cache = CacheLRU(10, ttl=None)
+    assert cache.obtener_o_cargar("a", lambda: None, lambda v: v is not None) is None
+    assert "a" not in cache
+    assert cache.obtener_o_cargar("b", lambda: 2, lambda v: v is not None) == 2
+    assert cache.obtener("b") == 2
+
+
+def test_producto_dao_cache_entrega_copias(bd_sqlite):
+    dao = ProductoDAOCache(ttl=None)
+    producto = dao.buscar_por_id(1)
+    nombre = producto.nombre
+    producto.nombre = "modificado por el llamador"
+    assert dao.buscar_por_id(1).nombre == nombre
+
+    lista = dao.listar()
+    lista[0].precio = -1
+    lista.clear()
+    assert dao.listar() and all(p.precio >= 0 for p in dao.listar())
+
+    grupos = dao.listar_con_categoria(agrupar=True)
+    categoria = next(iter(grupos))
+    grupos[categoria]['productos'].clear()
+    assert dao.listar_con_categoria(agrupar=True)[categoria]['productos']
+    assert dao.estadisticas_cache()['aciertos'] >= 3
+
+
+def test_producto_dao_cache_invalida_al_actualizar(bd_sqlite):
+    dao = ProductoDAOCache(ttl=None)
+    producto = dao.buscar_por_id(1)
+    producto.precio = 99.5
+    assert dao.actualizar(producto)
+    assert dao.buscar_por_id(1).precio == 99.5
+    assert dao.buscar_por_ids([1])[1].precio == 99.5
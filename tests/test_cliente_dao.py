@@ -0,0 +1,65 @@
+from conftest import ejecutar_externo
+
+
+def _insertar_externo(backend, email):
+    ejecutar_externo(backend, "INSERT INTO clientes (nombre, apellido, email) VALUES (?, ?, ?)",
+                     ("Ana", "Pérez", email))
+
+
+def test_email_ausente_no_se_cachea(cliente_dao, bd_sqlite):
+    assert not cliente_dao.existe_email("nueva@correo.com")
+    _insertar_externo(bd_sqlite, "nueva@correo.com")
+    assert cliente_dao.existe_email("nueva@correo.com")
+    assert cliente_dao.buscar_por_email("NUEVA@correo.com").email == "nueva@correo.com"
+
+
+def test_filtro_bloom_positivo_se_confirma_en_la_base(cliente_dao, bd_sqlite):
+    _insertar_externo(bd_sqlite, "borrada@correo.com")
+    assert cliente_dao.cargar_filtro_emails()
+    ejecutar_externo(bd_sqlite, "DELETE FROM clientes WHERE email = ?", ("borrada@correo.com",))
+    # El filtro dice "puede existir": la respuesta sale de la base de datos
+    assert not cliente_dao.existe_email("borrada@correo.com")
+    assert cliente_dao.buscar_por_email("borrada@correo.com") is None
+
+
+def test_filtro_bloom_negativo_no_oculta_altas_externas(cliente_dao, bd_sqlite):
+    assert cliente_dao.cargar_filtro_emails()
+    _insertar_externo(bd_sqlite, "externa@correo.com")
+    # El filtro no conoce el alta de otro proceso, pero la consulta sí
+    assert not cliente_dao.puede_existir_email("externa@correo.com")
+    assert cliente_dao.existe_email("externa@correo.com")
+    assert cliente_dao.buscar_por_email("Externa@correo.com").email == "externa@correo.com"
+
+
+def test_eliminar_olvida_el_email(cliente_dao):
+    from CreativeDesings.Cliente import Cliente
+    exito, _ = cliente_dao.insertar(Cliente(nombre="Luis", apellido="Gómez", telefono="55551234",
+                                            email="luis@correo.com", direccion="Zona 1, Guatemala"))
+    assert exito
+    assert cliente_dao.existe_email("luis@correo.com")
+    cliente = cliente_dao.buscar_por_email("luis@correo.com")
+    assert cliente_dao.eliminar(cliente.id_cliente)[0]
+    assert not cliente_dao.existe_email("luis@correo.com")
+
+
+def test_sincronizar_lote_clasifica_y_escribe(cliente_dao):
+    from CreativeDesings.Cliente import Cliente
+
+    def cliente(email, telefono="55551234"):
+        return Cliente(nombre="Ana", apellido="Pérez", telefono=telefono, email=email,
+                       direccion="Zona 10, Guatemala")
+
+    total_inicial = cliente_dao.contar()
+    resumen = cliente_dao.sincronizar_lote([cliente("a@correo.com"), cliente("b@correo.com")])
+    assert resumen['insertados'] == 2 and resumen['errores'] == 0
+
+    resumen = cliente_dao.sincronizar_lote([
+        cliente("A@correo.com"),                      # sin cambios (email normalizado)
+        cliente("b@correo.com", telefono="55559999"),  # modificado
+        cliente("c@correo.com"),                      # nuevo
+        cliente("sin-arroba"),                        # inválido
+    ], tamano_lote=2)
+    assert resumen == {'insertados': 1, 'actualizados': 1, 'sin_cambios': 1, 'invalidos': 1, 'errores': 0}
+    assert cliente_dao.buscar_por_email("b@correo.com").telefono == "55559999"
+    assert cliente_dao.existe_email("c@correo.com")
+    assert cliente_dao.contar() == total_inicial + 3
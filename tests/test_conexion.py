@@ -0,0 +1,111 @@
+import sqlite3
+
+from conftest import ejecutar_externo
+from Data import resiliencia
+from Data.backends import Backend
+from Data.conexion import Conexion, MODO_LECTURA
+from Data.productoDAO import ProductoDAO
+
+SQL_STICKER = "SELECT nombre, precio FROM Sticker WHERE id = %s"
+
+
+def test_sentencias_se_reutilizan_con_la_conexion_abierta(bd_sqlite):
+    conexion = Conexion()
+    assert conexion.mantener_conexion
+    assert conexion.ejecutar_query(SQL_STICKER, (1,))[0]
+    cursor = conexion._sentencias[SQL_STICKER]
+    assert conexion.ejecutar_query(SQL_STICKER, (2,))[0]
+    assert conexion._sentencias[SQL_STICKER] is cursor
+    assert conexion.verificar_conexion()
+
+    conexion.desconectar()
+    assert not conexion._sentencias
+
+
+def test_sin_mantener_conexion_no_se_guardan_sentencias(bd_sqlite):
+    conexion = Conexion(mantener_conexion=False)
+    exito, filas = conexion.ejecutar_query(SQL_STICKER, (1,), MODO_LECTURA)
+    assert exito and filas
+    assert not conexion._sentencias
+    assert not conexion.verificar_conexion()
+
+
+def test_conexion_abierta_ve_escrituras_de_otras_conexiones(bd_sqlite):
+    conexion = Conexion()
+    sql = "SELECT COUNT(*) FROM clientes"
+    antes = conexion.ejecutar_query(sql)[1][0][0]
+    ejecutar_externo(bd_sqlite, "INSERT INTO clientes (nombre, apellido) VALUES ('Eva', 'Ruiz')")
+    assert conexion.ejecutar_query(sql)[1][0][0] == antes + 1
+
+
+def test_lecturas_de_los_dao_usan_ejecutar_query(bd_sqlite, cliente_dao):
+    productos = ProductoDAO()
+    primero = productos.buscar_por_id(1)
+    assert primero is not None and productos.ultimo_error is None
+    assert len(productos.conexion._sentencias) == 1
+    assert productos.buscar_por_id(2).id_producto == 2
+    assert len(productos.conexion._sentencias) == 1
+
+    clientes = list(cliente_dao.iterar(tamano_lote=2))
+    assert [c.id_cliente for c in clientes] == sorted(c.id_cliente for c in clientes)
+    assert len(cliente_dao.conexion._sentencias) == 1
+    assert cliente_dao.buscar_por_id(clientes[0].id_cliente).email == clientes[0].email
+    assert cliente_dao.buscar_por_email(clientes[0].email).id_cliente == clientes[0].id_cliente
+
+
+class _BackendFallido(Backend):
+    """Backend cuyo conectar() lanza las excepciones indicadas, en orden"""
+
+    def __init__(self, nombre, *errores):
+        self.nombre = nombre
+        self.errores = list(errores)
+        self.intentos = 0
+
+    @property
+    def Error(self):
+        return sqlite3.Error
+
+    def conectar(self, conexion):
+        self.intentos += 1
+        raise self.errores.pop(0) if self.errores else TypeError("puerto inválido")
+
+
+def _conexion(backend):
+    conexion = Conexion(backend=backend, usar_preparadas=False)
+    conexion.umbral_fallos = 1
+    conexion.enfriamiento = 0.0
+    return conexion
+
+
+def test_error_inesperado_libera_la_prueba_del_corta_circuito():
+    backend = _BackendFallido("prueba-cortacircuito", sqlite3.OperationalError("caído"))
+    conexion = _conexion(backend)
+    try:
+        # El primer fallo abre el circuito; los siguientes intentos son pruebas
+        # en semiabierto que fallan con un error que no es del backend
+        for _ in range(3):
+            assert conexion.conectar() is None
+        assert backend.intentos == 3
+    finally:
+        resiliencia._cortacircuitos.pop(backend.descripcion(conexion), None)
+
+
+def test_sin_controlador_ejecutar_query_retorna_error():
+    class BackendSinControlador(Backend):
+        nombre = "sin-controlador"
+
+        @property
+        def Error(self):
+            import controlador_inexistente_cd  # noqa: F401
+
+        def conectar(self, conexion):
+            import controlador_inexistente_cd  # noqa: F401
+
+    backend = BackendSinControlador()
+    conexion = Conexion(backend=backend, usar_preparadas=False)
+    try:
+        exito, mensaje = conexion.ejecutar_query(SQL_STICKER, (1,))
+        assert not exito and mensaje
+        assert conexion.ejecutar_query(SQL_STICKER, (1,), modo="otro") == (False, "Modo inválido: otro")
+    finally:
+        resiliencia._cortacircuitos.pop(backend.descripcion(conexion), None)
@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from pool_falso import PoolFalso
+from Data.conexionAsync import ConexionAsync
+from Data.clienteDAOAsync import ClienteDAOAsync
+from CreativeDesings.Cliente import Cliente
+
+SQL_CONTAR = "SELECT COUNT(*) FROM clientes"
+SQL_INSERTAR = "INSERT INTO clientes (nombre, apellido, email) VALUES (%s, %s, %s)"
+
+
+@pytest.fixture
+def pool(bd_sqlite):
+    return PoolFalso(bd_sqlite.ruta)
+
+
+def test_transaccion_confirma_o_revierte(pool):
+    async def prueba():
+        conexion = ConexionAsync(pool=pool)
+        otra = ConexionAsync(pool=PoolFalso(pool.ruta))
+        antes = (await conexion.consultar_uno(SQL_CONTAR))[0]
+
+        async with conexion.transaccion():
+            await conexion.ejecutar(SQL_INSERTAR, ("Ana", "Paz", "ana@correo.com"))
+            # Sin confirmar todavía: otra conexión no la ve
+            assert (await otra.consultar_uno(SQL_CONTAR))[0] == antes
+        assert (await otra.consultar_uno(SQL_CONTAR))[0] == antes + 1
+
+        with pytest.raises(RuntimeError):
+            async with conexion.transaccion():
+                await conexion.ejecutar(SQL_INSERTAR, ("Luis", "Paz", "luis@correo.com"))
+                raise RuntimeError("falla a mitad de la transacción")
+        assert (await otra.consultar_uno(SQL_CONTAR))[0] == antes + 1
+
+        # Fuera de una transacción cada sentencia se confirma sola
+        await conexion.ejecutar(SQL_INSERTAR, ("Eva", "Paz", "eva@correo.com"))
+        assert (await otra.consultar_uno(SQL_CONTAR))[0] == antes + 2
+
+    asyncio.run(prueba())
+    assert pool.devueltas_en_transaccion == 0
+
+
+def test_transaccion_es_propia_de_cada_instancia(pool):
+    async def prueba():
+        primera = ConexionAsync(pool=pool)
+        segunda = ConexionAsync(pool=PoolFalso(pool.ruta))
+        async with primera.transaccion() as conn:
+            assert primera.en_transaccion()
+            assert not segunda.en_transaccion()
+            async with segunda.adquirir() as otra_conn:
+                assert otra_conn is not conn
+
+    asyncio.run(prueba())
+
+
+def test_iterar_interrumpido_cierra_el_cursor(pool):
+    async def prueba():
+        conexion = ConexionAsync(pool=pool)
+        async with aclosing(conexion.iterar("SELECT id_cliente FROM clientes", tamano_lote=1)) as filas:
+            async for _ in filas:
+                break
+        conn = pool.creadas[-1]
+        assert conn in pool.libres
+        assert all(cursor.cerrado for cursor in conn.cursores)
+
+    asyncio.run(prueba())
+
+
+def test_dao_asincrono_en_transaccion(pool):
+    async def prueba():
+        dao = ClienteDAOAsync(ConexionAsync(pool=pool))
+        cliente = Cliente(nombre="Rosa", apellido="Díaz", telefono="55554321",
+                          email="rosa@correo.com", direccion="Zona 10, Guatemala")
+        async with dao.conexion.transaccion():
+            exito, _ = await dao.insertar(cliente)
+            assert exito
+        encontrado = await dao.buscar_por_email("rosa@correo.com")
+        assert encontrado is not None and encontrado.id_cliente == cliente.id_cliente
+
+    asyncio.run(prueba())
+    assert pool.devueltas_en_transaccion == 0
+
+
+def test_dao_iterar_propaga_excepciones_lanzadas_al_generador(pool):
+    async def prueba():
+        dao = ClienteDAOAsync(ConexionAsync(pool=pool))
+        clientes = dao.iterar(tamano_lote=1)
+        assert isinstance(await clientes.__anext__(), Cliente)
+        with pytest.raises(RuntimeError):
+            await clientes.athrow(RuntimeError("error del consumidor"))
+        await clientes.aclose()
+
+    asyncio.run(prueba())
@@ -0,0 +1,78 @@
+"""Pruebas de AcumuladorEstadisticas y de las estadísticas mantenidas por ClienteDAO"""
+
+import time
+import pickle
+from datetime import datetime, timedelta
+
+from CreativeDesings.Cliente import AcumuladorEstadisticas, Cliente
+
+
+def _cliente(email, direccion="Zona 1, Guatemala", dias=0):
+    cliente = Cliente(None, "Ana", "Pérez", "55551234", email, direccion)
+    cliente.fecha_registro = datetime(2025, 1, 1) - timedelta(days=dias)
+    return cliente
+
+
+def test_fusionar_conserva_conteos_negativos():
+    base = AcumuladorEstadisticas([_cliente("a@correo.com"), _cliente("b@correo.com", "Antigua")])
+    # Otro proceso solo registró una baja
+    bajas = AcumuladorEstadisticas()
+    bajas.quitar(_cliente("b@correo.com", "Antigua"))
+    assert bajas.dominios == {"correo.com": -1}
+    assert bajas.resultado()['dominios_email'] == {}
+
+    altas = AcumuladorEstadisticas([_cliente("c@otro.com", "Antigua")])
+    # El orden de las fusiones no cambia el resultado
+    total = AcumuladorEstadisticas().fusionar(bajas).fusionar(pickle.loads(pickle.dumps(altas))).fusionar(base)
+
+    resultado = total.resultado(ahora=datetime(2025, 1, 1))
+    assert resultado['total'] == 2
+    assert resultado['dominios_email'] == {"correo.com": 1, "otro.com": 1}
+    assert resultado['ciudades'] == {"Guatemala": 1, "Antigua": 1}
+    assert resultado['promedio_dias_registro'] == 0
+
+
+def test_quitar_con_la_fecha_con_que_se_agrego():
+    acumulador = AcumuladorEstadisticas([_cliente("a@correo.com", dias=10), _cliente("b@correo.com", dias=20)])
+    releido = _cliente("b@correo.com")
+    acumulador.quitar(releido, datetime(2025, 1, 1) - timedelta(days=20))
+    assert acumulador.resultado(ahora=datetime(2025, 1, 1))['promedio_dias_registro'] == 10
+
+
+def test_actualizar_en_el_dao_no_altera_el_promedio(cliente_dao):
+    from Data.clienteDAO import ClienteDAO
+
+    # Estadísticas calculadas cuando todos los clientes tenían la misma antigüedad
+    registro = datetime(2024, 1, 1)
+    clientes = cliente_dao.listar()
+    for cliente in clientes:
+        cliente.fecha_registro = registro
+    ClienteDAO._estadisticas = AcumuladorEstadisticas(clientes)
+    ClienteDAO._estadisticas_en = time.monotonic()
+    ClienteDAO._fechas_estadisticas = {c.id_cliente: registro for c in clientes}
+
+    cliente = cliente_dao.buscar_por_email("juan.perez@example.com")
+    cliente.direccion = "Zona 4, Mixco"
+    assert cliente_dao.actualizar(cliente)[0]
+    assert cliente_dao.eliminar(cliente_dao.buscar_por_email("maria.lopez@example.com").id_cliente)[0]
+
+    ahora = datetime.now()
+    mantenidas = ClienteDAO._estadisticas.resultado(ahora)
+    recalculadas = cliente_dao.estadisticas(recalcular=True)
+    assert mantenidas['total'] == recalculadas['total'] == len(clientes) - 1
+    assert mantenidas['ciudades'] == recalculadas['ciudades']
+    assert mantenidas['dominios_email'] == recalculadas['dominios_email']
+    # Los clientes releídos traen la fecha de la lectura; se quitan con la
+    # fecha con que se contaron
+    assert mantenidas['promedio_dias_registro'] == (ahora - registro).days
+
+
+def test_promedio_en_dias_completos_sobre_todos_los_clientes():
+    ahora = datetime(2025, 1, 1)
+    reciente = _cliente("a@correo.com")
+    reciente.fecha_registro = ahora - timedelta(days=3, hours=12)
+    sin_fecha = _cliente("b@correo.com")
+    sin_fecha.fecha_registro = None
+    # Como Cliente.edad_registro(): días completos, y 0 para los que no tienen fecha
+    acumulador = AcumuladorEstadisticas([reciente, sin_fecha])
+    assert acumulador.resultado(ahora=ahora)['promedio_dias_registro'] == 1.5
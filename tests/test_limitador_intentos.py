@@ -0,0 +1,89 @@
+"""Pruebas de LimitadorIntentos con un reloj controlado"""
+
+import pytest
+
+from administrador import limitador_intentos
+from administrador.limitador_intentos import LimitadorIntentos
+
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 1_000_000.0
+
+    def time(self):
+        return self.ahora
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(limitador_intentos, "time", reloj)
+    return reloj
+
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def limitador(request, tmp_path):
+    ruta = str(tmp_path / "intentos.db") if request.param == "sqlite" else None
+    limitador = LimitadorIntentos(max_fallos=3, max_fallos_origen=5, ventana=60.0, bloqueo=120.0,
+                                  ruta_sqlite=ruta)
+    yield limitador
+    limitador.cerrar()
+
+
+def test_bloquea_al_superar_el_maximo_y_desbloquea(limitador, reloj):
+    assert not limitador.registrar_fallo("ana")
+    assert not limitador.registrar_fallo("ana")
+    assert limitador.registrar_fallo("ana")
+    permitido, espera = limitador.permitir("ana")
+    assert not permitido and espera == pytest.approx(120.0)
+    assert limitador.permitir("luis") == (True, 0.0)
+
+    reloj.ahora += 121
+    assert limitador.permitir("ana")[0]
+
+
+def test_ventana_deslizante_pondera_la_anterior(limitador, reloj):
+    limitador.registrar_fallo("ana")
+    limitador.registrar_fallo("ana")
+    # A mitad de la ventana siguiente los 2 fallos anteriores cuentan como 1
+    reloj.ahora += 90
+    assert not limitador.registrar_fallo("ana")
+    # Tras dos ventanas completas los fallos anteriores ya no cuentan
+    reloj.ahora += 120
+    assert not limitador.registrar_fallo("ana")
+    assert not limitador.registrar_fallo("ana")
+    assert limitador.registrar_fallo("ana")
+
+
+def test_origen_compartido_y_exito(limitador, reloj):
+    for usuario in ("a1", "a2", "a3", "a4"):
+        assert not limitador.registrar_fallo(usuario, origen="10.0.0.7")
+    assert limitador.registrar_fallo("a5", origen="10.0.0.7")
+    assert not limitador.permitir("otro", origen="10.0.0.7")[0]
+    assert limitador.permitir("otro", origen="10.0.0.8")[0]
+
+    limitador.registrar_fallo("ana")
+    limitador.registrar_fallo("ana")
+    limitador.registrar_exito("ana")
+    assert not limitador.registrar_fallo("ana")
+    assert limitador.ultimo_acceso("ANA") == reloj.ahora
+
+
+def test_purga_amortizada(monkeypatch, reloj):
+    monkeypatch.setattr(LimitadorIntentos, "MAX_CLAVES_MEMORIA", 4)
+    limitador = LimitadorIntentos(ventana=60.0)
+    llamadas = []
+    original = limitador._caducado
+    monkeypatch.setattr(limitador, "_caducado", lambda e, a: llamadas.append(1) or original(e, a))
+
+    # Claves vigentes: ninguna se puede purgar, y las purgas se espacian
+    for numero in range(64):
+        limitador.registrar_fallo(f"u{numero}")
+    assert len(limitador._estados) == 64
+    assert len(llamadas) < 3 * 64
+
+    # Al caducar, la siguiente purga descarta las claves viejas
+    reloj.ahora += 1000
+    for numero in range(100):
+        limitador.registrar_fallo(f"nuevo{numero}")
+    assert all(clave.startswith("usuario:nuevo") for clave in limitador._estados)
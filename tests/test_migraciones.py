@@ -0,0 +1,53 @@
+"""Pruebas de las migraciones y de la verificación de índices con EXPLAIN"""
+
+from Data import migraciones
+from Data.conexion import Conexion
+
+
+def _por_consulta(resultados):
+    return {r['consulta']: r for r in resultados}
+
+
+def test_sin_migraciones_se_detecta_el_recorrido(bd_sqlite):
+    resultados = _por_consulta(migraciones.verificar_indices(Conexion()))
+
+    por_categoria = resultados["ProductoDAO.listar_por_categoria"]
+    assert not por_categoria['correcta']
+    assert por_categoria['recorre_tabla'] or por_categoria['ordena_en_memoria']
+
+
+def test_tras_migrar_las_consultas_usan_indices(bd_sqlite):
+    migraciones.aplicar_migraciones(Conexion())
+    resultados = migraciones.verificar_indices(Conexion())
+
+    fallidas = [(r['consulta'], r['plan']) for r in resultados if not r['correcta']]
+    assert fallidas == []
+    # Las consultas de búsqueda por texto solo se verifican en MySQL
+    verificadas = {r['consulta'] for r in resultados}
+    assert {c.descripcion for c in migraciones.CONSULTAS_DAO if "sqlite" in c.dialectos} == verificadas
+
+
+def test_consultas_usan_el_sql_de_los_dao():
+    from Data import clienteDAO, productoDAO
+
+    sql = {c.descripcion: c.sql for c in migraciones.CONSULTAS_DAO}
+    assert sql["ClienteDAO.iterar"] == clienteDAO.SQL_ITERAR
+    assert sql["ProductoDAO.buscar_por_nombre"] == productoDAO.SQL_BUSCAR_POR_NOMBRE
+    assert "ClienteDAO.buscar_avanzada(modo='like')" in sql
+
+
+def test_scan_de_indice_completo_es_recorrido():
+    class CursorPlan:
+        def __init__(self, filas):
+            self._filas = filas
+            self.description = [("id",), ("select_type",), ("table",), ("type",), ("key",), ("Extra",)]
+
+        def fetchall(self):
+            return self._filas
+
+    plan = migraciones._analizar_plan_sqlite(CursorPlan([(2, 0, 0, "SCAN s USING INDEX idx_sticker_nombre")]))
+    assert plan['recorre_tabla']
+    plan = migraciones._analizar_plan_mysql(CursorPlan([(1, "SIMPLE", "s", "index", "PRIMARY", "")]))
+    assert plan['recorre_tabla']
+    plan = migraciones._analizar_plan_mysql(CursorPlan([(1, "SIMPLE", "s", "ref", "idx_sticker_categoria_nombre", "")]))
+    assert not plan['recorre_tabla']
@@ -0,0 +1,50 @@
+"""Los módulos de administración importados desde un paquete administrador/ real, como en main.py"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+from conftest import RAIZ
+
+
+def _ejecutar_en_paquete(tmp_path, modulos, codigo):
+    """Copia los módulos a tmp_path/administrador/ y ejecuta código en otro intérprete"""
+    paquete = tmp_path / "administrador"
+    paquete.mkdir()
+    (paquete / "__init__.py").write_text("")
+    for modulo in modulos:
+        shutil.copy(os.path.join(RAIZ, modulo + ".py"), paquete)
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), os.path.join(RAIZ, "CreativeDesings")]))
+    resultado = subprocess.run([sys.executable, "-c", codigo], cwd=tmp_path, env=entorno,
+                               capture_output=True, text=True)
+    assert resultado.returncode == 0, resultado.stderr
+
+
+def test_seguridad_y_administrador_comparten_contrasenas(tmp_path):
+    _ejecutar_en_paquete(tmp_path, ["contrasenas", "seguridad"], """
+from administrador import contrasenas, seguridad
+from Administrador import Administrador
+contrasenas.ITERACIONES = contrasenas.MIN_ITERACIONES
+iteraciones = seguridad.calibrar(latencia=0.001)
+admin = Administrador(1, "Ana Pérez", "ana_perez", "clave123", "vendedor")
+assert admin.password_hash.split("$")[1] == str(iteraciones)
+assert admin.verificar_password("clave123")
+""")
+
+
+def test_servicio_login_verifica_con_el_seguridad_de_main(tmp_path):
+    modulos = ["contrasenas", "seguridad", "servicio_login", "limitador_intentos"]
+    _ejecutar_en_paquete(tmp_path, modulos, """
+from administrador import seguridad
+from administrador.servicio_login import ServicioLogin
+from administrador.limitador_intentos import LimitadorIntentos
+import administrador.servicio_login
+assert administrador.servicio_login.seguridad is seguridad
+# Como en main.py: crear_o_cambiar escribe con el mismo módulo que verifica el servicio
+seguridad.RUTA_HASH = "admin_hash.txt"
+seguridad.guardar_hash(seguridad.hash_password("secreta1", iteraciones=1000))
+with ServicioLogin(limitador=LimitadorIntentos()) as servicio:
+    assert servicio.verificar_admin("secreta1")
+    assert not servicio.verificar_admin("mala")
+""")
@@ -0,0 +1,79 @@
+"""Pruebas de los índices de RegistroClientes al editar clientes"""
+
+import pytest
+
+from CreativeDesings.Cliente import Cliente
+from CreativeDesings.RegistroClientes import RegistroClientes
+
+
+def _registro():
+    return RegistroClientes([
+        Cliente(1, "Juan", "Pérez", "1234-5678", "juan@example.com"),
+        Cliente(2, "María", "López", "87654321", "maria@correo.com"),
+    ])
+
+
+def test_editar_actualiza_los_indices():
+    registro = _registro()
+    juan = registro.obtener(1)
+
+    juan.email = "juan.perez@correo.com"
+    juan.apellido = "Gómez"
+    juan.id_cliente = 10
+
+    assert registro.por_email("juan@example.com") is None
+    assert registro.por_email("juan.perez@correo.com") is juan
+    assert registro.obtener(1) is None and registro.obtener(10) is juan
+    assert set(registro.por_dominio("correo.com")) == {juan, registro.obtener(2)}
+    assert registro.buscar_por_nombre("go") == [juan]
+    assert registro.buscar_por_nombre("pe") == []
+    assert [c.id_cliente for c in registro.ordenados('apellido')] == [10, 2]
+
+
+@pytest.mark.parametrize("campo, valor", [("email", "maria@correo.com"), ("id_cliente", 2)])
+def test_colision_al_editar_no_modifica_nada(campo, valor):
+    registro = _registro()
+    juan, maria = registro.obtener(1), registro.obtener(2)
+
+    with pytest.raises(ValueError):
+        setattr(juan, campo, valor)
+
+    assert juan.email == "juan@example.com" and juan.id_cliente == 1
+    assert registro.obtener(1) is juan and registro.obtener(2) is maria
+    assert registro.por_email("juan@example.com") is juan
+    assert registro.por_email("maria@correo.com") is maria
+    assert registro.buscar_por_nombre("juan") == [juan]
+    assert len(registro.ordenados()) == 2
+
+
+def test_agregar_duplicado_falla():
+    registro = _registro()
+    with pytest.raises(ValueError):
+        registro.agregar(Cliente(3, "Ana", "Ruiz", "55551234", "JUAN@example.com"))
+    assert len(registro) == 2
+
+
+def test_email_editado_con_mayusculas():
+    registro = _registro()
+    juan = registro.obtener(1)
+
+    juan.email = "Juan.Nuevo@Example.com"
+    assert registro.por_email("juan.nuevo@example.com") is juan
+    assert registro.por_email("juan@example.com") is None
+    with pytest.raises(ValueError):
+        registro.obtener(2).email = "JUAN.NUEVO@example.com"
+    juan.email = "juan@example.com"
+    assert registro.por_email("Juan.Nuevo@Example.com") is None
+
+
+def test_funciones_de_busqueda_igual_con_lista_o_registro():
+    from CreativeDesings.Cliente import buscar_cliente_por_nombre, filtrar_por_dominio_email
+
+    registro = _registro()
+    lista = list(registro)
+    for texto in ("example", "na lo", "juan", "PÉREZ"):
+        assert buscar_cliente_por_nombre(registro, texto) == buscar_cliente_por_nombre(lista, texto)
+    for dominio in ("example", "correo.com", "juan@"):
+        assert filtrar_por_dominio_email(registro, dominio) == filtrar_por_dominio_email(lista, dominio)
+    assert [c.id_cliente for c in filtrar_por_dominio_email(registro, "example")] == [1]
+    assert [c.id_cliente for c in buscar_cliente_por_nombre(registro, "ía ló")] == [2]
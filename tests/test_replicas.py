@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from conftest import ejecutar_externo
+from Data import conexion, replicas
+from Data.backends import BackendSQLite
+from Data.productoDAO import ProductoDAO
+from CreativeDesings.Cliente import Cliente
+
+
+@pytest.fixture
+def replica(bd_sqlite, tmp_path):
+    """Réplica en otro archivo SQLite que no recibe los cambios de la primaria"""
+    backend = BackendSQLite(str(tmp_path / "replica.db"))
+    backend.conectar()
+    ejecutar_externo(backend, "UPDATE Sticker SET nombre = 'desde la réplica' WHERE id = 1")
+    replicas.configurar_replicas([replicas.Replica(backend=backend)])
+    token = conexion._ultima_escritura.set(None)
+    yield backend
+    conexion._ultima_escritura.reset(token)
+    backend.cerrar()
+
+
+def test_lee_lo_escrito_por_otra_conexion(replica, cliente_dao):
+    productos = ProductoDAO()
+    assert productos.buscar_por_id(1).nombre == "desde la réplica"
+
+    # La escritura la hace otro DAO, con otra Conexion
+    exito, _ = cliente_dao.insertar(Cliente(nombre="Ana", apellido="Paz", telefono="55550000",
+                                            email="ana@correo.com", direccion="Zona 4, Guatemala"))
+    assert exito
+    assert productos.buscar_por_id(1).nombre != "desde la réplica"
+
+    # Otro hilo es otra sesión: sus lecturas siguen yendo a la réplica
+    nombres = []
+    hilo = threading.Thread(target=lambda: nombres.append(ProductoDAO().buscar_por_id(1).nombre))
+    hilo.start()
+    hilo.join()
+    assert nombres == ["desde la réplica"]
+
+
+def test_pasada_la_ventana_vuelve_a_la_replica(replica):
+    productos = ProductoDAO()
+    productos.conexion.marcar_escritura()
+    assert productos.buscar_por_id(1).nombre != "desde la réplica"
+
+    productos.conexion.ventana_lectura_propia = 0.0
+    assert productos.buscar_por_id(1).nombre == "desde la réplica"
@@ -0,0 +1,47 @@
+"""Pruebas de ServicioLogin"""
+
+import pytest
+
+from administrador import contrasenas, seguridad
+from administrador.servicio_login import ServicioLogin
+from administrador.limitador_intentos import LimitadorIntentos
+from RegistroUsuario import RegistroUsuario
+
+
+@pytest.fixture(autouse=True)
+def hash_rapido(monkeypatch, tmp_path):
+    monkeypatch.setattr(contrasenas, "ITERACIONES", 1000)
+    monkeypatch.setattr(seguridad, "RUTA_HASH", str(tmp_path / "admin_hash.txt"))
+    monkeypatch.setattr(seguridad, "_cache_hash", None)
+
+
+def test_autenticar_y_limite_de_intentos():
+    with ServicioLogin(RegistroUsuario(), intentos_por_ventana=3) as servicio:
+        exito, _, admin = servicio.autenticar("admin", "admin123")
+        assert exito and admin.usuario == "admin"
+        assert not servicio.autenticar("admin", "incorrecta")[0]
+        assert not servicio.autenticar("admin", "incorrecta")[0]
+        # Cuarto intento en la ventana: se rechaza sin verificar la contraseña
+        exito, mensaje, _ = servicio.autenticar("admin", "admin123")
+        assert not exito and "Demasiados intentos" in mensaje
+
+
+def test_verificar_admin_con_limitador():
+    seguridad.guardar_hash(seguridad.hash_password("secreta1"))
+    limitador = LimitadorIntentos(max_fallos=2)
+    with ServicioLogin(limitador=limitador) as servicio:
+        assert servicio.verificar_admin("secreta1")
+        assert not servicio.verificar_admin("mala")
+        assert not servicio.verificar_admin("mala")
+        # Bloqueado por el limitador aunque la contraseña sea correcta
+        assert not servicio.verificar_admin("secreta1")
+
+
+def test_locks_de_usuarios_inactivos_se_descartan(monkeypatch):
+    monkeypatch.setattr(ServicioLogin, "MAX_USUARIOS_MEMORIA", 3)
+    with ServicioLogin(RegistroUsuario(), ventana=0.0) as servicio:
+        for numero in range(10):
+            servicio.autenticar(f"usuario{numero}", "clave123")
+            servicio._lock_de(f"usuario{numero}")
+        assert len(servicio._locks_usuario) <= 4
+        assert len(servicio._intentos) <= 4